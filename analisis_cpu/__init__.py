@@ -0,0 +1,6 @@
+"""
+Sistema de análisis del uso de CPU de los servidores de un centro de datos
+
+El paquete no importa nada al cargarse, para que la línea de comandos
+(analisis_cpu.cli) decida qué módulos necesita cada opción.
+"""
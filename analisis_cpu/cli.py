@@ -0,0 +1,142 @@
+"""
+Línea de comandos del sistema de análisis de CPU
+
+Sin argumentos abre el menú interactivo. Con --run ejecuta los análisis
+indicados sin menú y termina, por ejemplo:
+
+    analisis-cpu --file uso_cpu_junio.txt --run promedios,dia-max,servidor-min --format json
+
+Con --servir expone las consultas como JSON por HTTP en localhost:
+
+    analisis-cpu --file uso_cpu_junio.txt --servir --puerto 8080
+
+Con --publicar carga los datos una sola vez en memoria compartida y otros
+procesos los adjuntan sin copia con --file shm://<segmento>:
+
+    analisis-cpu --file uso_cpu_junio.txt --publicar cpu_junio
+    analisis-cpu --file shm://cpu_junio --run promedios
+
+Solo se importa lo que necesita el comando elegido: --help no carga NumPy ni
+el controlador, y el servidor HTTP se importa solo con --servir.
+"""
+
+import argparse
+import sys
+
+from analisis_cpu.controllers.analisis_lote import ANALISIS_LOTE, FORMATOS_LOTE
+
+
+def crear_parser():
+    """Crea el parser de argumentos de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Sistema de Análisis de CPU - Centro de Datos")
+    parser.add_argument("-f", "--file", default="uso_cpu_junio.txt",
+                        help="Archivo de datos (texto o histórico), directorio, patrón glob o "
+                             "shm://<segmento> (por defecto: %(default)s)")
+    # Modos que reemplazan al menú: a lo sumo uno por ejecución
+    modos = parser.add_mutually_exclusive_group()
+    modos.add_argument("-r", "--run",
+                        help="Análisis separados por comas a ejecutar sin menú: "
+                             + ", ".join(ANALISIS_LOTE))
+    parser.add_argument("--format", choices=FORMATOS_LOTE, default="json",
+                        help="Formato de salida del modo lote (por defecto: %(default)s)")
+    parser.add_argument("-o", "--output", help="Archivo de salida del modo lote (por defecto stdout)")
+    parser.add_argument("--limite-filas", type=int,
+                        help="En formato texto, máximo de servidores listados por análisis")
+    parser.add_argument("--regla-alerta", choices=("umbral", "zscore"), default="umbral",
+                        help="Regla del análisis 'alertas' (por defecto: %(default)s)")
+    parser.add_argument("--limite-alerta", type=float,
+                        help="Umbral de uso en %% o límite de |z| del análisis 'alertas' "
+                             "(por defecto 90 o 3)")
+    parser.add_argument("--capacidad-host", type=float, default=100.0,
+                        help="Capacidad de cada host en %% de un servidor para el análisis "
+                             "'consolidacion' (por defecto: %(default)s)")
+    modos.add_argument("--servir", action="store_true",
+                        help="Sirve las consultas como JSON por HTTP en lugar de abrir el menú")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="Dirección de loopback del servidor HTTP (por defecto: %(default)s)")
+    parser.add_argument("--puerto", type=int, default=8080,
+                        help="Puerto del servidor HTTP (por defecto: %(default)s)")
+    parser.add_argument("--max-errores", type=int,
+                        help="Errores de formato tolerados al cargar el texto antes de "
+                             "descartarlo (por defecto sin límite)")
+    modos.add_argument("--publicar", metavar="SEGMENTO",
+                        help="Publica los datos en memoria compartida con este nombre hasta Ctrl+C")
+    modos.add_argument("--archivar", metavar="DESTINO",
+                        help="Guarda los datos en un archivo histórico comprimido y termina")
+    parser.add_argument("--compresion", choices=("zlib", "lzma"), default="zlib",
+                        help="Compresión del archivo histórico (por defecto: %(default)s)")
+    parser.add_argument("--instrumentar", action="store_true",
+                        help="Mide tiempo, CPU y memoria por acción y por llamada al modelo")
+    parser.add_argument("--perfil-dir",
+                        help="Perfila cada acción con cProfile y guarda los .prof en este directorio")
+    parser.add_argument("--rendimiento-json",
+                        help="Guarda las estadísticas de rendimiento en este archivo al terminar")
+    return parser
+
+
+def main(argv=None):
+    """
+    Función principal - Punto de entrada del sistema
+    """
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+
+    if args.servir:
+        # La instrumentación mide acciones del menú o del lote, no consultas HTTP
+        incompatibles = [opcion for opcion, valor in (("--instrumentar", args.instrumentar),
+                                                      ("--perfil-dir", args.perfil_dir),
+                                                      ("--rendimiento-json", args.rendimiento_json)) if valor]
+        if incompatibles:
+            parser.error(f"{', '.join(incompatibles)} no se puede usar con --servir")
+        from analisis_cpu.interface.servidor_http import ejecutar_servidor
+        try:
+            sys.exit(ejecutar_servidor(args.file, args.host, args.puerto, max_errores=args.max_errores))
+        except (OSError, ValueError) as e:
+            print(f"Error crítico del sistema: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    if args.publicar:
+        from analisis_cpu.controllers.controlador_principal import ejecutar_publicacion
+        try:
+            sys.exit(ejecutar_publicacion(args.file, args.publicar, args.max_errores))
+        except (OSError, ValueError) as e:
+            print(f"Error crítico del sistema: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    if args.archivar:
+        from analisis_cpu.controllers.controlador_principal import ejecutar_archivado
+        try:
+            sys.exit(ejecutar_archivado(args.file, args.archivar, args.compresion, args.max_errores))
+        except (OSError, ValueError) as e:
+            print(f"Error crítico del sistema: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    if args.run:
+        analisis = [nombre.strip() for nombre in args.run.split(",") if nombre.strip()]
+        desconocidos = [nombre for nombre in analisis if nombre not in ANALISIS_LOTE]
+        if desconocidos:
+            parser.error(f"análisis desconocidos: {', '.join(desconocidos)}")
+        if not args.capacidad_host > 0:
+            parser.error("--capacidad-host debe ser mayor que 0")
+        parametros_alertas = {'regla': args.regla_alerta, 'limite': args.limite_alerta}
+        parametros_consolidacion = {'capacidad': args.capacidad_host}
+        from analisis_cpu.controllers.controlador_principal import ejecutar_lote
+        try:
+            sys.exit(ejecutar_lote(args.file, analisis, args.format, args.output, args.instrumentar,
+                                   args.perfil_dir, args.rendimiento_json, args.limite_filas,
+                                   parametros_alertas, args.max_errores, parametros_consolidacion))
+        except OSError as e:
+            print(f"Error crítico del sistema: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    from analisis_cpu.controllers.controlador_principal import ejecutar_sistema
+    try:
+        ejecutar_sistema(args.file, args.instrumentar, args.perfil_dir, args.rendimiento_json,
+                         args.max_errores)
+    except Exception as e:
+        print(f"Error crítico del sistema: {e}")
+        print("El sistema se cerrará.")
+
+
+if __name__ == "__main__":
+    main()
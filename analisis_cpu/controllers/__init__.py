@@ -0,0 +1 @@
+"""Controladores: flujo del menú y análisis del modo lote"""
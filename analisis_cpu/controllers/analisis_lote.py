@@ -0,0 +1,20 @@
+"""
+Análisis disponibles en modo lote
+Se mantienen aparte del controlador para que la línea de comandos pueda
+validar argumentos y mostrar la ayuda sin importar NumPy ni el modelo
+"""
+
+# Análisis disponibles en modo lote y la opción del menú que les corresponde
+ANALISIS_LOTE = {
+    "resumen": "2",
+    "promedios": "3",
+    "dia-max": "4",
+    "servidor-min": "5",
+    "top-servidores": "10",
+    "percentiles-dia": "11",
+    "alertas": "13",
+    "correlaciones": "14",
+    "consolidacion": "15"
+}
+
+FORMATOS_LOTE = ("json", "texto")
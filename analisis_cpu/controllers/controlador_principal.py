@@ -0,0 +1,472 @@
+"""
+Controlador principal del sistema de análisis de CPU
+Maneja el flujo del programa y coordina entre la interfaz y el modelo de datos
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+from analisis_cpu.controllers.analisis_lote import ANALISIS_LOTE, FORMATOS_LOTE
+from analisis_cpu.interface.interfaz_usuario import InterfazUsuario
+from analisis_cpu.models.centro_datos import CentroDeDatos
+from analisis_cpu.models.resultados import reemplazar_nan
+from analisis_cpu.utils.instrumentacion import activar_desde_entorno, instrumentacion
+
+
+class ControladorPrincipal:
+    """
+    Controlador que maneja el flujo principal del sistema
+    """
+    
+    def __init__(self, archivo_datos="uso_cpu_junio.txt", max_errores=None):
+        """
+        Inicializa el controlador con el modelo y la vista
+        
+        Args:
+            archivo_datos: Ruta al archivo de datos de CPU
+            max_errores: Errores de formato tolerados al cargar (None sin límite)
+        """
+        self.centro_datos = CentroDeDatos()
+        self.centro_datos.max_errores_carga = max_errores
+        self.interfaz = InterfazUsuario(self.centro_datos)
+        self.archivo_datos = archivo_datos
+        self.ejecutando = True
+        self.parametros_alertas = {}
+        self.parametros_consolidacion = {}
+        activar_desde_entorno(self._clases_instrumentables())
+
+    def _clases_instrumentables(self):
+        """Clases del modelo cuyos métodos mide la instrumentación"""
+        return (type(self.centro_datos), type(self.centro_datos.calculadora))
+
+    def activar_instrumentacion(self, directorio_perfil=None):
+        """
+        Activa la medición de rendimiento por acción y por llamada
+
+        Args:
+            directorio_perfil: Directorio donde guardar un .prof por acción
+        """
+        if not instrumentacion.activa:
+            instrumentacion.activar(directorio_perfil, self._clases_instrumentables())
+    
+    def iniciar_sistema(self):
+        """
+        Inicia el bucle principal del sistema
+        """
+        while self.ejecutando:
+            try:
+                self._ejecutar_ciclo_menu()
+            except KeyboardInterrupt:
+                self.interfaz.mostrar_cancelacion_usuario()
+                break
+            except Exception as e:
+                self.interfaz.mostrar_error_inesperado(e)
+            
+            if self.ejecutando:
+                self.interfaz.pausar_para_continuar()
+    
+    def _ejecutar_ciclo_menu(self):
+        """Ejecuta un ciclo completo del menú principal"""
+        self.interfaz.mostrar_menu_principal()
+        opcion = self.interfaz.solicitar_opcion()
+        self._procesar_opcion(opcion)
+    
+    def _procesar_opcion(self, opcion):
+        """
+        Procesa la opción seleccionada por el usuario
+        
+        Args:
+            opcion: Opción seleccionada como string
+        """
+        accion = self._tabla_opciones().get(opcion, self._opcion_invalida)
+        self._ejecutar_accion(opcion, accion)
+
+    def _ejecutar_accion(self, nombre, accion):
+        """Ejecuta una acción, midiéndola solo si la instrumentación está activa"""
+        if not instrumentacion.activa:
+            return accion()
+        with instrumentacion.medir_accion(f"{nombre}:{accion.__name__.lstrip('_')}"):
+            return accion()
+
+    def _tabla_opciones(self):
+        """Retorna la tabla opción del menú -> acción"""
+        return {
+            "0": self._salir_sistema,
+            "1": self._cargar_datos,
+            "2": self._mostrar_resumen,
+            "3": self._calcular_promedios,
+            "4": self._encontrar_dia_mayor_carga,
+            "5": self._encontrar_servidor_menor_uso,
+            "6": self._ejecutar_analisis_completo,
+            "7": self._consultar_servidor,
+            "8": self._consultar_dia,
+            "9": self._mostrar_rendimiento,
+            "10": self._mostrar_top_servidores,
+            "11": self._mostrar_percentiles_flota,
+            "12": self._consultar_ventana_movil,
+            "13": self._mostrar_alertas,
+            "14": self._mostrar_correlaciones,
+            "15": self._mostrar_consolidacion,
+            "16": self._consultar_rango
+        }
+
+    def _tabla_datos(self):
+        """
+        Retorna la tabla opción del menú -> método del modelo que produce
+        el mismo análisis como datos, sin imprimir
+        """
+        return {
+            "2": self.centro_datos.obtener_resumen,
+            "3": self.centro_datos.obtener_promedios,
+            "4": self.centro_datos.obtener_dia_mayor_carga,
+            "5": self.centro_datos.obtener_servidor_menor_uso,
+            "10": self.centro_datos.obtener_top_servidores,
+            "11": self.centro_datos.obtener_percentiles_flota,
+            "13": self._obtener_alertas,
+            "14": self.centro_datos.obtener_correlaciones,
+            "15": self._obtener_consolidacion
+        }
+
+    def _tabla_texto(self, limite_filas=None):
+        """
+        Retorna la tabla opción del menú -> (análisis del modelo, función de
+        la interfaz que construye su texto)
+        """
+        centro, interfaz = self.centro_datos, self.interfaz
+        return {
+            "2": (centro.analizar_resumen, interfaz.lineas_resumen),
+            "3": (centro.analizar_promedios,
+                  lambda resultado: interfaz.lineas_promedios(resultado, limite_filas)),
+            "4": (centro.analizar_dia_mayor_carga,
+                  lambda resultado: interfaz.lineas_dia_mayor_carga(resultado, limite_filas)),
+            "5": (centro.analizar_servidor_menor_uso, interfaz.lineas_servidor_menor_uso),
+            "10": (centro.analizar_top_servidores, interfaz.lineas_top_servidores),
+            "11": (centro.analizar_percentiles_flota,
+                   lambda resultado: interfaz.lineas_percentiles_flota(resultado, limite_filas)),
+            "13": (self._analizar_alertas,
+                   lambda resultado: interfaz.lineas_alertas(resultado, limite_filas)),
+            "14": (centro.analizar_correlaciones,
+                   lambda resultado: interfaz.lineas_correlaciones(resultado, limite_filas)),
+            "15": (self._analizar_consolidacion,
+                   lambda resultado: interfaz.lineas_consolidacion(resultado, limite_filas))
+        }
+
+    def _analizar_alertas(self):
+        """Analiza las alertas con la regla configurada para el modo lote"""
+        return self.centro_datos.analizar_alertas(**self.parametros_alertas)
+
+    def _obtener_alertas(self):
+        """Retorna las alertas con la regla configurada como diccionario"""
+        return self.centro_datos.obtener_alertas(**self.parametros_alertas)
+
+    def _analizar_consolidacion(self):
+        """Planifica la consolidación con la capacidad configurada para el modo lote"""
+        return self.centro_datos.analizar_consolidacion(**self.parametros_consolidacion)
+
+    def _obtener_consolidacion(self):
+        """Retorna la consolidación con la capacidad configurada como diccionario"""
+        return self.centro_datos.obtener_consolidacion(**self.parametros_consolidacion)
+
+    def ejecutar_lote(self, analisis, formato="json", salida=None, limite_filas=None,
+                      parametros_alertas=None, parametros_consolidacion=None):
+        """
+        Carga los datos una vez y ejecuta los análisis indicados sin menú ni
+        pausas, escribiendo el resultado en stdout o en un archivo
+
+        Args:
+            analisis: Lista de nombres de ANALISIS_LOTE en el orden deseado
+            formato: "json" (datos) o "texto" (mismo texto que el menú)
+            salida: Ruta del archivo de salida; None para stdout
+            limite_filas: En formato texto, máximo de servidores listados
+                          por análisis (None para todos)
+            parametros_alertas: Argumentos 'regla' y 'limite' del análisis
+                                "alertas"
+            parametros_consolidacion: Argumento 'capacidad' del análisis
+                                      "consolidacion"
+
+        Returns:
+            int: Código de salida del proceso (0 si todo fue bien)
+        """
+        desconocidos = [nombre for nombre in analisis if nombre not in ANALISIS_LOTE]
+        if desconocidos:
+            raise ValueError(f"Análisis desconocidos: {', '.join(desconocidos)}")
+        if formato not in FORMATOS_LOTE:
+            raise ValueError(f"Formato desconocido '{formato}'")
+        self.parametros_alertas = dict(parametros_alertas or {})
+        self.parametros_consolidacion = dict(parametros_consolidacion or {})
+
+        # Los mensajes de carga solo se muestran si la carga falla
+        mensajes_carga = io.StringIO()
+        with contextlib.redirect_stdout(mensajes_carga):
+            self.centro_datos.cargar_datos(self.archivo_datos)
+        if not self.centro_datos.datos_cargados:
+            sys.stderr.write(mensajes_carga.getvalue())
+            return 1
+        if self.centro_datos.total_errores_carga:
+            sys.stderr.write(f"Advertencia: {self.centro_datos.total_errores_carga} errores de formato "
+                             f"en los datos; las celdas afectadas se tratan como ausentes\n")
+
+        if formato == "json":
+            tabla = self._tabla_datos()
+            documento = {
+                'archivo': self.archivo_datos,
+                'analisis': {nombre: self._ejecutar_accion(nombre, tabla[ANALISIS_LOTE[nombre]])
+                             for nombre in analisis}
+            }
+            texto = json.dumps(reemplazar_nan(documento), ensure_ascii=False) + "\n"
+        else:
+            tabla = self._tabla_texto(limite_filas)
+            lineas = []
+            for nombre in analisis:
+                analizar, construir_lineas = tabla[ANALISIS_LOTE[nombre]]
+                lineas += construir_lineas(self._ejecutar_accion(nombre, analizar))
+            texto = "\n".join(lineas) + "\n"
+
+        if salida:
+            with open(salida, 'w', encoding='utf-8') as file:
+                file.write(texto)
+        else:
+            sys.stdout.write(texto)
+        return 0
+    
+    def _salir_sistema(self):
+        """Termina la ejecución del sistema"""
+        self.interfaz.mostrar_mensaje_salida()
+        self.ejecutando = False
+    
+    def _cargar_datos(self):
+        """Carga los datos desde el archivo"""
+        self.interfaz.mostrar_mensaje_carga()
+        self.centro_datos.cargar_datos(self.archivo_datos)
+    
+    def _mostrar_resultado(self, resultado, mostrar):
+        """Muestra un resultado del modelo o el error si no hay datos cargados"""
+        if resultado is None:
+            self.interfaz.mostrar_error_datos_no_cargados()
+        else:
+            mostrar(resultado)
+
+    def _mostrar_resumen(self):
+        """Muestra el resumen de estadísticas"""
+        self._mostrar_resultado(self.centro_datos.analizar_resumen(), self.interfaz.mostrar_resumen)
+    
+    def _calcular_promedios(self):
+        """Calcula y muestra los promedios mensuales por servidor"""
+        self._mostrar_resultado(self.centro_datos.analizar_promedios(), self.interfaz.mostrar_promedios)
+    
+    def _encontrar_dia_mayor_carga(self):
+        """Encuentra y muestra el día con mayor carga total"""
+        self._mostrar_resultado(self.centro_datos.analizar_dia_mayor_carga(),
+                                self.interfaz.mostrar_dia_mayor_carga)
+    
+    def _encontrar_servidor_menor_uso(self):
+        """Encuentra y muestra el servidor con menor uso promedio"""
+        self._mostrar_resultado(self.centro_datos.analizar_servidor_menor_uso(),
+                                self.interfaz.mostrar_servidor_menor_uso)
+    
+    def _mostrar_top_servidores(self):
+        """Muestra los K servidores con mayor o menor promedio, pico o p95"""
+        if not self.centro_datos.datos_cargados:
+            self.interfaz.mostrar_error_datos_no_cargados()
+            return
+        parametros = self.interfaz.solicitar_parametros_top(self.centro_datos.METRICAS_RANKING)
+        if parametros is not None:
+            self.interfaz.mostrar_top_servidores(self.centro_datos.analizar_top_servidores(*parametros))
+
+    def _mostrar_percentiles_flota(self):
+        """Muestra los percentiles p50/p90/p99 de la flota por día"""
+        self._mostrar_resultado(self.centro_datos.analizar_percentiles_flota(),
+                                self.interfaz.mostrar_percentiles_flota)
+
+    def _mostrar_alertas(self):
+        """Busca las alertas de la flota, las muestra y permite guardarlas en JSON"""
+        if not self.centro_datos.datos_cargados:
+            self.interfaz.mostrar_error_datos_no_cargados()
+            return
+        parametros = self.interfaz.solicitar_parametros_alertas(self.centro_datos.LIMITES_ALERTA)
+        if parametros is None:
+            return
+        resultado = self.centro_datos.analizar_alertas(*parametros)
+        self.interfaz.mostrar_alertas(resultado)
+        ruta = self.interfaz.solicitar_ruta_json_alertas()
+        if ruta:
+            with open(ruta, 'w', encoding='utf-8') as file:
+                json.dump(reemplazar_nan(resultado.a_dict()), file, indent=2, ensure_ascii=False)
+            self.interfaz.mostrar_json_alertas_guardado(ruta)
+
+    def _mostrar_correlaciones(self):
+        """Muestra los servidores más correlacionados y los grupos de carga conjunta"""
+        if not self.centro_datos.datos_cargados:
+            self.interfaz.mostrar_error_datos_no_cargados()
+            return
+        parametros = self.interfaz.solicitar_parametros_correlacion()
+        if parametros is not None:
+            self.interfaz.mostrar_correlaciones(self.centro_datos.analizar_correlaciones(*parametros))
+
+    def _mostrar_consolidacion(self):
+        """Muestra el plan de consolidación de los servidores en hosts"""
+        if not self.centro_datos.datos_cargados:
+            self.interfaz.mostrar_error_datos_no_cargados()
+            return
+        capacidad = self.interfaz.solicitar_capacidad_host()
+        if capacidad is not None:
+            self.interfaz.mostrar_consolidacion(self.centro_datos.analizar_consolidacion(capacidad))
+
+    def _consultar_rango(self):
+        """Muestra los agregados de una selección de servidores y días"""
+        if not self.centro_datos.datos_cargados:
+            self.interfaz.mostrar_error_datos_no_cargados()
+            return
+        parametros = self.interfaz.solicitar_parametros_rango()
+        if parametros is None:
+            return
+        try:
+            resultado = self.centro_datos.analizar_rango(*parametros)
+        except ValueError as e:
+            self.interfaz.mostrar_error_rango(e)
+            return
+        self.interfaz.mostrar_rango(resultado)
+
+    def _consultar_ventana_movil(self):
+        """Permite consultar las ventanas móviles de un servidor"""
+        self.interfaz.consultar_ventana_movil()
+
+    def _ejecutar_analisis_completo(self):
+        """Ejecuta el análisis completo del sistema"""
+        self.interfaz.ejecutar_analisis_completo()
+    
+    def _consultar_servidor(self):
+        """Permite consultar datos de un servidor específico"""
+        self.interfaz.consultar_servidor_especifico()
+    
+    def _consultar_dia(self):
+        """Permite consultar datos de un día específico"""
+        self.interfaz.consultar_dia_especifico()
+    
+    def _mostrar_rendimiento(self):
+        """Muestra las estadísticas de rendimiento y permite guardarlas en JSON"""
+        if not instrumentacion.activa:
+            self.interfaz.mostrar_instrumentacion_inactiva()
+            return
+        self.interfaz.mostrar_estadisticas_rendimiento(instrumentacion.exportar())
+        ruta = self.interfaz.solicitar_ruta_json_rendimiento()
+        if ruta:
+            instrumentacion.volcar_json(ruta)
+            self.interfaz.mostrar_json_rendimiento_guardado(ruta)
+
+    def _opcion_invalida(self):
+        """Maneja las opciones inválidas"""
+        self.interfaz.mostrar_opcion_invalida()
+
+
+def _crear_controlador(archivo_datos, instrumentar, directorio_perfil, max_errores=None):
+    """Crea el controlador y activa la instrumentación si se pidió"""
+    controlador = ControladorPrincipal(archivo_datos, max_errores)
+    if instrumentar or directorio_perfil:
+        controlador.activar_instrumentacion(directorio_perfil)
+    return controlador
+
+
+def ejecutar_sistema(archivo_datos="uso_cpu_junio.txt", instrumentar=False, directorio_perfil=None,
+                     rendimiento_json=None, max_errores=None):
+    """
+    Función de entrada principal para ejecutar el sistema
+
+    Args:
+        archivo_datos: Archivo, directorio o patrón glob de datos
+        instrumentar: Activa la medición de rendimiento
+        directorio_perfil: Directorio para los .prof de cProfile por acción
+        rendimiento_json: Archivo donde volcar las mediciones al salir
+        max_errores: Errores de formato tolerados al cargar (None sin límite)
+    """
+    controlador = _crear_controlador(archivo_datos, instrumentar, directorio_perfil, max_errores)
+    try:
+        controlador.iniciar_sistema()
+    finally:
+        if rendimiento_json and instrumentacion.activa:
+            instrumentacion.volcar_json(rendimiento_json)
+
+
+def ejecutar_lote(archivo_datos, analisis, formato="json", salida=None, instrumentar=False,
+                  directorio_perfil=None, rendimiento_json=None, limite_filas=None,
+                  parametros_alertas=None, max_errores=None, parametros_consolidacion=None):
+    """
+    Función de entrada para ejecutar análisis sin interacción
+
+    Returns:
+        int: Código de salida del proceso
+    """
+    controlador = _crear_controlador(archivo_datos, instrumentar, directorio_perfil, max_errores)
+    try:
+        return controlador.ejecutar_lote(analisis, formato, salida, limite_filas, parametros_alertas,
+                                         parametros_consolidacion)
+    finally:
+        if rendimiento_json and instrumentacion.activa:
+            instrumentacion.volcar_json(rendimiento_json)
+
+
+def ejecutar_publicacion(archivo_datos, nombre=None, max_errores=None):
+    """
+    Carga los datos una vez y los publica en memoria compartida hasta que se
+    interrumpa el proceso (Ctrl+C); otros procesos los abren con
+    --file shm://<segmento> sin volver a cargarlos
+
+    Args:
+        archivo_datos: Archivo, directorio o patrón glob de datos
+        nombre: Nombre del segmento; None para que el sistema elija uno
+        max_errores: Errores de formato tolerados al cargar (None sin límite)
+
+    Returns:
+        int: Código de salida del proceso
+    """
+    centro_datos = CentroDeDatos()
+    centro_datos.cargar_datos(archivo_datos, max_errores=max_errores)
+    if not centro_datos.datos_cargados:
+        return 1
+
+    segmento = centro_datos.publicar_memoria_compartida(nombre)
+    # La copia privada ya no hace falta: la memoria queda solo en el segmento
+    centro_datos.limpiar()
+    print(f"Datos publicados en memoria compartida: shm://{segmento.nombre}")
+    print("Presione Ctrl+C para retirar la publicación.")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        segmento.liberar()
+        print("Publicación retirada.")
+    return 0
+
+
+def ejecutar_archivado(archivo_datos, destino, compresion="zlib", max_errores=None):
+    """
+    Carga los datos y los guarda en un archivo histórico comprimido, que
+    luego se abre con --file como cualquier archivo de datos
+
+    Args:
+        archivo_datos: Archivo, directorio o patrón glob de datos
+        destino: Ruta del archivo histórico a crear
+        compresion: "zlib" (rápido) o "lzma" (más compacto)
+        max_errores: Errores de formato tolerados al cargar (None sin límite)
+
+    Returns:
+        int: Código de salida del proceso
+    """
+    centro_datos = CentroDeDatos()
+    centro_datos.cargar_datos(archivo_datos, max_errores=max_errores)
+    if not centro_datos.datos_cargados:
+        return 1
+
+    inicio = time.perf_counter()
+    tamano = centro_datos.guardar_archivo_historico(destino, compresion)
+    duracion = time.perf_counter() - inicio
+    print(f"Archivo histórico guardado en {destino} ({tamano / 1e6:.2f} MB, {compresion}, {duracion:.2f} s)")
+    if os.path.isfile(archivo_datos):
+        print(f"- {os.path.getsize(archivo_datos) / tamano:.1f} veces más pequeño que el texto de origen")
+    return 0
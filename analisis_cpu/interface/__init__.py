@@ -0,0 +1 @@
+"""Vista: interacción por consola y servidor HTTP de consultas"""
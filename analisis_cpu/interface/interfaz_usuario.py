@@ -0,0 +1,858 @@
+"""
+Módulo de interfaz de usuario para el sistema de análisis de CPU
+Maneja toda la interacción con el usuario a través de menús y consultas
+"""
+
+import sys
+
+import numpy as np
+
+
+class InterfazUsuario:
+    """Clase que maneja toda la interfaz de usuario del sistema"""
+
+    # Filas mostradas por página en los listados de servidores
+    FILAS_POR_PAGINA = 100
+    
+    def __init__(self, centro_datos):
+        """
+        Inicializa la interfaz con una referencia al centro de datos
+        
+        Args:
+            centro_datos: Instancia de CentroDeDatos
+        """
+        self.centro = centro_datos
+    
+    def mostrar_menu_principal(self):
+        """Muestra el menú principal del sistema"""
+        print("SISTEMA DE ANÁLISIS DE CPU - CENTRO DE DATOS")
+        print("="*60)
+        print("1. Cargar datos desde archivo")
+        print("2. Mostrar resumen de estadísticas")
+        print("3. Calcular promedio mensual por servidor")
+        print("4. Encontrar día con mayor carga total")
+        print("5. Encontrar servidor con menor uso promedio")
+        print("6. Análisis completo")
+        print("7. Consultar datos de servidor específico")
+        print("8. Consultar datos de día específico")
+        print("9. Estadísticas de rendimiento")
+        print("10. Top/bottom K servidores por promedio, pico o p95")
+        print("11. Percentiles de la flota por día (p50/p90/p99)")
+        print("12. Ventanas móviles de un servidor")
+        print("13. Alertas por umbral o z-score en toda la flota")
+        print("14. Correlación entre servidores y grupos de carga conjunta")
+        print("15. Consolidación de servidores en hosts")
+        print("16. Consulta por rango de servidores y días")
+        print("0. Salir")
+        print("-"*60)
+    
+    def mostrar_mensaje_carga(self):
+        """Muestra mensaje de carga de datos"""
+        print("Cargando datos...")
+    
+    def mostrar_mensaje_salida(self):
+        """Muestra mensaje de salida del sistema"""
+        print("Saliendo del sistema...")
+    
+    def mostrar_error_datos_no_cargados(self):
+        """Muestra error cuando no hay datos cargados"""
+        print("Error: Primero debe cargar los datos (opción 1)")
+    
+    def mostrar_opcion_invalida(self):
+        """Muestra mensaje de opción inválida"""
+        print("Opción inválida. Intente nuevamente.")
+    
+    def ejecutar_analisis_completo(self, limite_filas=FILAS_POR_PAGINA):
+        """
+        Ejecuta todos los análisis disponibles y los muestra en una sola
+        escritura
+
+        Args:
+            limite_filas: Máximo de servidores listados por análisis (None
+                          para listarlos todos)
+        """
+        if not self.centro.datos_cargados:
+            self.mostrar_error_datos_no_cargados()
+            return
+        
+        lineas = ["\n" + "="*60, "EJECUTANDO ANÁLISIS COMPLETO...", "="*60]
+        lineas += self.lineas_resumen(self.centro.analizar_resumen())
+        lineas += self.lineas_promedios(self.centro.analizar_promedios(), limite_filas)
+        lineas += self.lineas_dia_mayor_carga(self.centro.analizar_dia_mayor_carga(), limite_filas)
+        lineas += self.lineas_servidor_menor_uso(self.centro.analizar_servidor_menor_uso())
+        lineas += ["\n" + "="*60, "ANÁLISIS COMPLETADO", "="*60]
+        self._escribir(lineas)
+
+    def mostrar_resumen(self, resultado):
+        """Muestra el resumen de estadísticas del centro de datos"""
+        self._escribir(self.lineas_resumen(resultado))
+
+    def mostrar_promedios(self, resultado, limite_filas=FILAS_POR_PAGINA):
+        """Muestra los promedios por servidor, paginados si son muchos"""
+        self._mostrar_paginado(lambda limite, pagina: self.lineas_promedios(resultado, limite, pagina),
+                               len(resultado), limite_filas)
+
+    def mostrar_dia_mayor_carga(self, resultado, limite_filas=FILAS_POR_PAGINA):
+        """Muestra el día con mayor carga y su detalle, paginado si es largo"""
+        self._mostrar_paginado(lambda limite, pagina: self.lineas_dia_mayor_carga(resultado, limite, pagina),
+                               len(resultado.valores_dia), limite_filas)
+
+    def mostrar_servidor_menor_uso(self, resultado):
+        """Muestra el servidor con menor uso promedio y sus primeros días"""
+        self._escribir(self.lineas_servidor_menor_uso(resultado))
+
+    def mostrar_top_servidores(self, resultado):
+        """Muestra el ranking de servidores por una métrica"""
+        self._escribir(self.lineas_top_servidores(resultado))
+
+    def mostrar_percentiles_flota(self, resultado, limite_filas=FILAS_POR_PAGINA):
+        """Muestra los percentiles de la flota por día, paginados si son muchos días"""
+        self._mostrar_paginado(lambda limite, pagina: self.lineas_percentiles_flota(resultado, limite, pagina),
+                               len(resultado), limite_filas)
+
+    def solicitar_parametros_top(self, metricas):
+        """
+        Solicita la métrica, el orden y K para el ranking de servidores
+
+        Args:
+            metricas: Métricas disponibles; la primera es la predeterminada
+
+        Returns:
+            tuple: (k, métrica, mayores) o None si la entrada es inválida
+        """
+        metrica = input(f"Métrica ({'/'.join(metricas)}) [{metricas[0]}]: ").strip().lower() or metricas[0]
+        if metrica not in metricas:
+            print(f"Métrica inválida. Opciones: {', '.join(metricas)}")
+            return None
+
+        orden = input("Orden (mayores/menores) [mayores]: ").strip().lower() or "mayores"
+        if orden not in ("mayores", "menores"):
+            print("Orden inválido. Debe ser 'mayores' o 'menores'")
+            return None
+
+        try:
+            k = int(input("Cantidad de servidores K [10]: ").strip() or 10)
+        except ValueError:
+            print("Entrada inválida. Debe ingresar un número")
+            return None
+        if k < 1:
+            print("K debe ser mayor o igual a 1")
+            return None
+        return k, metrica, orden == "mayores"
+
+    def lineas_resumen(self, resultado):
+        """
+        Construye el texto del resumen de estadísticas
+
+        Args:
+            resultado: ResultadoResumen del centro de datos
+
+        Returns:
+            list: Líneas de texto a mostrar
+        """
+        lineas = [
+            f"\n{'='*60}",
+            "RESUMEN DEL CENTRO DE DATOS - JUNIO 2025",
+            f"{'='*60}",
+            "Estructura de datos:",
+            f"- Almacenamiento: {resultado.almacenamiento}",
+            f"- Array numpy datos_cpu: {(resultado.servidores, resultado.dias)} ({resultado.dtype_datos})",
+            f"- Array numpy nombres_servidores: {(resultado.servidores,)} ({resultado.dtype_nombres})",
+            f"- Total de mediciones: {resultado.mediciones}",
+            f"- Memoria utilizada por datos_cpu: {resultado.bytes_datos} bytes",
+            f"- Memoria utilizada por nombres: {resultado.bytes_nombres} bytes"
+        ]
+        if resultado.bytes_ahorrados is not None:
+            lineas.append(f"- Memoria ahorrada frente a float64: {resultado.bytes_ahorrados} bytes "
+                          f"({resultado.porcentaje_ahorro:.1f}%)")
+        return lineas
+
+    def lineas_promedios(self, resultado, limite_filas=None, pagina=1):
+        """
+        Construye el texto de los promedios mensuales por servidor
+
+        Args:
+            resultado: ResultadoPromedios del centro de datos
+            limite_filas: Servidores por página (None para todos)
+            pagina: Página a mostrar, comenzando en 1
+
+        Returns:
+            list: Líneas de texto a mostrar
+        """
+        inicio, fin = self._rango_pagina(len(resultado), limite_filas, pagina)
+        lineas = ["\n=== PROMEDIO MENSUAL DE USO DE CPU POR SERVIDOR ===", "-" * 60]
+        lineas += [f"{nombre:<15}: {promedio:.2f}%" for nombre, promedio in
+                   zip(resultado.nombres[inicio:fin], resultado.promedios[inicio:fin])]
+        return lineas + self._nota_truncado(len(resultado), fin, limite_filas, pagina)
+
+    def lineas_dia_mayor_carga(self, resultado, limite_filas=None, pagina=1):
+        """
+        Construye el texto del día con mayor carga total
+
+        Args:
+            resultado: ResultadoDiaMayorCarga del centro de datos
+            limite_filas: Servidores del detalle por página (None para todos)
+            pagina: Página del detalle a mostrar, comenzando en 1
+
+        Returns:
+            list: Líneas de texto a mostrar
+        """
+        if resultado.vacio:
+            return ["\n=== DÍA CON MAYOR CARGA TOTAL DE CPU ===", "-" * 45, "Los datos cargados no tienen días"]
+        total = len(resultado.valores_dia)
+        inicio, fin = self._rango_pagina(total, limite_filas, pagina)
+        lineas = [
+            "\n=== DÍA CON MAYOR CARGA TOTAL DE CPU ===",
+            "-" * 45,
+            f"Día: {resultado.descripcion}",
+            f"Carga total: {resultado.carga_total:.2f}%",
+            f"\nDetalles del día {resultado.dia + 1}:"
+        ]
+        lineas += [f"{nombre:<15}: {valor:.2f}%" for nombre, valor in
+                   zip(resultado.nombres[inicio:fin], resultado.valores_dia[inicio:fin])]
+        return lineas + self._nota_truncado(total, fin, limite_filas, pagina)
+
+    def lineas_servidor_menor_uso(self, resultado):
+        """
+        Construye el texto del servidor con menor uso promedio
+
+        Args:
+            resultado: ResultadoServidorMenorUso del centro de datos
+
+        Returns:
+            list: Líneas de texto a mostrar
+        """
+        if resultado.vacio:
+            return ["\n=== SERVIDOR CON MENOR USO PROMEDIO DE CPU ===", "-" * 50,
+                    "Ningún servidor tiene mediciones"]
+        lineas = [
+            "\n=== SERVIDOR CON MENOR USO PROMEDIO DE CPU ===",
+            "-" * 50,
+            f"Servidor: {resultado.servidor}",
+            f"Promedio de uso: {resultado.promedio:.2f}%",
+            f"\nPrimeros {len(resultado.primeros_dias)} días de {resultado.servidor}:"
+        ]
+        lineas += [f"Día {dia + 1}: {valor:.2f}%" for dia, valor in enumerate(resultado.primeros_dias)]
+        return lineas
+
+    def lineas_top_servidores(self, resultado):
+        """
+        Construye el texto del ranking de servidores
+
+        Args:
+            resultado: ResultadoTopServidores del centro de datos
+
+        Returns:
+            list: Líneas de texto a mostrar
+        """
+        orden = "MAYOR" if resultado.mayores else "MENOR"
+        lineas = [f"\n=== TOP {len(resultado)} SERVIDORES CON {orden} {resultado.metrica.upper()} DE CPU ===",
+                  "-" * 60]
+        lineas += [f"{posicion:3d}. {nombre:<15}: {valor:.2f}% (servidor {fila + 1})"
+                   for posicion, (fila, nombre, valor) in
+                   enumerate(zip(resultado.filas, resultado.nombres, resultado.valores), start=1)]
+        return lineas
+
+    def lineas_percentiles_flota(self, resultado, limite_filas=None, pagina=1):
+        """
+        Construye la tabla de percentiles de la flota por día
+
+        Args:
+            resultado: ResultadoPercentilesDia del centro de datos
+            limite_filas: Días por página (None para todos)
+            pagina: Página a mostrar, comenzando en 1
+
+        Returns:
+            list: Líneas de texto a mostrar
+        """
+        inicio, fin = self._rango_pagina(len(resultado), limite_filas, pagina)
+        encabezado = "".join(f"{f'p{percentil}':>10}" for percentil in resultado.percentiles)
+        lineas = ["\n=== PERCENTILES DE USO DE CPU DE LA FLOTA POR DÍA ===", "-" * 60,
+                  f"{'Día':<25}{encabezado}"]
+        lineas += [f"{resultado.descripciones[dia]:<25}" + "".join(f"{valor:>9.2f}%" for valor in resultado.valores[:, dia])
+                   for dia in range(inicio, fin)]
+        return lineas + self._nota_truncado(len(resultado), fin, limite_filas, pagina)
+
+    def _escribir(self, lineas):
+        """Escribe un bloque de líneas con una sola llamada a stdout"""
+        sys.stdout.write("\n".join(lineas) + "\n")
+
+    @staticmethod
+    def _rango_pagina(total, limite_filas, pagina):
+        """Retorna el rango [inicio, fin) de filas de una página"""
+        if limite_filas is None:
+            return 0, total
+        inicio = min((pagina - 1) * limite_filas, total)
+        return inicio, min(inicio + limite_filas, total)
+
+    @staticmethod
+    def _nota_truncado(total, fin, limite_filas, pagina):
+        """Retorna la línea que indica cuántas filas quedaron sin mostrar"""
+        restantes = total - fin
+        if limite_filas is None or restantes <= 0:
+            return []
+        paginas = -(-total // limite_filas)
+        return [f"... y {restantes} más (página {pagina} de {paginas})"]
+
+    def _mostrar_paginado(self, generar_lineas, total, limite_filas):
+        """
+        Muestra un listado página a página, preguntando antes de continuar
+
+        Args:
+            generar_lineas: Función (limite_filas, pagina) -> líneas
+            total: Número total de filas del listado
+            limite_filas: Filas por página (None para mostrar todo de una vez)
+        """
+        pagina = 1
+        while True:
+            self._escribir(generar_lineas(limite_filas, pagina))
+            if limite_filas is None or pagina * limite_filas >= total:
+                return
+            respuesta = input("\nEnter para ver la página siguiente, 'q' para volver: ").strip().lower()
+            if respuesta == 'q':
+                return
+            pagina += 1
+    
+    def consultar_servidor_especifico(self):
+        """Permite consultar datos de un servidor específico"""
+        if not self.centro.datos_cargados:
+            print("Error: Primero debe cargar los datos")
+            return
+        
+        self._mostrar_lista_servidores()
+        
+        try:
+            opcion = input("\nIngrese el nombre del servidor o su número: ").strip()
+            nombre_servidor = self._procesar_seleccion_servidor(opcion)
+            
+            if nombre_servidor:
+                self._mostrar_datos_servidor(nombre_servidor)
+                
+        except ValueError:
+            print("Entrada inválida")
+    
+    def consultar_dia_especifico(self):
+        """Permite consultar datos de un día específico"""
+        if not self.centro.datos_cargados:
+            print("Error: Primero debe cargar los datos")
+            return
+        
+        try:
+            num_dias = self.centro.num_dias
+            dia = int(input(f"Ingrese el día (1-{num_dias}): "))
+            
+            if 1 <= dia <= num_dias:
+                self._mostrar_datos_dia(dia)
+            else:
+                print(f"Día inválido. Debe estar entre 1 y {num_dias}")
+                
+        except ValueError:
+            print("Entrada inválida. Debe ingresar un número")
+    
+    def consultar_ventana_movil(self):
+        """Permite consultar las ventanas móviles de un servidor"""
+        if not self.centro.datos_cargados:
+            print("Error: Primero debe cargar los datos")
+            return
+
+        try:
+            opcion = input("\nIngrese el nombre del servidor, su número o un patrón: ").strip()
+            nombre_servidor = self._procesar_seleccion_servidor(opcion)
+            if not nombre_servidor:
+                return
+
+            num_dias = self.centro.num_dias
+            ventana = int(input(f"Tamaño de la ventana en días (1-{num_dias}) [7]: ").strip() or min(7, num_dias))
+            if not 1 <= ventana <= num_dias:
+                print(f"Ventana inválida. Debe estar entre 1 y {num_dias}")
+                return
+        except ValueError:
+            print("Entrada inválida. Debe ingresar un número")
+            return
+
+        resultado = self.centro.analizar_ventana_movil(nombre_servidor, ventana)
+        if resultado is None:
+            print(f"No se encontró el servidor '{nombre_servidor}'")
+        else:
+            self.mostrar_ventana_movil(resultado)
+
+    def solicitar_parametros_alertas(self, limites):
+        """
+        Solicita la regla de alerta y su límite
+
+        Args:
+            limites: Diccionario regla -> límite predeterminado
+
+        Returns:
+            tuple: (regla, límite) o None si la entrada es inválida
+        """
+        reglas = list(limites)
+        regla = input(f"Regla ({'/'.join(reglas)}) [{reglas[0]}]: ").strip().lower() or reglas[0]
+        if regla not in limites:
+            print(f"Regla inválida. Opciones: {', '.join(reglas)}")
+            return None
+
+        unidad = "%" if regla == "umbral" else " desviaciones"
+        try:
+            limite = float(input(f"Límite en{unidad} [{limites[regla]:g}]: ").strip() or limites[regla])
+        except ValueError:
+            print("Entrada inválida. Debe ingresar un número")
+            return None
+        return regla, limite
+
+    def mostrar_alertas(self, resultado, limite_filas=FILAS_POR_PAGINA):
+        """Muestra los servidores en alerta, paginados si son muchos"""
+        self._mostrar_paginado(lambda limite, pagina: self.lineas_alertas(resultado, limite, pagina),
+                               len(resultado.filas_con_alerta), limite_filas)
+
+    def solicitar_ruta_json_alertas(self):
+        """Solicita la ruta donde guardar las alertas en JSON (vacío para omitir)"""
+        return input("\nRuta para guardar las alertas en JSON (Enter para omitir): ").strip()
+
+    def mostrar_json_alertas_guardado(self, ruta):
+        """Confirma que las alertas se guardaron"""
+        print(f"Alertas guardadas en {ruta}")
+
+    def lineas_alertas(self, resultado, limite_filas=None, pagina=1):
+        """
+        Construye el texto de las alertas: totales y servidores ordenados por
+        días en alerta (desempate por el primer servidor)
+
+        Args:
+            resultado: ResultadoAlertas del centro de datos
+            limite_filas: Servidores por página (None para todos)
+            pagina: Página a mostrar, comenzando en 1
+
+        Returns:
+            list: Líneas de texto a mostrar
+        """
+        if resultado.regla == "umbral":
+            descripcion = f"uso mayor que {resultado.limite:.2f}%"
+        else:
+            descripcion = f"|z| mayor que {resultado.limite:g} respecto del propio servidor"
+        filas = resultado.filas_con_alerta
+        filas = filas[np.argsort(-resultado.conteos[filas], kind='stable')]
+
+        lineas = ["\n=== ALERTAS DE USO DE CPU ===", "-" * 75,
+                  f"Regla: {descripcion}",
+                  f"Mediciones en alerta: {len(resultado)} de {resultado.total_mediciones}",
+                  f"Servidores con alerta: {len(filas)}"]
+        if not len(filas):
+            return lineas
+
+        # Posición del primer par (fila, día) de cada servidor
+        primeros = np.cumsum(resultado.conteos) - resultado.conteos
+        inicio, fin = self._rango_pagina(len(filas), limite_filas, pagina)
+        lineas += ["", f"{'Servidor':<15}{'Días':>8}{'Racha máx.':>12}{'Primer día':>12}{'Último día':>12}"]
+        for fila in filas[inicio:fin]:
+            conteo = resultado.conteos[fila]
+            lineas.append(f"{resultado.nombres[fila]:<15}{conteo:>8}{resultado.racha_maxima[fila]:>12}"
+                          f"{resultado.dias[primeros[fila]] + 1:>12}"
+                          f"{resultado.dias[primeros[fila] + conteo - 1] + 1:>12}")
+        return lineas + self._nota_truncado(len(filas), fin, limite_filas, pagina)
+
+    def mostrar_ventana_movil(self, resultado, limite_filas=FILAS_POR_PAGINA):
+        """Muestra las ventanas móviles de un servidor, paginadas si son muchas"""
+        self._mostrar_paginado(lambda limite, pagina: self.lineas_ventana_movil(resultado, limite, pagina),
+                               len(resultado), limite_filas)
+
+    def lineas_ventana_movil(self, resultado, limite_filas=None, pagina=1):
+        """
+        Construye la tabla de ventanas móviles de un servidor
+
+        Args:
+            resultado: ResultadoVentanaMovil del centro de datos
+            limite_filas: Días por página (None para todos)
+            pagina: Página a mostrar, comenzando en 1
+
+        Returns:
+            list: Líneas de texto a mostrar
+        """
+        inicio, fin = self._rango_pagina(len(resultado), limite_filas, pagina)
+        lineas = [f"\n=== VENTANA MÓVIL DE {resultado.ventana} DÍAS - {resultado.servidor} ===", "-" * 85,
+                  f"{'Día':<25}{'Uso':>9}{'Media':>10}{'Mínimo':>10}{'Máximo':>10}{'Desv.':>10}{'Δ día':>10}"]
+        for i in range(inicio, fin):
+            lineas.append(f"{resultado.descripciones[i]:<25}{resultado.valores[i]:>8.2f}%"
+                          f"{resultado.promedio[i]:>9.2f}%{resultado.minimo[i]:>9.2f}%"
+                          f"{resultado.maximo[i]:>9.2f}%{resultado.desviacion[i]:>10.2f}"
+                          f"{resultado.diferencia[i]:>+10.2f}")
+        return lineas + self._nota_truncado(len(resultado), fin, limite_filas, pagina)
+
+    def solicitar_parametros_correlacion(self):
+        """
+        Solicita cuántos pares conservar por servidor y el umbral de los grupos
+
+        Returns:
+            tuple: (pares por servidor, umbral) o None si la entrada es inválida
+        """
+        try:
+            n_pares = int(input("Servidores correlacionados por servidor [5]: ").strip() or 5)
+            umbral = float(input("Correlación mínima para agrupar (-1 a 1) [0.9]: ").strip() or 0.9)
+        except ValueError:
+            print("Entrada inválida. Debe ingresar un número")
+            return None
+        if n_pares < 1:
+            print("La cantidad de pares debe ser mayor o igual a 1")
+            return None
+        if not -1.0 <= umbral <= 1.0:
+            print("El umbral debe estar entre -1 y 1")
+            return None
+        return n_pares, umbral
+
+    def mostrar_correlaciones(self, resultado, limite_filas=FILAS_POR_PAGINA):
+        """Muestra los pares más correlacionados y los grupos, paginados si son muchos"""
+        self._mostrar_paginado(lambda limite, pagina: self.lineas_correlaciones(resultado, limite, pagina),
+                               len(resultado), limite_filas)
+
+    def lineas_correlaciones(self, resultado, limite_filas=None, pagina=1, pares=10, miembros=8):
+        """
+        Construye el texto de las correlaciones: los pares más correlacionados
+        de la flota y los grupos de servidores que cargan a la vez
+
+        Args:
+            resultado: ResultadoCorrelaciones del centro de datos
+            limite_filas: Grupos por página (None para todos)
+            pagina: Página a mostrar, comenzando en 1
+            pares: Pares de la flota a listar
+            miembros: Servidores listados por grupo
+
+        Returns:
+            list: Líneas de texto a mostrar
+        """
+        lineas = ["\n=== CORRELACIÓN DE USO DE CPU ENTRE SERVIDORES ===", "-" * 75,
+                  "Pares más correlacionados de la flota:"]
+        filas_a, filas_b, valores = resultado.mejores_pares(pares)
+        lineas += [f"  {resultado.nombres[a]:<15} {resultado.nombres[b]:<15} {valor:>7.3f}"
+                   for a, b, valor in zip(filas_a, filas_b, valores)]
+        if not len(valores):
+            lineas.append("  (no hay servidores con uso variable para comparar)")
+
+        lineas += ["", f"Grupos con correlación >= {resultado.umbral:g}: {len(resultado)}"]
+        inicio, fin = self._rango_pagina(len(resultado), limite_filas, pagina)
+        for numero in range(inicio, fin):
+            grupo = resultado.grupos[numero]
+            nombres = ", ".join(str(nombre) for nombre in resultado.nombres[grupo[:miembros]])
+            resto = f" y {len(grupo) - miembros} más" if len(grupo) > miembros else ""
+            lineas.append(f"{numero + 1:>4}. {len(grupo):>5} servidores: {nombres}{resto}")
+        return lineas + self._nota_truncado(len(resultado), fin, limite_filas, pagina)
+
+    def solicitar_capacidad_host(self):
+        """
+        Solicita la capacidad de cada host para planificar la consolidación
+
+        Returns:
+            float: Capacidad en % de un servidor, o None si la entrada es inválida
+        """
+        try:
+            capacidad = float(input("Capacidad de cada host en % de un servidor [100]: ").strip() or 100)
+        except ValueError:
+            print("Entrada inválida. Debe ingresar un número")
+            return None
+        if capacidad <= 0:
+            print("La capacidad debe ser mayor que 0")
+            return None
+        return capacidad
+
+    def mostrar_consolidacion(self, resultado, limite_filas=FILAS_POR_PAGINA):
+        """Muestra el plan de consolidación, con la holgura por día paginada"""
+        self._mostrar_paginado(lambda limite, pagina: self.lineas_consolidacion(resultado, limite, pagina),
+                               len(resultado.descripciones), limite_filas)
+
+    def lineas_consolidacion(self, resultado, limite_filas=None, pagina=1, hosts=10, miembros=8):
+        """
+        Construye el texto del plan de consolidación: hosts usados y
+        ahorrados, los hosts con más servidores y la holgura de cada día
+
+        Args:
+            resultado: ResultadoConsolidacion del centro de datos
+            limite_filas: Días por página (None para todos)
+            pagina: Página a mostrar, comenzando en 1
+            hosts: Hosts listados con sus servidores
+            miembros: Servidores listados por host
+
+        Returns:
+            list: Líneas de texto a mostrar
+        """
+        servidores = len(resultado.nombres)
+        porcentaje = 100.0 * resultado.hosts_ahorrados / servidores if servidores else 0.0
+        lineas = ["\n=== CONSOLIDACIÓN DE SERVIDORES EN HOSTS ===", "-" * 75,
+                  f"Capacidad por host: {resultado.capacidad:.2f}%",
+                  f"Servidores: {servidores}",
+                  f"Hosts necesarios: {len(resultado)}",
+                  f"Hosts ahorrados: {resultado.hosts_ahorrados} ({porcentaje:.1f}%)"]
+        if len(resultado.excedidos):
+            lineas.append(f"Servidores que superan la capacidad algún día (quedan solos): "
+                          f"{len(resultado.excedidos)}")
+
+        por_host = resultado.servidores_por_host()
+        orden = sorted(range(len(por_host)), key=lambda host: -len(por_host[host]))[:hosts]
+        if orden:
+            lineas += ["", "Hosts con más servidores:"]
+        for host in orden:
+            filas = por_host[host]
+            nombres = ", ".join(str(nombre) for nombre in resultado.nombres[filas[:miembros]])
+            resto = f" y {len(filas) - miembros} más" if len(filas) > miembros else ""
+            lineas.append(f"  Host {host + 1:>6} ({resultado.cargas[host].max(initial=0.0):6.2f}% pico): "
+                          f"{nombres}{resto}")
+
+        inicio, fin = self._rango_pagina(len(resultado.descripciones), limite_filas, pagina)
+        total, minima = resultado.holgura_por_dia, resultado.holgura_minima_por_dia
+        lineas += ["", f"{'Día':<25}{'Holgura total':>16}{'Holgura mínima':>17}"]
+        for dia in range(inicio, fin):
+            lineas.append(f"{resultado.descripciones[dia]:<25}{total[dia]:>15.2f}%{minima[dia]:>16.2f}%")
+        return lineas + self._nota_truncado(len(resultado.descripciones), fin, limite_filas, pagina)
+
+    @staticmethod
+    def _leer_rango(texto):
+        """
+        Convierte "inicio-fin" o "n" (base 1, inclusivo) en un slice base 0
+
+        Returns:
+            slice: Rango equivalente, o None si el texto no es un rango
+        """
+        partes = texto.split("-")
+        if len(partes) > 2 or not all(parte.strip().isdigit() for parte in partes):
+            return None
+        inicio, fin = int(partes[0]), int(partes[-1])
+        if inicio < 1 or fin < inicio:
+            return None
+        return slice(inicio - 1, fin)
+
+    def solicitar_parametros_rango(self):
+        """
+        Solicita la selección de servidores y el rango de días de una consulta
+
+        Returns:
+            tuple: (selector de servidores, slice de días) o None si la
+                   entrada es inválida
+        """
+        print("Servidores: rango de filas (ej. 100-200), nombres separados por comas")
+        print("o patrón glob (ej. Servidor_1*); vacío para todos")
+        texto_servidores = input("Servidores: ").strip()
+        texto_dias = input("Días (ej. 8-15; vacío para todos): ").strip()
+
+        if not texto_servidores:
+            servidores = None
+        elif texto_servidores[0].isdigit() and self._leer_rango(texto_servidores) is not None:
+            servidores = self._leer_rango(texto_servidores)
+        elif "," in texto_servidores:
+            servidores = [nombre.strip() for nombre in texto_servidores.split(",") if nombre.strip()]
+        else:
+            servidores = texto_servidores
+
+        dias = self._leer_rango(texto_dias) if texto_dias else None
+        if texto_dias and dias is None:
+            print("Rango de días inválido. Use inicio-fin con días desde 1")
+            return None
+        return servidores, dias
+
+    def mostrar_error_rango(self, error):
+        """Muestra por qué no se pudo resolver la selección de una consulta"""
+        print(f"Error en la selección: {error}")
+
+    def mostrar_rango(self, resultado, limite_filas=FILAS_POR_PAGINA):
+        """Muestra los agregados de una consulta por rango, paginados por servidor"""
+        self._mostrar_paginado(lambda limite, pagina: self.lineas_rango(resultado, limite, pagina),
+                               len(resultado), limite_filas)
+
+    def lineas_rango(self, resultado, limite_filas=None, pagina=1):
+        """
+        Construye el texto de una consulta por rango: totales y extremos de
+        la selección y la tabla de agregados por servidor
+
+        Args:
+            resultado: ResultadoRango del centro de datos
+            limite_filas: Servidores por página (None para todos)
+            pagina: Página a mostrar, comenzando en 1
+
+        Returns:
+            list: Líneas de texto a mostrar
+        """
+        dias = resultado.dia_fin - resultado.dia_inicio
+        lineas = ["\n=== CONSULTA POR RANGO ===", "-" * 75,
+                  f"Días: {resultado.descripcion_inicio} a {resultado.descripcion_fin} ({dias} días)"
+                  if dias else "Días: ninguno (el rango está fuera de los datos)",
+                  f"Servidores seleccionados: {len(resultado)}",
+                  f"Mediciones: {resultado.total_mediciones}",
+                  f"Suma: {resultado.suma:.2f}",
+                  f"Promedio: {resultado.promedio:.2f}%"]
+        for etiqueta, mayor in (("Máximo", True), ("Mínimo", False)):
+            extremo = resultado.extremo(mayor)
+            if extremo is not None:
+                posicion, dia, valor = extremo
+                lineas.append(f"{etiqueta}: {valor:.2f}% ({resultado.nombres[posicion]}, día {dia + 1})")
+
+        inicio, fin = self._rango_pagina(len(resultado), limite_filas, pagina)
+        lineas += ["", f"{'Servidor':<15}{'Suma':>12}{'Promedio':>10}{'Máximo':>9}{'Día':>6}{'Mínimo':>9}{'Día':>6}"]
+        for i in range(inicio, fin):
+            lineas.append(f"{resultado.nombres[i]:<15}{resultado.sumas[i]:>12.2f}{resultado.promedios[i]:>9.2f}%"
+                          f"{resultado.maximos[i]:>8.2f}%{resultado.dias_maximo[i] + 1:>6}"
+                          f"{resultado.minimos[i]:>8.2f}%{resultado.dias_minimo[i] + 1:>6}")
+        return lineas + self._nota_truncado(len(resultado), fin, limite_filas, pagina)
+
+    def solicitar_opcion(self):
+        """Solicita y retorna la opción seleccionada por el usuario"""
+        return input("Seleccione una opción: ").strip()
+    
+    def pausar_para_continuar(self):
+        """Pausa la ejecución esperando que el usuario presione Enter"""
+        input("\nPresione Enter para continuar...")
+    
+    def mostrar_error_inesperado(self, error):
+        """Muestra un error inesperado"""
+        print(f"Error inesperado: {error}")
+    
+    def mostrar_instrumentacion_inactiva(self):
+        """Indica cómo activar la medición de rendimiento"""
+        print("La instrumentación de rendimiento está desactivada.")
+        print("Actívela con --instrumentar o con la variable ANALISIS_CPU_INSTRUMENTACION=1")
+
+    def mostrar_estadisticas_rendimiento(self, estadisticas):
+        """
+        Muestra las métricas de rendimiento acumuladas
+
+        Args:
+            estadisticas: Diccionario producido por Instrumentacion.exportar()
+        """
+        metricas = estadisticas['metricas']
+        print("\n=== ESTADÍSTICAS DE RENDIMIENTO ===")
+        if not metricas:
+            print("Aún no hay mediciones")
+            return
+
+        print(f"{'Métrica':<55} {'Llamadas':>8} {'Pared total':>12} {'Pared media':>12} "
+              f"{'CPU total':>10} {'Pico memoria':>13}")
+        print("-" * 114)
+        for nombre, metrica in sorted(metricas.items(), key=lambda item: -item[1]['pared_total_s']):
+            print(f"{nombre:<55} {metrica['llamadas']:>8} {metrica['pared_total_s']:>11.4f}s "
+                  f"{metrica['pared_media_s'] * 1000:>10.3f}ms {metrica['cpu_total_s']:>9.4f}s "
+                  f"{metrica['bytes_pico_max']:>11} B")
+        omitidos = sum(metrica['picos_omitidos'] for metrica in metricas.values())
+        if omitidos:
+            print(f"\nPico de memoria no medido en {omitidos} llamadas concurrentes con otro hilo")
+        if estadisticas['perfiles_guardados']:
+            print(f"\nPerfiles cProfile guardados: {estadisticas['perfiles_guardados']}")
+
+    def solicitar_ruta_json_rendimiento(self):
+        """Solicita la ruta donde guardar las métricas en JSON (vacío para omitir)"""
+        return input("\nRuta para guardar en JSON (Enter para omitir): ").strip()
+
+    def mostrar_json_rendimiento_guardado(self, ruta):
+        """Confirma que las métricas se guardaron"""
+        print(f"Estadísticas guardadas en {ruta}")
+
+    def mostrar_cancelacion_usuario(self):
+        """Muestra mensaje de cancelación por parte del usuario"""
+        print("\n\nOperación cancelada por el usuario.")
+    
+    def _mostrar_lista_servidores(self):
+        """Muestra la lista de servidores disponibles"""
+        print("\nServidores disponibles:")
+        for i, nombre in enumerate(self.centro.nombres_servidores):
+            if nombre:  # Solo mostrar servidores con datos
+                print(f"{i+1:2d}. {nombre}")
+    
+    def _procesar_seleccion_servidor(self, opcion):
+        """
+        Procesa la selección del usuario para obtener el nombre del servidor
+        
+        Args:
+            opcion: Opción ingresada por el usuario (número, nombre o patrón
+                    como "web-*")
+            
+        Returns:
+            str: Nombre del servidor o None si es inválido
+        """
+        # Verificar si es un número
+        if opcion.isdigit():
+            indice = int(opcion) - 1
+            if 0 <= indice < self.centro.num_servidores and self.centro.nombres_servidores[indice]:
+                return self.centro.nombres_servidores[indice]
+            else:
+                print("Número de servidor inválido")
+                return None
+        elif any(comodin in opcion for comodin in '*?['):
+            return self._resolver_patron_servidor(opcion)
+        else:
+            return opcion
+
+    def _resolver_patron_servidor(self, patron):
+        """
+        Resuelve un patrón glob a un único servidor o lista las coincidencias
+
+        Args:
+            patron: Patrón de nombre de servidor
+
+        Returns:
+            str: Nombre del servidor si hay una única coincidencia, o None
+        """
+        filas = self.centro.buscar_servidores(patron)
+        if len(filas) == 1:
+            return self.centro.nombres_servidores[filas[0]]
+
+        if len(filas) == 0:
+            print(f"Ningún servidor coincide con '{patron}'")
+        else:
+            print(f"{len(filas)} servidores coinciden con '{patron}':")
+            for fila in filas[:20]:
+                print(f"  - {self.centro.nombres_servidores[fila]}")
+            if len(filas) > 20:
+                print(f"  ... y {len(filas) - 20} más")
+        return None
+    
+    def _mostrar_datos_servidor(self, nombre_servidor):
+        """
+        Muestra los datos detallados de un servidor específico
+        
+        Args:
+            nombre_servidor: Nombre del servidor a consultar
+        """
+        datos = self.centro.obtener_datos_servidor(nombre_servidor)
+        
+        if datos is not None:
+            print(f"\nDatos de {nombre_servidor}:")
+            print("-" * 40)
+            for dia in range(len(datos)):
+                print(f"Día {dia+1:2d}: {datos[dia]:6.2f}%")
+            
+            # Calcular estadísticas
+            promedio = self.centro.calculadora.calcular_promedio(datos)
+            estadisticas = self.centro.calculadora.calcular_estadisticas(datos)
+            
+            print(f"\nEstadísticas de {nombre_servidor}:")
+            print(f"Promedio: {promedio:.2f}%")
+            print(f"Máximo: {estadisticas['maximo']:.2f}% (Día {estadisticas['indice_maximo']+1})")
+            print(f"Mínimo: {estadisticas['minimo']:.2f}% (Día {estadisticas['indice_minimo']+1})")
+        else:
+            print(f"No se encontró el servidor '{nombre_servidor}'")
+    
+    def _mostrar_datos_dia(self, dia):
+        """
+        Muestra los datos de todos los servidores en un día específico
+        
+        Args:
+            dia: Día a consultar (1-num_dias)
+        """
+        datos = self.centro.obtener_datos_dia(dia)
+        
+        if datos is not None:
+            print(f"\nDatos del día {dia} de junio:")
+            print("-" * 40)
+            
+            for i in range(self.centro.num_servidores):
+                if self.centro.nombres_servidores[i]:
+                    print(f"{self.centro.nombres_servidores[i]:<15}: {datos[i]:6.2f}%")
+            
+            # Estadísticas del día a partir de los agregados memorizados
+            suma_total = self.centro.sumas_por_dia()[dia - 1]
+            promedio_dia = suma_total / len(datos)
+            indices_max, valores_max = self.centro.maximos_por_dia()
+            indices_min, valores_min = self.centro.minimos_por_dia()
+            
+            print(f"\nEstadísticas del día {dia}:")
+            print(f"Suma total: {suma_total:.2f}%")
+            print(f"Promedio: {promedio_dia:.2f}%")
+            print(f"Servidor con mayor uso: {self.centro.nombres_servidores[indices_max[dia - 1]]} ({valores_max[dia - 1]:.2f}%)")
+            print(f"Servidor con menor uso: {self.centro.nombres_servidores[indices_min[dia - 1]]} ({valores_min[dia - 1]:.2f}%)")
+        else:
+            print("Error al obtener los datos del día")
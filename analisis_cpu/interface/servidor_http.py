@@ -0,0 +1,371 @@
+"""
+Servidor HTTP local de consultas sobre los datos de CPU
+Expone los análisis como JSON para tableros, con asyncio de la biblioteca
+estándar. Los datos se cargan una vez en una instantánea de solo lectura que
+comparten todas las consultas; una recarga prepara una instantánea nueva y la
+reemplaza con una sola asignación, de modo que ninguna consulta ve datos a
+medio cargar.
+
+Rutas (GET salvo indicación):
+    /servidor/{nombre}    Uso diario y estadísticas de un servidor
+    /dia/{n}              Uso de cada servidor en el día n (base 1)
+    /promedios            Promedio de cada servidor
+    /dia-mayor-carga      Día con mayor carga total
+    /servidor-menor-uso   Servidor con menor uso promedio
+    /estado               Versión y forma de la instantánea actual
+    POST /recargar        Vuelve a cargar el archivo de datos
+
+Solo escucha en direcciones de loopback (127.0.0.1 / ::1 / localhost).
+"""
+
+import asyncio
+import contextlib
+import io
+import ipaddress
+import json
+import sys
+import time
+from urllib.parse import unquote, urlsplit
+
+import numpy as np
+
+from analisis_cpu.models.centro_datos import CentroDeDatos
+from analisis_cpu.models.resultados import reemplazar_nan
+
+MENSAJES_ESTADO = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                   500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+def es_direccion_local(host):
+    """Indica si un host es una dirección de loopback"""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class Instantanea:
+    """
+    Datos cargados que comparten las consultas. No se modifica después de
+    publicarse: la matriz queda de solo lectura y los agregados que usan las
+    rutas se calculan antes de publicarla
+    """
+
+    def __init__(self, centro, version):
+        """
+        Args:
+            centro: CentroDeDatos ya cargado y congelado
+            version: Número de la instantánea (crece con cada recarga)
+        """
+        self.centro = centro
+        self.version = version
+        self.cargada = time.time()
+        # Respuestas de las rutas sin parámetros, codificadas una sola vez
+        self._respuestas = {}
+
+    def respuesta_memorizada(self, ruta, generar):
+        """Retorna el cuerpo de una ruta fija, generándolo la primera vez"""
+        cuerpo = self._respuestas.get(ruta)
+        if cuerpo is None:
+            cuerpo = self._respuestas[ruta] = generar()
+        return cuerpo
+
+
+class ServidorHTTP:
+    """Clase que atiende las consultas HTTP sobre una instantánea de los datos"""
+
+    # Segundos de espera de la siguiente petición en una conexión keep-alive
+    ESPERA_KEEP_ALIVE = 15
+
+    # Tamaño máximo aceptado para la línea de petición y las cabeceras
+    LIMITE_CABECERAS = 16384
+
+    def __init__(self, archivo_datos, host="127.0.0.1", puerto=8080, almacenamiento="float64", max_errores=None):
+        """
+        Inicializa el servidor sin cargar datos ni abrir el puerto
+
+        Args:
+            archivo_datos: Archivo, directorio o patrón glob de datos
+            host: Dirección de loopback donde escuchar
+            puerto: Puerto TCP (0 elige uno libre)
+            almacenamiento: Modo de almacenamiento de CentroDeDatos
+            max_errores: Errores de formato tolerados en cada carga (None sin
+                         límite); una recarga que los supera no se publica
+        """
+        if not es_direccion_local(host):
+            raise ValueError(f"El servidor solo puede escuchar en loopback, no en '{host}'")
+        self.archivo_datos = archivo_datos
+        self.host = host
+        self.puerto = puerto
+        self.almacenamiento = almacenamiento
+        self.max_errores = max_errores
+        self._instantanea = None
+        self._version = 0
+        self._servidor = None
+        # El Lock se crea con el loop en marcha: en Python 3.8/3.9 queda
+        # ligado al loop por defecto del hilo que lo construye
+        self._bloqueo_recarga = None
+        self._rutas_fijas = {
+            "/promedios": lambda centro: centro.obtener_promedios(),
+            "/dia-mayor-carga": lambda centro: centro.obtener_dia_mayor_carga(),
+            "/servidor-menor-uso": lambda centro: centro.obtener_servidor_menor_uso()
+        }
+
+    @property
+    def instantanea(self):
+        """Instantánea publicada actualmente (None antes de la primera carga)"""
+        return self._instantanea
+
+    def cargar(self):
+        """
+        Carga los datos en un CentroDeDatos nuevo, calcula los agregados que
+        usan las rutas y publica la instantánea. Si la carga falla se
+        conserva la instantánea anterior
+
+        Returns:
+            tuple: (True si se publicó una instantánea nueva, mensajes de carga)
+        """
+        centro = CentroDeDatos(almacenamiento=self.almacenamiento)
+        mensajes = io.StringIO()
+        with contextlib.redirect_stdout(mensajes):
+            centro.cargar_datos(self.archivo_datos, max_errores=self.max_errores)
+        if not centro.datos_cargados:
+            return False, mensajes.getvalue().strip()
+
+        centro.congelar()
+        for agregado in (centro.promedios_por_servidor, centro.sumas_por_dia, centro.maximos_por_servidor,
+                         centro.minimos_por_servidor, centro.maximos_por_dia, centro.minimos_por_dia):
+            agregado()
+
+        self._version += 1
+        # Publicación atómica: las consultas en curso conservan la anterior
+        self._instantanea = Instantanea(centro, self._version)
+        return True, mensajes.getvalue().strip()
+
+    async def recargar(self):
+        """
+        Recarga los datos en un hilo sin detener las consultas; las recargas
+        simultáneas se serializan
+
+        Returns:
+            tuple: Igual que cargar()
+        """
+        if self._bloqueo_recarga is None:
+            self._bloqueo_recarga = asyncio.Lock()
+        async with self._bloqueo_recarga:
+            return await asyncio.get_running_loop().run_in_executor(None, self.cargar)
+
+    async def iniciar(self):
+        """Carga los datos si aún no hay instantánea y abre el puerto"""
+        self._bloqueo_recarga = asyncio.Lock()
+        if self._instantanea is None:
+            cargado, mensajes = await self.recargar()
+            if not cargado:
+                raise OSError(mensajes or f"No se pudieron cargar los datos de {self.archivo_datos}")
+        self._servidor = await asyncio.start_server(self._atender_conexion, self.host, self.puerto,
+                                                    limit=self.LIMITE_CABECERAS)
+        self.puerto = self._servidor.sockets[0].getsockname()[1]
+
+    async def detener(self):
+        """Cierra el puerto y espera a que terminen las conexiones abiertas"""
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+            self._servidor = None
+
+    async def servir_siempre(self):
+        """Inicia el servidor y atiende consultas hasta que se cancele"""
+        await self.iniciar()
+        instantanea = self._instantanea
+        sys.stderr.write(f"Sirviendo {instantanea.centro.num_servidores} servidores x "
+                         f"{instantanea.centro.num_dias} días en http://{self.host}:{self.puerto}\n")
+        async with self._servidor:
+            await self._servidor.serve_forever()
+
+    async def _atender_conexion(self, lector, escritor):
+        """Atiende las peticiones de una conexión (HTTP/1.1 keep-alive)"""
+        try:
+            while True:
+                try:
+                    peticion = await asyncio.wait_for(self._leer_peticion(lector), self.ESPERA_KEEP_ALIVE)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                        ValueError):
+                    break
+                if peticion is None:
+                    break
+
+                metodo, ruta, version, cabeceras = peticion
+                estado, cuerpo = await self._despachar(metodo, ruta)
+                mantener = version == "HTTP/1.1" and cabeceras.get("connection", "").lower() != "close"
+                escritor.write(self._formatear_respuesta(estado, cuerpo, mantener, metodo != "HEAD"))
+                await escritor.drain()
+                if not mantener:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+            with contextlib.suppress(ConnectionError):
+                await escritor.wait_closed()
+
+    @staticmethod
+    async def _leer_peticion(lector):
+        """
+        Lee la línea de petición y las cabeceras; descarta el cuerpo
+
+        Returns:
+            tuple: (método, ruta, versión, cabeceras) o None si se cerró
+        """
+        linea = await lector.readline()
+        if not linea:
+            return None
+        partes = linea.decode('latin-1').split()
+        if len(partes) != 3:
+            raise ValueError("Línea de petición inválida")
+
+        cabeceras = {}
+        while True:
+            linea = await lector.readline()
+            if linea in (b"\r\n", b"\n", b""):
+                break
+            nombre, _, valor = linea.decode('latin-1').partition(":")
+            cabeceras[nombre.strip().lower()] = valor.strip()
+
+        longitud = int(cabeceras.get("content-length", 0) or 0)
+        if longitud:
+            await lector.readexactly(longitud)
+        return partes[0].upper(), partes[1], partes[2], cabeceras
+
+    async def _despachar(self, metodo, ruta):
+        """
+        Resuelve una petición
+
+        Returns:
+            tuple: (código de estado, cuerpo JSON en bytes)
+        """
+        ruta = urlsplit(ruta).path.rstrip("/") or "/"
+
+        if ruta == "/recargar":
+            if metodo != "POST":
+                return 405, self._json({'error': "Use POST para recargar"})
+            cargado, mensajes = await self.recargar()
+            if not cargado:
+                return 500, self._json({'error': mensajes or "No se pudieron cargar los datos"})
+            return 200, self._json(self._estado(self._instantanea))
+
+        if metodo not in ("GET", "HEAD"):
+            return 405, self._json({'error': f"Método {metodo} no permitido"})
+
+        # Cada consulta trabaja de principio a fin con la instantánea vigente al llegar
+        instantanea = self._instantanea
+        if instantanea is None:
+            return 503, self._json({'error': "Datos no cargados"})
+
+        try:
+            if ruta in self._rutas_fijas:
+                generar = self._rutas_fijas[ruta]
+                return 200, instantanea.respuesta_memorizada(ruta, lambda: self._json(generar(instantanea.centro)))
+            if ruta == "/estado":
+                return 200, self._json(self._estado(instantanea))
+            if ruta.startswith("/servidor/"):
+                return self._consultar_servidor(instantanea.centro, unquote(ruta[len("/servidor/"):]))
+            if ruta.startswith("/dia/"):
+                return self._consultar_dia(instantanea.centro, ruta[len("/dia/"):])
+        except Exception as e:
+            return 500, self._json({'error': f"Error inesperado: {e}"})
+        return 404, self._json({'error': f"Ruta desconocida '{ruta}'"})
+
+    def _consultar_servidor(self, centro, nombre):
+        """Datos diarios y estadísticas de un servidor"""
+        fila = centro.indice_servidor(nombre)
+        if fila is None:
+            return 404, self._json({'error': f"No se encontró el servidor '{nombre}'"})
+
+        indices_max, maximos = centro.maximos_por_servidor()
+        indices_min, minimos = centro.minimos_por_servidor()
+        return 200, self._json({
+            'servidor': nombre,
+            'fila': fila + 1,
+            'promedio': float(centro.promedios_por_servidor()[fila]),
+            'maximo': self._extremo('dia', indices_max[fila], maximos[fila], lambda indice: int(indice) + 1),
+            'minimo': self._extremo('dia', indices_min[fila], minimos[fila], lambda indice: int(indice) + 1),
+            'valores': centro.obtener_datos_servidor(nombre).tolist()
+        })
+
+    def _consultar_dia(self, centro, texto_dia):
+        """Uso de cada servidor y estadísticas de un día"""
+        try:
+            dia = int(texto_dia)
+        except ValueError:
+            return 400, self._json({'error': f"Día inválido '{texto_dia}'"})
+        if not 1 <= dia <= centro.num_dias:
+            return 404, self._json({'error': f"Día fuera de rango. Debe estar entre 1 y {centro.num_dias}"})
+
+        datos = centro.obtener_datos_dia(dia)
+        nombres = centro.nombres_servidores
+        indices_max, maximos = centro.maximos_por_dia()
+        indices_min, minimos = centro.minimos_por_dia()
+        suma = float(centro.sumas_por_dia()[dia - 1])
+        # El promedio es sobre las mediciones válidas: la suma ignora los NaN
+        validos = int(np.count_nonzero(~np.isnan(datos)))
+        return 200, self._json({
+            'dia': dia,
+            'descripcion': centro.describir_dia(dia - 1),
+            'carga_total': suma,
+            'promedio': suma / validos if validos else None,
+            'maximo': self._extremo('servidor', indices_max[dia - 1], maximos[dia - 1],
+                                    lambda indice: str(nombres[indice])),
+            'minimo': self._extremo('servidor', indices_min[dia - 1], minimos[dia - 1],
+                                    lambda indice: str(nombres[indice])),
+            'servidores': [{'servidor': str(nombre), 'uso': uso}
+                           for nombre, uso in zip(nombres, datos.tolist())]
+        })
+
+    @staticmethod
+    def _extremo(clave, indice, valor, describir):
+        """
+        Máximo o mínimo de un servidor o día; el índice -1 (sin mediciones
+        válidas) se informa como null en lugar de tomar la última posición
+        """
+        if indice < 0:
+            return {clave: None, 'uso': None}
+        return {clave: describir(indice), 'uso': float(valor)}
+
+    @staticmethod
+    def _estado(instantanea):
+        """Descripción de la instantánea publicada"""
+        centro = instantanea.centro
+        return {'version': instantanea.version, 'cargada': instantanea.cargada,
+                'servidores': centro.num_servidores, 'dias': centro.num_dias,
+                'periodos': [periodo['etiqueta'] for periodo in centro.periodos]}
+
+    @staticmethod
+    def _json(documento):
+        """Codifica un documento como JSON válido (NaN -> null)"""
+        return json.dumps(reemplazar_nan(documento), ensure_ascii=False).encode('utf-8')
+
+    @staticmethod
+    def _formatear_respuesta(estado, cuerpo, mantener, incluir_cuerpo=True):
+        """Construye la respuesta HTTP completa (sin cuerpo para HEAD)"""
+        cabeceras = (f"HTTP/1.1 {estado} {MENSAJES_ESTADO.get(estado, '')}\r\n"
+                     "Content-Type: application/json; charset=utf-8\r\n"
+                     f"Content-Length: {len(cuerpo)}\r\n"
+                     f"Connection: {'keep-alive' if mantener else 'close'}\r\n\r\n")
+        return cabeceras.encode('latin-1') + (cuerpo if incluir_cuerpo else b"")
+
+
+def ejecutar_servidor(archivo_datos, host="127.0.0.1", puerto=8080, almacenamiento="float64", max_errores=None):
+    """
+    Función de entrada para servir las consultas hasta Ctrl+C
+
+    Returns:
+        int: Código de salida del proceso
+    """
+    servidor = ServidorHTTP(archivo_datos, host, puerto, almacenamiento, max_errores)
+    try:
+        asyncio.run(servidor.servir_siempre())
+    except KeyboardInterrupt:
+        pass
+    return 0
@@ -0,0 +1 @@
+"""Modelo: datos de uso de CPU, cachés, archivos y resultados de los análisis"""
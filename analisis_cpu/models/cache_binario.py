@@ -0,0 +1,130 @@
+"""
+Caché binario de los datos de CPU ya procesados
+Guarda junto al archivo de texto la matriz en formato .npy y los nombres de
+servidores, y permite reabrirlos con np.memmap sin volver a procesar el texto
+"""
+
+import json
+import os
+
+import numpy as np
+
+
+class CacheBinario:
+    """Clase que gestiona el caché binario asociado a un archivo de datos"""
+
+    VERSION = 2
+
+    SUFIJOS = (".cache.npy", ".cache.nombres.npy", ".cache.json")
+
+    def __init__(self, archivo):
+        """
+        Inicializa el caché para un archivo de datos de texto
+
+        Args:
+            archivo: Ruta al archivo de datos de CPU en texto
+        """
+        self.archivo = archivo
+        self.ruta_datos, self.ruta_nombres, self.ruta_metadatos = \
+            (f"{archivo}{sufijo}" for sufijo in self.SUFIJOS)
+
+    @classmethod
+    def es_archivo_cache(cls, ruta):
+        """Indica si una ruta corresponde a un archivo del caché (o temporal)"""
+        return ruta.endswith(cls.SUFIJOS) or ruta.endswith(tuple(f"{s}.tmp" for s in cls.SUFIJOS))
+
+    def _firma_origen(self):
+        """Retorna la firma (mtime y tamaño) del archivo de texto de origen"""
+        estado = os.stat(self.archivo)
+        return {'mtime_ns': estado.st_mtime_ns, 'tamano': estado.st_size}
+
+    def es_valido(self, dtype=None):
+        """
+        Indica si el caché existe y corresponde al archivo de origen actual
+
+        Args:
+            dtype: Si se indica, el caché debe haberse guardado con ese dtype
+
+        Returns:
+            bool: True si el caché puede usarse en lugar del texto
+        """
+        try:
+            with open(self.ruta_metadatos, 'r', encoding='utf-8') as file:
+                metadatos = json.load(file)
+            firma = self._firma_origen()
+        except (OSError, ValueError):
+            return False
+
+        return (metadatos.get('version') == self.VERSION
+                and metadatos.get('origen') == firma
+                and (dtype is None or metadatos.get('dtype') == str(dtype))
+                and os.path.exists(self.ruta_datos)
+                and os.path.exists(self.ruta_nombres))
+
+    def guardar(self, datos_cpu, nombres_servidores, errores=None):
+        """
+        Escribe la matriz y los nombres en el caché; los metadatos se
+        escriben al final para que un caché incompleto nunca sea válido
+
+        Args:
+            datos_cpu: Matriz numpy (servidores x días)
+            nombres_servidores: Array con los nombres de los servidores
+            errores: Tupla (registros, total) con los errores de formato del
+                     texto, para informarlos también al abrir el caché
+        """
+        firma = self._firma_origen()
+        registros, total = errores or ([], 0)
+        metadatos = {
+            'version': self.VERSION,
+            'origen': firma,
+            'forma': list(datos_cpu.shape),
+            'dtype': str(datos_cpu.dtype),
+            'errores': registros,
+            'total_errores': total
+        }
+
+        self._escribir_npy(self.ruta_datos, np.ascontiguousarray(datos_cpu))
+        self._escribir_npy(self.ruta_nombres, np.asarray(nombres_servidores, dtype=str))
+
+        temporal = f"{self.ruta_metadatos}.tmp"
+        with open(temporal, 'w', encoding='utf-8') as file:
+            json.dump(metadatos, file)
+        os.replace(temporal, self.ruta_metadatos)
+
+    def cargar(self):
+        """
+        Abre el caché sin copiar la matriz de datos
+
+        Returns:
+            tuple: (datos_cpu como np.memmap de solo lectura, nombres)
+        """
+        datos_cpu = np.load(self.ruta_datos, mmap_mode='r')
+        nombres = np.load(self.ruta_nombres)
+        return datos_cpu, nombres
+
+    def cargar_errores(self):
+        """
+        Retorna los errores de formato registrados al crear el caché
+
+        Returns:
+            tuple: (lista de registros, total de errores)
+        """
+        with open(self.ruta_metadatos, 'r', encoding='utf-8') as file:
+            metadatos = json.load(file)
+        return metadatos.get('errores', []), metadatos.get('total_errores', 0)
+
+    def eliminar(self):
+        """Elimina los archivos del caché si existen"""
+        for ruta in (self.ruta_metadatos, self.ruta_datos, self.ruta_nombres):
+            try:
+                os.remove(ruta)
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _escribir_npy(ruta, array):
+        """Escribe un .npy de forma atómica mediante un archivo temporal"""
+        temporal = f"{ruta}.tmp"
+        with open(temporal, 'wb') as file:
+            np.save(file, array)
+        os.replace(temporal, ruta)
@@ -0,0 +1,121 @@
+"""
+Carga de múltiples archivos de uso de CPU (un archivo por mes y por centro)
+Resuelve directorios o patrones glob, procesa los archivos en paralelo con
+procesos independientes y determina el periodo (mes/año) de cada archivo
+"""
+
+import contextlib
+import glob
+import io
+import os
+import re
+
+from analisis_cpu.models.cache_binario import CacheBinario
+
+MESES = ("enero", "febrero", "marzo", "abril", "mayo", "junio", "julio",
+         "agosto", "septiembre", "octubre", "noviembre", "diciembre")
+
+_PATRON_ANIO = re.compile(r"(?<!\d)((?:19|20)\d{2})(?!\d)")
+
+
+def _tiene_comodines(ruta):
+    """Indica si la ruta contiene comodines glob"""
+    return any(comodin in ruta for comodin in "*?[")
+
+
+def es_origen_multiple(origen):
+    """
+    Indica si el origen de datos es un directorio o un patrón glob
+
+    Args:
+        origen: Ruta a archivo, directorio o patrón glob
+    """
+    return os.path.isdir(origen) or (_tiene_comodines(origen) and not os.path.isfile(origen))
+
+
+def expandir_rutas(origen):
+    """
+    Expande un origen de datos a la lista ordenada de archivos a cargar
+
+    Args:
+        origen: Ruta a archivo, directorio (se toman sus *.txt) o patrón glob
+
+    Returns:
+        list: Rutas de archivos en orden alfabético, sin los archivos del
+              caché binario
+    """
+    if os.path.isdir(origen):
+        rutas = glob.glob(os.path.join(origen, "*.txt"))
+    elif _tiene_comodines(origen):
+        rutas = [ruta for ruta in glob.glob(origen) if os.path.isfile(ruta)]
+    else:
+        return [origen]
+    return sorted(ruta for ruta in rutas if not CacheBinario.es_archivo_cache(ruta))
+
+
+def detectar_periodo(ruta):
+    """
+    Detecta el periodo de un archivo a partir de su nombre, por ejemplo
+    "uso_cpu_junio.txt" o "dc1_uso_cpu_marzo_2025.txt"
+
+    Args:
+        ruta: Ruta del archivo
+
+    Returns:
+        tuple: (año o 0, número de mes 1-12) o None si no se reconoce el mes
+    """
+    nombre = os.path.basename(ruta).lower()
+    mes = next((i + 1 for i, nombre_mes in enumerate(MESES) if nombre_mes in nombre), None)
+    if mes is None:
+        return None
+    coincidencia = _PATRON_ANIO.search(nombre)
+    return (int(coincidencia.group(1)) if coincidencia else 0, mes)
+
+
+def etiqueta_periodo(periodo, ruta):
+    """Retorna el texto con el que se muestra un periodo ("junio", "marzo 2025")"""
+    if periodo is None:
+        return os.path.basename(ruta)
+    anio, mes = periodo
+    return f"{MESES[mes - 1]} {anio}" if anio else MESES[mes - 1]
+
+
+def procesar_archivo(ruta, almacenamiento, usar_cache, max_errores=None):
+    """
+    Procesa un archivo en un proceso trabajador
+
+    Cuando el caché binario está habilitado el trabajador solo devuelve los
+    nombres: la matriz queda en el caché y el proceso principal la abre con
+    memmap, de modo que no se serializan matrices grandes entre procesos.
+
+    Args:
+        ruta: Archivo de datos a procesar
+        almacenamiento: Modo de almacenamiento de CentroDeDatos
+        usar_cache: Si es True la matriz se entrega a través del caché
+        max_errores: Errores de formato tolerados antes de descartar el archivo
+
+    Returns:
+        dict: Resultado con 'ruta', 'nombres', 'datos' (None si va por caché),
+              los errores de formato ('errores', 'total_errores') y 'error'
+              si la carga falló
+    """
+    # Importación diferida: centro_datos importa este módulo
+    from analisis_cpu.models.centro_datos import CentroDeDatos
+
+    centro = CentroDeDatos(almacenamiento=almacenamiento)
+    salida = io.StringIO()
+    with contextlib.redirect_stdout(salida):
+        centro.cargar_datos(ruta, usar_cache=usar_cache, max_errores=max_errores)
+
+    if not centro.datos_cargados:
+        return {'ruta': ruta, 'error': salida.getvalue().strip()}
+
+    por_cache = usar_cache and CacheBinario(ruta).es_valido(centro._datos_crudos.dtype)
+    return {
+        'ruta': ruta,
+        'nombres': [str(nombre) for nombre in centro.nombres_servidores],
+        'datos': None if por_cache else centro._datos_crudos,
+        'errores': centro.errores_carga,
+        'total_errores': centro.total_errores_carga,
+        'error': None
+    }
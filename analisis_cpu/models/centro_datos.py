@@ -0,0 +1,2166 @@
+import contextlib
+import functools
+import os
+import sys
+import threading
+import time
+from fnmatch import fnmatchcase
+from itertools import islice, repeat
+
+import numpy as np
+
+from analisis_cpu.models.archivo_historico import ArchivoHistorico
+from analisis_cpu.models.cache_binario import CacheBinario
+from analisis_cpu.models.carga_multiple import (detectar_periodo, es_origen_multiple, etiqueta_periodo,
+                                       expandir_rutas, procesar_archivo)
+from analisis_cpu.models.resultados import (ResultadoAlertas, ResultadoConsolidacion, ResultadoCorrelaciones,
+                                   ResultadoDiaMayorCarga, ResultadoPercentilesDia, ResultadoPromedios,
+                                   ResultadoRango, ResultadoResumen, ResultadoServidorMenorUso, ResultadoTopServidores,
+                                   ResultadoVentanaMovil)
+from analisis_cpu.utils.calculadora import Calculadora
+from analisis_cpu.utils.consolidacion import Consolidacion
+from analisis_cpu.utils.correlaciones import Correlaciones
+from analisis_cpu.utils.series_tiempo import SeriesTiempo
+
+
+class EstadoDatos:
+    """
+    Instantánea de los datos de un CentroDeDatos: buffers, índice de nombres,
+    periodos, errores de la carga y agregados memorizados. Una instantánea
+    publicada no se modifica; las escrituras preparan una copia y la publican
+    con una sola asignación (ver CentroDeDatos.transaccion). Solo crece su
+    diccionario de agregados, que los lectores completan al calcularlos
+    """
+
+    __slots__ = ('almacenamiento', 'buffer_cpu', 'buffer_nombres', 'indice_nombres', 'periodos',
+                 'memoria_compartida', 'num_servidores', 'num_dias', 'datos_cargados', 'estadisticas_carga',
+                 'errores_carga', 'total_errores_carga', 'agregados', 'version_datos')
+
+    def __init__(self, almacenamiento):
+        """
+        Args:
+            almacenamiento: Modo de almacenamiento (ver CentroDeDatos.ALMACENAMIENTOS)
+        """
+        for campo in self.__slots__:
+            setattr(self, campo, None)
+        self.almacenamiento = almacenamiento
+        self.agregados = {}
+        self.version_datos = 0
+
+    def copia(self):
+        """
+        Retorna una copia sobre la que preparar la siguiente instantánea.
+        Los buffers y el índice de nombres se comparten: una escritura solo
+        agrega filas o días en la reserva (fuera de la parte visible de esta
+        instantánea) o reemplaza el buffer completo; si se descarta,
+        transaccion limpia esa reserva y los nombres agregados. Los agregados
+        se copian para que los que memoricen los lectores de esta no pasen
+        a la nueva
+        """
+        copia = EstadoDatos.__new__(EstadoDatos)
+        for campo in self.__slots__:
+            setattr(copia, campo, getattr(self, campo))
+        copia.agregados = dict(self.agregados)
+        return copia
+
+
+class _EstadoHilo(threading.local):
+    """Instantánea fijada por el hilo actual y si está dentro de una escritura"""
+    estado = None
+    escribiendo = False
+
+
+class _CampoEstado:
+    """Atributo de CentroDeDatos guardado en la instantánea (EstadoDatos)"""
+
+    def __init__(self, campo):
+        self.campo = campo
+
+    def __get__(self, centro, tipo=None):
+        if centro is None:
+            return self
+        return getattr(centro._hilo.estado or centro._publicado, self.campo)
+
+    def __set__(self, centro, valor):
+        if centro._hilo.escribiendo:
+            setattr(centro._hilo.estado, self.campo, valor)
+            return
+        # Fuera de una escritura la asignación es una transacción propia
+        with centro.transaccion():
+            setattr(centro._hilo.estado, self.campo, valor)
+
+
+def _lectura(metodo):
+    """Decorador: el método ve una sola instantánea de principio a fin"""
+    @functools.wraps(metodo)
+    def envoltura(self, *args, **kwargs):
+        hilo = self._hilo
+        if hilo.estado is not None:
+            return metodo(self, *args, **kwargs)
+        hilo.estado = self._publicado
+        try:
+            return metodo(self, *args, **kwargs)
+        finally:
+            hilo.estado = None
+    return envoltura
+
+
+def _escritura(metodo):
+    """Decorador: el método se ejecuta dentro de CentroDeDatos.transaccion"""
+    @functools.wraps(metodo)
+    def envoltura(self, *args, **kwargs):
+        with self.transaccion():
+            return metodo(self, *args, **kwargs)
+    return envoltura
+
+
+class CentroDeDatos:
+    """
+    Clase que carga y analiza el uso de CPU de los servidores
+
+    Puede compartirse entre hilos: los datos viven en una instantánea
+    (EstadoDatos) que las cargas y modificaciones preparan aparte y publican
+    con una sola asignación, serializadas entre sí con un lock. Los lectores
+    no toman locks: cada consulta fija la instantánea publicada al comenzar
+    y nunca ve filas a medio escribir ni nombres de otra carga
+    """
+
+    # Capacidad inicial de los buffers; crecen duplicándose según se necesite
+    CAPACIDAD_INICIAL_SERVIDORES = 32
+    CAPACIDAD_INICIAL_DIAS = 32
+
+    # Líneas leídas y convertidas por bloque durante la carga
+    TAMANO_BLOQUE_CARGA = 8192
+
+    # Rango válido del uso de CPU; fuera de él la celda se marca como ausente
+    RANGO_CPU = (0.0, 100.0)
+
+    # Errores de formato que se conservan con detalle (el total se cuenta aparte)
+    MAX_REGISTROS_ERROR = 1000
+
+    # Modos de almacenamiento: dtype de la matriz y escala para decodificarla.
+    # "centesimas" guarda centésimas de porcentaje como enteros uint16
+    ALMACENAMIENTOS = {
+        "float64": (np.float64, 1.0),
+        "float32": (np.float32, 1.0),
+        "centesimas": (np.uint16, 0.01)
+    }
+
+    # Valor reservado en modo "centesimas" para mediciones ausentes (NaN)
+    CENTESIMAS_AUSENTE = np.iinfo(np.uint16).max
+
+    # Percentiles de la flota calculados para cada día
+    PERCENTILES_FLOTA = (50, 90, 99)
+
+    # Métricas por servidor disponibles para los rankings top/bottom K
+    METRICAS_RANKING = ("promedio", "pico", "p95")
+
+    # Reglas de alerta: uso mayor que un umbral fijo o |z| mayor que un
+    # límite respecto de la media y la desviación del propio servidor
+    REGLAS_ALERTA = ("umbral", "zscore")
+    LIMITES_ALERTA = {"umbral": 90.0, "zscore": 3.0}
+    # Prefijo de origen que indica un segmento de memoria compartida publicado
+    PREFIJO_MEMORIA_COMPARTIDA = "shm://"
+
+    # Celdas a partir de las cuales los agregados por servidor se reparten
+    # entre hilos por bloques de filas (numpy libera el GIL al reducir)
+    MIN_CELDAS_PARALELO = 2 ** 21
+
+    # Pool de hilos compartido por todas las instancias; se crea al usarlo
+    _ejecutor = None
+    _bloqueo_ejecutor = threading.Lock()
+
+    # Datos de la instantánea vigente para el hilo actual (ver EstadoDatos)
+    almacenamiento = _CampoEstado('almacenamiento')
+    num_servidores = _CampoEstado('num_servidores')
+    num_dias = _CampoEstado('num_dias')
+    datos_cargados = _CampoEstado('datos_cargados')
+    periodos = _CampoEstado('periodos')
+    estadisticas_carga = _CampoEstado('estadisticas_carga')
+    errores_carga = _CampoEstado('errores_carga')
+    total_errores_carga = _CampoEstado('total_errores_carga')
+    version_datos = _CampoEstado('version_datos')
+    _buffer_cpu = _CampoEstado('buffer_cpu')
+    _buffer_nombres = _CampoEstado('buffer_nombres')
+    _indice_nombres = _CampoEstado('indice_nombres')
+    _memoria_compartida = _CampoEstado('memoria_compartida')
+    _agregados = _CampoEstado('agregados')
+
+    def __init__(self, backend="numpy", almacenamiento="float64", hilos=None):
+        """
+        Inicializa el centro de datos con buffers numpy redimensionables para
+        almacenar los datos de CPU y nombres de servidores
+
+        Args:
+            backend: Motor de la calculadora ("numpy" o "python" de referencia)
+            almacenamiento: "float64", "float32" o "centesimas" (uint16); en
+                            los modos compactos los nombres se guardan además
+                            con ancho fijo al compactar
+            hilos: Hilos para los agregados por servidor de flotas grandes
+                   (por defecto uno por núcleo; 1 los calcula sin repartir)
+        """
+        if almacenamiento not in self.ALMACENAMIENTOS:
+            raise ValueError(f"Almacenamiento desconocido '{almacenamiento}'. "
+                             f"Opciones: {', '.join(self.ALMACENAMIENTOS)}")
+        if hilos is not None and hilos < 1:
+            raise ValueError("El número de hilos debe ser mayor o igual a 1")
+        self.hilos = hilos or os.cpu_count() or 1
+
+        # Instantánea publicada, la fijada por cada hilo y el lock que
+        # serializa las escrituras (los lectores no lo toman)
+        self._publicado = EstadoDatos(almacenamiento)
+        self._hilo = _EstadoHilo()
+        self._bloqueo_escritura = threading.Lock()
+
+        # Errores de formato tolerados al cargar texto; None es sin límite
+        self.max_errores_carga = None
+
+        self.limpiar()
+        self.calculadora = Calculadora(backend=backend)
+        self.series = SeriesTiempo(backend=backend)
+        self.correlaciones = Correlaciones(backend=backend)
+        self.consolidacion = Consolidacion(backend=backend)
+
+    @property
+    def _estado(self):
+        """Instantánea fijada por el hilo (consulta o escritura en curso) o la publicada"""
+        return self._hilo.estado or self._publicado
+
+    @contextlib.contextmanager
+    def instantanea(self):
+        """
+        Fija la instantánea publicada para el hilo actual durante el bloque,
+        de modo que varias consultas seguidas ven los mismos datos aunque
+        otro hilo recargue mientras tanto. No bloquea a nadie
+
+        Yields:
+            EstadoDatos: La instantánea fijada
+        """
+        hilo = self._hilo
+        if hilo.estado is not None:
+            yield hilo.estado
+            return
+        hilo.estado = self._publicado
+        try:
+            yield hilo.estado
+        finally:
+            hilo.estado = None
+
+    @contextlib.contextmanager
+    def transaccion(self):
+        """
+        Agrupa modificaciones: se aplican a una copia de la instantánea
+        publicada y se publican juntas, con una sola asignación, al salir del
+        bloque. Si el bloque lanza una excepción no se publica nada. Las
+        escrituras se serializan entre sí; los lectores siguen con la
+        instantánea anterior sin esperar
+        """
+        hilo = self._hilo
+        if hilo.escribiendo:
+            yield
+            return
+        with self._bloqueo_escritura:
+            anterior = hilo.estado
+            hilo.estado, hilo.escribiendo = self._publicado.copia(), True
+            try:
+                yield
+            except BaseException:
+                self._restaurar_reserva(hilo.estado)
+                raise
+            else:
+                self._publicado = hilo.estado
+            finally:
+                hilo.estado, hilo.escribiendo = anterior, False
+
+    def _restaurar_reserva(self, descartado):
+        """
+        Deja como ausentes las celdas de reserva del buffer publicado que
+        una escritura descartada pudo haber usado, y quita del índice de
+        nombres compartido las filas que agregó, para que una escritura
+        posterior no las encuentre con valores ni con nombres ajenos
+        """
+        publicado = self._publicado
+        indice = publicado.indice_nombres
+        if indice is not None and descartado.indice_nombres is indice:
+            limite = publicado.num_servidores
+            for nombre in [nombre for nombre, fila in indice.items() if fila >= limite]:
+                del indice[nombre]
+
+        buffer_cpu = publicado.buffer_cpu
+        if buffer_cpu is None or descartado.buffer_cpu is not buffer_cpu or not buffer_cpu.flags.writeable:
+            return
+        ausente = self._valor_ausente
+        buffer_cpu[publicado.num_servidores:] = ausente
+        buffer_cpu[:publicado.num_servidores, publicado.num_dias:] = ausente
+
+    @property
+    def _dtype_cpu(self):
+        """dtype de la matriz según el modo de almacenamiento"""
+        return self.ALMACENAMIENTOS[self.almacenamiento][0]
+
+    @property
+    def _escala(self):
+        """Escala que lleva los valores almacenados a porcentaje"""
+        return self.ALMACENAMIENTOS[self.almacenamiento][1]
+
+    @property
+    def compacto(self):
+        """Indica si se usa un modo de almacenamiento compacto"""
+        return self.almacenamiento != "float64"
+
+    @property
+    def _datos_crudos(self):
+        """Vista de la parte ocupada del buffer en su dtype de almacenamiento"""
+        estado = self._estado
+        return estado.buffer_cpu[:estado.num_servidores, :estado.num_dias]
+
+    @property
+    @_lectura
+    def datos_cpu(self):
+        """
+        Matriz (servidores x días) con el uso de CPU en porcentaje. Es una
+        vista del buffer salvo en modo "centesimas", donde se decodifica
+        """
+        return self._decodificar(self._datos_crudos)
+
+    def _codificar(self, valores):
+        """Convierte porcentajes al dtype de almacenamiento"""
+        valores = np.asarray(valores, dtype=np.float64)
+        if self._escala == 1.0:
+            return valores.astype(self._dtype_cpu)
+
+        ausentes = np.isnan(valores)
+        centesimas = np.clip(np.rint(np.where(ausentes, 0.0, valores) / self._escala),
+                             0, self.CENTESIMAS_AUSENTE - 1)
+        centesimas[ausentes] = self.CENTESIMAS_AUSENTE
+        return centesimas.astype(self._dtype_cpu)
+
+    @property
+    def _valor_ausente(self):
+        """Valor almacenado para una medición ausente (NaN o el centinela)"""
+        return self._codificar([np.nan])[0]
+
+    def _decodificar(self, crudos):
+        """
+        Convierte valores almacenados a porcentajes. El dtype indica el modo
+        de almacenamiento, así que no depende de la instantánea vigente
+        """
+        if crudos.dtype.kind == 'f':
+            return crudos
+        valores = crudos * np.float32(self.ALMACENAMIENTOS["centesimas"][1])
+        valores[crudos == self.CENTESIMAS_AUSENTE] = np.nan
+        return valores
+
+    def _matriz_agregados(self):
+        """
+        Retorna la matriz sobre la que se calculan los agregados y si el
+        resultado debe escalarse. En modo "centesimas" con mediciones
+        ausentes se decodifica para que los NaN se ignoren
+        """
+        crudos = self._datos_crudos
+        if self._escala != 1.0 and (crudos == self.CENTESIMAS_AUSENTE).any():
+            return self._decodificar(crudos), False
+        return crudos, True
+
+    def _agregado_por_eje(self, metodo, eje):
+        """Aplica un método por eje de la calculadora y lleva el resultado a porcentaje"""
+        matriz, escalar = self._matriz_agregados()
+        if eje == 1:
+            resultado = self._por_bloques_de_filas(lambda inicio, fin: metodo(matriz[inicio:fin], eje=1),
+                                                   matriz.shape[0], matriz.size)
+        else:
+            resultado = metodo(matriz, eje=eje)
+        return self._escalar(resultado) if escalar else resultado
+
+    @classmethod
+    def _obtener_ejecutor(cls):
+        """Retorna el pool de hilos compartido, creándolo la primera vez"""
+        with cls._bloqueo_ejecutor:
+            if cls._ejecutor is None:
+                # Importación diferida: solo las flotas grandes usan el pool
+                from concurrent.futures import ThreadPoolExecutor
+                cls._ejecutor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                                   thread_name_prefix="centro-datos")
+            return cls._ejecutor
+
+    def _por_bloques_de_filas(self, calcular, filas, celdas):
+        """
+        Calcula un resultado por servidor repartiendo bloques contiguos de
+        filas entre los hilos del pool cuando la flota es grande y el motor
+        es numpy; los bloques se concatenan en el orden de las filas. Cada
+        hilo fija la misma instantánea que el hilo que llama
+
+        Args:
+            calcular: Función (inicio, fin) -> array con un valor por fila en
+                      su último eje, o tupla de arrays así
+            filas: Número de filas (servidores)
+            celdas: Celdas que se recorren, para decidir si conviene repartir
+
+        Returns:
+            El resultado de calcular(0, filas)
+        """
+        bloques = min(self.hilos, filas)
+        if bloques < 2 or celdas < self.MIN_CELDAS_PARALELO or not self.calculadora.vectorizada:
+            return calcular(0, filas)
+
+        estado = self._estado
+
+        def calcular_bloque(inicio, fin):
+            self._hilo.estado = estado
+            try:
+                return calcular(inicio, fin)
+            finally:
+                self._hilo.estado = None
+
+        limites = np.linspace(0, filas, bloques + 1).astype(np.intp)
+        partes = list(self._obtener_ejecutor().map(calcular_bloque, limites[:-1], limites[1:]))
+        if isinstance(partes[0], tuple):
+            return tuple(np.concatenate(componentes, axis=-1) for componentes in zip(*partes))
+        return np.concatenate(partes, axis=-1)
+
+    def _escalar(self, resultado):
+        """Lleva a porcentaje un agregado calculado sobre los datos crudos"""
+        if self._escala == 1.0:
+            return resultado
+        if isinstance(resultado, tuple):
+            indices, valores = resultado
+            return indices, valores * self._escala
+        return resultado * self._escala
+
+    @property
+    def nombres_servidores(self):
+        """Vista de los nombres de los servidores cargados"""
+        estado = self._estado
+        return estado.buffer_nombres[:estado.num_servidores]
+
+    def _asegurar_capacidad(self, filas, columnas):
+        """
+        Garantiza que los buffers tengan al menos filas x columnas,
+        duplicando la capacidad para que agregar sea O(1) amortizado
+
+        Args:
+            filas: Número de servidores requeridos
+            columnas: Número de días requeridos
+        """
+        cap_filas, cap_columnas = self._buffer_cpu.shape
+        if filas <= cap_filas and columnas <= cap_columnas:
+            return
+
+        # Un buffer recortado a cero filas o días (carga vacía) no crece al duplicarse
+        nuevas_filas = max(cap_filas, 1)
+        while nuevas_filas < filas:
+            nuevas_filas *= 2
+        nuevas_columnas = max(cap_columnas, 1)
+        while nuevas_columnas < columnas:
+            nuevas_columnas *= 2
+
+        # Las celdas nuevas quedan ausentes: una fila corta no se completa con ceros
+        nuevo_cpu = np.full((nuevas_filas, nuevas_columnas), self._valor_ausente, dtype=self._buffer_cpu.dtype)
+        nuevo_cpu[:self.num_servidores, :self.num_dias] = self._datos_crudos
+        self._buffer_cpu = nuevo_cpu
+
+        if nuevas_filas != cap_filas:
+            nuevos_nombres = np.empty(nuevas_filas, dtype=object)
+            nuevos_nombres[:self.num_servidores] = self.nombres_servidores
+            self._buffer_nombres = nuevos_nombres
+
+    @_escritura
+    def agregar_servidor(self, nombre, valores):
+        """
+        Agrega un servidor al final de la matriz, ampliando los días si
+        la serie recibida es más larga que las existentes
+
+        Args:
+            nombre: Nombre del servidor
+            valores: Secuencia con el uso de CPU por día
+
+        Returns:
+            int: Índice de la fila asignada al servidor
+        """
+        fila = self.num_servidores
+        codificados = self._codificar(valores)
+        self._asegurar_capacidad(fila + 1, max(self.num_dias, len(valores)))
+
+        self._buffer_nombres[fila] = nombre
+        if self.indice_servidor(nombre) is None:
+            self._indice_nombres[nombre] = fila
+        self._buffer_cpu[fila, :len(valores)] = codificados
+        self.num_servidores += 1
+        self.num_dias = max(self.num_dias, len(valores))
+        self.invalidar_agregados()
+        return fila
+
+    @_escritura
+    def compactar(self):
+        """
+        Recorta los buffers a la forma real de los datos para que la memoria
+        sea proporcional a lo cargado. En los modos compactos los nombres
+        pasan a un array de ancho fijo
+        """
+        self._buffer_cpu = self._datos_crudos.copy()
+        if self.compacto and self.num_servidores:
+            self._buffer_nombres = self.nombres_servidores.astype(str)
+        else:
+            self._buffer_nombres = self.nombres_servidores.copy()
+
+    @_escritura
+    def congelar(self):
+        """
+        Marca la matriz y los nombres como de solo lectura para compartirlos
+        entre lectores concurrentes sin copias; cualquier intento posterior
+        de modificarlos falla en lugar de alterar datos que otro lector usa
+        """
+        self._buffer_cpu.flags.writeable = False
+        self._buffer_nombres.flags.writeable = False
+
+    @_escritura
+    def limpiar(self):
+        """Descarta los datos cargados y reinicia los buffers"""
+        # Buffers con capacidad de reserva; solo la parte ocupada es visible
+        self._buffer_cpu = np.full((self.CAPACIDAD_INICIAL_SERVIDORES, self.CAPACIDAD_INICIAL_DIAS),
+                                   self._valor_ausente, dtype=self._dtype_cpu)
+        self._buffer_nombres = np.empty(self.CAPACIDAD_INICIAL_SERVIDORES, dtype=object)
+
+        # Índice nombre -> fila; ante nombres repetidos gana la primera fila
+        self._indice_nombres = {}
+
+        # Periodos (meses) que componen el eje de días, si se conocen
+        self.periodos = []
+
+        # Segmento de memoria compartida del que son vista los buffers, si lo hay
+        self._memoria_compartida = None
+
+        self.num_servidores = 0
+        self.num_dias = 0
+        self.datos_cargados = False
+        self.estadisticas_carga = None
+
+        # Errores de formato de la última carga: registros {'linea', 'columna',
+        # 'motivo'} (hasta MAX_REGISTROS_ERROR) y su total
+        self.errores_carga = []
+        self.total_errores_carga = 0
+        self.invalidar_agregados()
+
+    def _registrar_error(self, linea, columna, motivo):
+        """
+        Anota un error de formato de la carga
+
+        Args:
+            linea: Número de línea del archivo (base 1)
+            columna: Día de la celda (base 1); 0 si afecta a la línea
+            motivo: Descripción del problema
+        """
+        self.total_errores_carga += 1
+        if len(self.errores_carga) < self.MAX_REGISTROS_ERROR:
+            self.errores_carga.append({'linea': int(linea), 'columna': int(columna), 'motivo': motivo})
+
+    @staticmethod
+    def _convertir_campos(campos, longitudes, invalidos):
+        """
+        Convierte campos de texto a float64 sin abortar por valores inválidos.
+        Intenta la conversión de todo el bloque; si falla convierte línea a
+        línea y solo las líneas con errores se recorren campo a campo, de modo
+        que un bloque con algunos errores cuesta poco más que uno limpio.
+        El texto "nan" se convierte sin error, pero se anota como no numérico
+
+        Args:
+            campos: Lista de textos de todas las filas del bloque
+            longitudes: Número de campos de cada fila
+            invalidos: Lista donde se agregan (posición, motivo) de cada campo inválido
+
+        Returns:
+            numpy.ndarray: Valores convertidos, con NaN en los campos inválidos
+        """
+        registrados = len(invalidos)
+        try:
+            valores = np.array(campos, dtype=np.float64)
+        except ValueError:
+            valores = np.empty(len(campos))
+            inicio = 0
+            for longitud in longitudes:
+                fin = inicio + longitud
+                try:
+                    valores[inicio:fin] = np.array(campos[inicio:fin], dtype=np.float64)
+                except ValueError:
+                    for posicion in range(inicio, fin):
+                        campo = campos[posicion]
+                        try:
+                            valores[posicion] = float(campo)
+                        except ValueError:
+                            valores[posicion] = np.nan
+                            motivo = "valor vacío" if not campo.strip() else f"valor no numérico '{campo.strip()}'"
+                            invalidos.append((posicion, motivo))
+                inicio = fin
+
+        # Un NaN que no corresponde a un campo ya anotado venía del texto "nan"
+        anotados = {posicion for posicion, _ in invalidos[registrados:]}
+        invalidos.extend((posicion, f"valor no numérico '{campos[posicion].strip()}'")
+                         for posicion in np.flatnonzero(np.isnan(valores)).tolist() if posicion not in anotados)
+        invalidos[registrados:] = sorted(invalidos[registrados:])
+        return valores
+
+    def _procesar_bloque(self, lineas, primera_linea=1, filas_leidas=None):
+        """
+        Convierte un bloque de líneas "Servidor;v1;v2;..." en una sola
+        operación numpy y lo escribe directamente en los buffers. Los valores
+        vacíos, no numéricos o fuera de RANGO_CPU quedan como ausentes (NaN)
+        y se anotan en errores_carga
+
+        Args:
+            lineas: Lista de líneas de texto del archivo
+            primera_linea: Número de línea (base 1) de lineas[0]
+            filas_leidas: Lista donde agregar (números de línea, longitudes)
+                          de las filas del bloque, para revisar filas cortas
+
+        Returns:
+            int: Número de servidores agregados
+        """
+        nombres = []
+        campos = []
+        longitudes = []
+        numeros = []
+
+        for numero, linea in enumerate(lineas, primera_linea):
+            linea = linea.strip()
+            if linea:
+                nombre, _, resto = linea.partition(';')
+                valores = resto.split(';') if resto else []
+                nombres.append(nombre)
+                campos.extend(valores)
+                longitudes.append(len(valores))
+                numeros.append(numero)
+
+        if not nombres:
+            return 0
+
+        # Conversión de texto a float de todo el bloque a la vez
+        invalidos = []
+        valores = self._convertir_campos(campos, longitudes, invalidos)
+        minimo, maximo = self.RANGO_CPU
+        fuera_de_rango = np.flatnonzero((valores < minimo) | (valores > maximo))
+        if fuera_de_rango.size:
+            invalidos.extend((posicion, f"fuera de rango ({valores[posicion]:g})") for posicion in fuera_de_rango)
+            valores[fuera_de_rango] = np.nan
+
+        longitudes = np.array(longitudes, dtype=np.intp)
+        numeros = np.array(numeros, dtype=np.intp)
+        if filas_leidas is not None:
+            filas_leidas.append((numeros, longitudes))
+        if invalidos:
+            inicios = np.cumsum(longitudes) - longitudes
+            posiciones = np.array([posicion for posicion, _ in invalidos], dtype=np.intp)
+            filas = np.searchsorted(inicios, posiciones, side='right') - 1
+            for fila, posicion, (_, motivo) in zip(filas, posiciones, invalidos):
+                self._registrar_error(numeros[fila], posicion - inicios[fila] + 1, motivo)
+
+        valores = self._codificar(valores)
+
+        fila_inicial = self.num_servidores
+        filas_bloque = len(nombres)
+        max_dias = int(longitudes.max())
+        self._asegurar_capacidad(fila_inicial + filas_bloque, max(self.num_dias, max_dias))
+
+        self._buffer_nombres[fila_inicial:fila_inicial + filas_bloque] = nombres
+        indice = self._indice_nombres
+        for desplazamiento, nombre in enumerate(nombres):
+            indice.setdefault(nombre, fila_inicial + desplazamiento)
+        if (longitudes == max_dias).all():
+            # Caso habitual: todas las filas tienen el mismo número de días
+            self._buffer_cpu[fila_inicial:fila_inicial + filas_bloque, :max_dias] = \
+                valores.reshape(filas_bloque, max_dias)
+        else:
+            # Filas de distinta longitud: dispersar con índices calculados
+            filas = np.repeat(np.arange(filas_bloque), longitudes) + fila_inicial
+            inicios = np.cumsum(longitudes) - longitudes
+            columnas = np.arange(len(valores)) - np.repeat(inicios, longitudes)
+            self._buffer_cpu[filas, columnas] = valores
+
+        self.num_servidores += filas_bloque
+        self.num_dias = max(self.num_dias, max_dias)
+        self.invalidar_agregados()
+        return filas_bloque
+
+    def _revisar_filas_cortas(self, filas_leidas):
+        """
+        Anota como error cada fila con menos días que la matriz; sus días
+        faltantes ya están ausentes porque los buffers se crean con NaN
+
+        Args:
+            filas_leidas: Lista de (números de línea, longitudes) por bloque
+        """
+        for numeros, longitudes in filas_leidas:
+            for fila in np.flatnonzero(longitudes < self.num_dias):
+                faltantes = self.num_dias - longitudes[fila]
+                self._registrar_error(numeros[fila], longitudes[fila] + 1,
+                                      f"faltan {faltantes} valor{'es' if faltantes > 1 else ''}")
+
+    def _verificar_presupuesto_errores(self, max_errores):
+        """Lanza ValueError si los errores de formato superan el máximo tolerado"""
+        if max_errores is not None and self.total_errores_carga > max_errores:
+            raise ValueError(f"{self.total_errores_carga} errores de formato superan el máximo "
+                             f"tolerado ({max_errores})")
+
+    def _mostrar_errores_carga(self, cantidad=5):
+        """Informa el total de errores de formato y los primeros registros"""
+        if not self.total_errores_carga:
+            return
+        print(f"- Errores de formato: {self.total_errores_carga} (las celdas afectadas quedan como ausentes)")
+        for error in self.errores_carga[:cantidad]:
+            origen = f"{error['archivo']}, " if 'archivo' in error else ""
+            print(f"  {origen}línea {error['linea']}, columna {error['columna']}: {error['motivo']}")
+        if self.total_errores_carga > cantidad:
+            print(f"  ... y {self.total_errores_carga - cantidad} más")
+
+    def _indexar_nombres(self):
+        """Reconstruye el índice nombre -> fila de los nombres cargados"""
+        indice = {}
+        for fila, nombre in enumerate(self.nombres_servidores):
+            indice.setdefault(nombre, fila)
+        self._indice_nombres = indice
+
+    def _cargar_desde_cache(self, cache):
+        """
+        Abre la matriz del caché binario como memmap de solo lectura;
+        la matriz no se copia hasta que se agreguen datos
+
+        Args:
+            cache: Instancia de CacheBinario válida
+        """
+        datos_cpu, nombres = cache.cargar()
+        self.limpiar()
+        self._buffer_cpu = datos_cpu
+        self._buffer_nombres = nombres if self.compacto else nombres.astype(object)
+        self.num_servidores, self.num_dias = datos_cpu.shape
+        self._indexar_nombres()
+
+    @_lectura
+    def publicar_memoria_compartida(self, nombre=None):
+        """
+        Copia la matriz y los nombres a un segmento de memoria compartida
+        para que otros procesos los adjunten sin procesar el archivo ni
+        duplicar la memoria
+
+        Args:
+            nombre: Nombre del segmento; None para que el sistema elija uno
+
+        Returns:
+            MemoriaCompartida: Segmento publicado; el proceso que publica es
+                               su propietario y debe llamar a liberar()
+        """
+        if not self.datos_cargados:
+            raise ValueError("No hay datos cargados para publicar")
+        # Importación diferida: multiprocessing solo hace falta al compartir
+        from analisis_cpu.models.memoria_compartida import MemoriaCompartida
+        metadatos = {'almacenamiento': self.almacenamiento, 'periodos': self.periodos}
+        return MemoriaCompartida.publicar(self._datos_crudos, self.nombres_servidores,
+                                          metadatos, nombre=nombre)
+
+    @_escritura
+    def adjuntar_memoria_compartida(self, nombre):
+        """
+        Usa como datos un segmento publicado por otro proceso. La matriz es
+        una vista de solo lectura del segmento, sin copia; el modo de
+        almacenamiento pasa a ser el del segmento. Agregar días después
+        copia la matriz a memoria propia como con el caché binario
+
+        Args:
+            nombre: Nombre del segmento publicado
+        """
+        from analisis_cpu.models.memoria_compartida import MemoriaCompartida
+
+        inicio = time.perf_counter()
+        try:
+            segmento = MemoriaCompartida.adjuntar(nombre)
+        except FileNotFoundError:
+            print(f"Error: No existe el segmento de memoria compartida '{nombre}'")
+            return
+        except ValueError as e:
+            print(f"Error al adjuntar la memoria compartida: {e}")
+            return
+
+        almacenamiento = segmento.cabecera.get('almacenamiento', self.almacenamiento)
+        if almacenamiento in self.ALMACENAMIENTOS:
+            self.almacenamiento = almacenamiento
+
+        self.limpiar()
+        self._memoria_compartida = segmento
+        self._buffer_cpu = segmento.datos
+        self._buffer_nombres = segmento.nombres if self.compacto else segmento.nombres.astype(object)
+        self.num_servidores, self.num_dias = segmento.datos.shape
+        self._indexar_nombres()
+        self.periodos = segmento.cabecera.get('periodos', [])
+        self.datos_cargados = True
+        duracion = self._registrar_carga(inicio, desde_cache=True)
+        print(f"Datos adjuntados desde la memoria compartida '{nombre}' ({duracion * 1000:.1f} ms):")
+        print(f"- Array de datos CPU: {self._datos_crudos.shape}")
+        print(f"- Array de nombres: {self.nombres_servidores.shape}")
+
+    @_lectura
+    def guardar_archivo_historico(self, ruta, compresion="zlib"):
+        """
+        Guarda los datos en un archivo histórico comprimido: centésimas por
+        bloques, codificadas como diferencias entre días y comprimidas con
+        zlib o lzma, con un índice para leer servidores o días sueltos
+
+        Args:
+            ruta: Ruta del archivo a crear
+            compresion: "zlib" (rápido) o "lzma" (más compacto)
+
+        Returns:
+            int: Tamaño del archivo en bytes
+        """
+        if not self.datos_cargados:
+            raise ValueError("No hay datos cargados para archivar")
+        if self.almacenamiento == "centesimas":
+            centesimas = self._datos_crudos
+        else:
+            centesimas = ArchivoHistorico.a_centesimas(self.datos_cpu)
+        return ArchivoHistorico.escribir(ruta, centesimas, self.nombres_servidores, self.periodos, compresion)
+
+    @_escritura
+    def cargar_archivo_historico(self, ruta):
+        """
+        Carga todos los datos de un archivo histórico comprimido. Para leer
+        solo un servidor o unos días basta con ArchivoHistorico(ruta)
+
+        Args:
+            ruta: Ruta al archivo histórico
+        """
+        inicio = time.perf_counter()
+        try:
+            with ArchivoHistorico(ruta) as archivo:
+                centesimas = archivo.leer_centesimas()
+                nombres, periodos = archivo.nombres, archivo.periodos
+        except (OSError, ValueError) as e:
+            self.limpiar()
+            print(f"Error al leer el archivo histórico: {e}")
+            return
+
+        self.limpiar()
+        if self.almacenamiento == "centesimas":
+            self._buffer_cpu = centesimas
+        else:
+            self._buffer_cpu = ArchivoHistorico.a_porcentajes(centesimas).astype(self._dtype_cpu)
+        self._buffer_nombres = nombres if self.compacto else nombres.astype(object)
+        self.num_servidores, self.num_dias = centesimas.shape
+        self._indexar_nombres()
+        self.periodos = periodos
+        self.datos_cargados = True
+        duracion = self._registrar_carga(inicio, desde_cache=True)
+        print(f"Datos cargados desde el archivo histórico ({duracion:.3f} s):")
+        print(f"- Array de datos CPU: {self._datos_crudos.shape}")
+        print(f"- Array de nombres: {self.nombres_servidores.shape}")
+
+    @_escritura
+    def invalidar_agregados(self):
+        """
+        Descarta los agregados memorizados; se llama en cada operación que
+        modifica o recarga la matriz. Si se modifica datos_cpu directamente
+        debe llamarse manualmente. La instantánea anterior conserva los suyos
+        """
+        self._agregados = {}
+        self.version_datos += 1
+
+    def _agregado(self, clave, calcular):
+        """
+        Retorna un agregado memorizado, calculándolo la primera vez
+
+        Args:
+            clave: Nombre del agregado
+            calcular: Función sin argumentos que produce el valor
+
+        Returns:
+            El valor memorizado (los arrays se marcan de solo lectura)
+        """
+        agregados = self._agregados
+        if clave not in agregados:
+            valor = calcular()
+            for array in (valor if isinstance(valor, tuple) else (valor,)):
+                if isinstance(array, np.ndarray):
+                    array.flags.writeable = False
+            # Si otro lector lo calculó a la vez, todos usan el primero
+            return agregados.setdefault(clave, valor)
+        return agregados[clave]
+
+    @_lectura
+    def promedios_por_servidor(self):
+        """Retorna el promedio de uso de cada servidor (memorizado)"""
+        return self._agregado('promedios_servidor', lambda: self._agregado_por_eje(
+            self.calculadora.calcular_promedio_por_eje, eje=1))
+
+    @_lectura
+    def sumas_por_servidor(self):
+        """Retorna la suma de uso de cada servidor (memorizada)"""
+        return self._agregado('sumas_servidor', lambda: self._agregado_por_eje(
+            self.calculadora.calcular_suma_por_eje, eje=1))
+
+    def _conteos_por_servidor(self):
+        """Retorna cuántas mediciones válidas (no NaN) tiene cada servidor"""
+        def calcular():
+            matriz, _ = self._matriz_agregados()
+            if np.issubdtype(matriz.dtype, np.floating):
+                return self._por_bloques_de_filas(
+                    lambda inicio, fin: matriz.shape[1] - np.isnan(matriz[inicio:fin]).sum(axis=1),
+                    matriz.shape[0], matriz.size)
+            return np.full(matriz.shape[0], matriz.shape[1])
+        return self._agregado('conteos_servidor', calcular)
+
+    @_lectura
+    def sumas_por_dia(self):
+        """Retorna la carga total de cada día (memorizada)"""
+        return self._agregado('sumas_dia', lambda: self._agregado_por_eje(
+            self.calculadora.calcular_suma_por_eje, eje=0))
+
+    @_lectura
+    def maximos_por_servidor(self):
+        """Retorna (índices de día, valores) del máximo de cada servidor"""
+        return self._agregado('maximos_servidor', lambda: self._agregado_por_eje(
+            self.calculadora.encontrar_maximo_por_eje, eje=1))
+
+    @_lectura
+    def minimos_por_servidor(self):
+        """Retorna (índices de día, valores) del mínimo de cada servidor"""
+        return self._agregado('minimos_servidor', lambda: self._agregado_por_eje(
+            self.calculadora.encontrar_minimo_por_eje, eje=1))
+
+    @_lectura
+    def maximos_por_dia(self):
+        """Retorna (índices de servidor, valores) del máximo de cada día"""
+        return self._agregado('maximos_dia', lambda: self._agregado_por_eje(
+            self.calculadora.encontrar_maximo_por_eje, eje=0))
+
+    @_lectura
+    def minimos_por_dia(self):
+        """Retorna (índices de servidor, valores) del mínimo de cada día"""
+        return self._agregado('minimos_dia', lambda: self._agregado_por_eje(
+            self.calculadora.encontrar_minimo_por_eje, eje=0))
+
+    @_lectura
+    def percentiles_por_dia(self):
+        """
+        Retorna los PERCENTILES_FLOTA de cada día sobre todos los servidores
+        (memorizados), como matriz (percentiles x días)
+        """
+        return self._agregado('percentiles_dia', lambda: self._agregado_por_eje(
+            lambda matriz, eje: self.calculadora.calcular_percentiles_por_eje(
+                matriz, self.PERCENTILES_FLOTA, eje=eje), eje=0))
+
+    @_lectura
+    def p95_por_servidor(self):
+        """Retorna el percentil 95 del uso de cada servidor (memorizado)"""
+        return self._agregado('p95_servidor', lambda: self._agregado_por_eje(
+            lambda matriz, eje: self.calculadora.calcular_percentiles_por_eje(matriz, (95,), eje=eje)[0],
+            eje=1))
+
+    @_lectura
+    def desviaciones_por_servidor(self):
+        """Retorna la desviación estándar poblacional de cada servidor (memorizada)"""
+        def calcular():
+            crudos = self._datos_crudos
+            promedios = self.promedios_por_servidor()
+            conteos = self._conteos_por_servidor()
+
+            def calcular_filas(primera, ultima):
+                desviaciones = np.empty(ultima - primera)
+                # Por bloques de filas para no crear temporales del tamaño de la matriz
+                for inicio in range(primera, ultima, self.TAMANO_BLOQUE_CARGA):
+                    fin = min(inicio + self.TAMANO_BLOQUE_CARGA, ultima)
+                    desvios = self._decodificar(crudos[inicio:fin]) - promedios[inicio:fin, np.newaxis]
+                    ausentes = np.isnan(desvios)
+                    if ausentes.any():
+                        desvios[ausentes] = 0.0
+                    cuadrados = np.einsum('ij,ij->i', desvios, desvios)
+                    with np.errstate(invalid='ignore', divide='ignore'):
+                        desviaciones[inicio - primera:fin - primera] = np.sqrt(cuadrados / conteos[inicio:fin])
+                return desviaciones
+
+            return self._por_bloques_de_filas(calcular_filas, crudos.shape[0], crudos.size)
+        return self._agregado('desviaciones_servidor', calcular)
+
+    @_lectura
+    def valores_por_servidor(self, metrica):
+        """
+        Retorna el valor de una métrica de METRICAS_RANKING para cada servidor
+
+        Args:
+            metrica: "promedio", "pico" (máximo) o "p95"
+
+        Returns:
+            np.ndarray: Un valor por servidor
+        """
+        if metrica == "promedio":
+            return self.promedios_por_servidor()
+        if metrica == "pico":
+            return self.maximos_por_servidor()[1]
+        if metrica == "p95":
+            return self.p95_por_servidor()
+        raise ValueError(f"Métrica desconocida '{metrica}'. Opciones: {', '.join(self.METRICAS_RANKING)}")
+
+    @_lectura
+    def calcular_ventana_movil(self, operacion, ventana, filas=slice(None)):
+        """
+        Calcula una operación de ventana móvil sobre los días para todos los
+        servidores (o las filas indicadas) en O(servidores x días)
+
+        Args:
+            operacion: Una de SeriesTiempo.OPERACIONES ("promedio", "maximo", ...)
+            ventana: Número de días de cada ventana
+            filas: Selección de filas (slice, índices o máscara)
+
+        Returns:
+            np.ndarray: Matriz (servidores x (días - ventana + 1)); la
+                        columna j corresponde a la ventana que termina en el
+                        día j + ventana - 1
+        """
+        return self.series.calcular(operacion, self._decodificar(self._datos_crudos[filas]), ventana)
+
+    @_lectura
+    def diferencias_diarias(self, filas=slice(None)):
+        """Retorna la diferencia de cada día con el anterior por servidor"""
+        return self.series.diferencias_diarias(self._decodificar(self._datos_crudos[filas]))
+
+    @_escritura
+    def agregar_dia(self, valores, archivo=None):
+        """
+        Agrega una nueva columna (día) con una medición por servidor y
+        actualiza de forma incremental los agregados ya calculados, de modo
+        que el costo es O(servidores) y no O(servidores x días)
+
+        Args:
+            valores: Secuencia alineada con las filas (NaN = sin medición)
+            archivo: Si se indica, la columna se agrega también al archivo de
+                     texto de origen y se regenera su caché binario
+
+        Returns:
+            int: Índice (base 0) del día agregado
+        """
+        columna = np.asarray(valores, dtype=np.float64)
+        if columna.shape != (self.num_servidores,):
+            raise ValueError(f"Se esperaban {self.num_servidores} valores y se recibieron {columna.size}")
+
+        # El promedio incremental necesita los conteos previos a la columna
+        if 'promedios_servidor' in self._agregados:
+            self._conteos_por_servidor()
+
+        dia = self.num_dias
+        self._asegurar_capacidad(self.num_servidores, dia + 1)
+        self._buffer_cpu[:self.num_servidores, dia] = self._codificar(columna)
+        self.num_dias += 1
+        if self.periodos:
+            # Lista nueva: la instantánea anterior conserva la suya
+            self.periodos = self.periodos[:-1] + [dict(self.periodos[-1], dias=self.periodos[-1]['dias'] + 1)]
+        self.datos_cargados = True
+
+        # Trabajar con la columna tal como quedó almacenada
+        columna = self._decodificar(self._datos_crudos[:, dia]).astype(np.float64)
+        self._actualizar_agregados_con_dia(columna, dia)
+
+        if archivo is not None:
+            self._anexar_columna_en_archivo(archivo, columna)
+        return dia
+
+    @_escritura
+    def agregar_mediciones(self, mediciones, archivo=None):
+        """
+        Agrega un día a partir de un diccionario {nombre_servidor: valor}.
+        Los servidores sin medición quedan en NaN y los desconocidos se
+        agregan como nuevas filas sin historia
+
+        Args:
+            mediciones: Diccionario con el uso de CPU del día por servidor
+            archivo: Igual que en agregar_dia
+
+        Returns:
+            int: Índice (base 0) del día agregado
+        """
+        for nombre in mediciones:
+            if self.indice_servidor(nombre) is None:
+                self.agregar_servidor(nombre, np.full(self.num_dias, np.nan))
+
+        columna = np.full(self.num_servidores, np.nan)
+        for nombre, valor in mediciones.items():
+            columna[self.indice_servidor(nombre)] = valor
+        return self.agregar_dia(columna, archivo=archivo)
+
+    def _actualizar_agregados_con_dia(self, columna, dia):
+        """
+        Actualiza los agregados memorizados con una columna nueva en lugar
+        de descartarlos; los que no saben actualizarse se descartan
+
+        Args:
+            columna: Valores del nuevo día en porcentaje (float64, NaN = ausente)
+            dia: Índice del nuevo día
+        """
+        anteriores = self._agregados
+        validos = ~np.isnan(columna)
+        valores = np.where(validos, columna, 0.0)
+        nuevos = {}
+
+        if 'indice_ordenado' in anteriores:
+            nuevos['indice_ordenado'] = anteriores['indice_ordenado']
+        if 'sumas_dia' in anteriores:
+            nuevos['sumas_dia'] = np.append(anteriores['sumas_dia'], self.calculadora.calcular_suma(columna))
+        if 'sumas_servidor' in anteriores:
+            nuevos['sumas_servidor'] = anteriores['sumas_servidor'] + valores
+        if 'conteos_servidor' in anteriores:
+            conteos = anteriores['conteos_servidor']
+            nuevos['conteos_servidor'] = conteos + validos
+            if 'promedios_servidor' in anteriores:
+                promedios = anteriores['promedios_servidor']
+                suma_previa = np.where(conteos > 0, promedios * conteos, 0.0)
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    nuevos['promedios_servidor'] = np.where(nuevos['conteos_servidor'] > 0,
+                                                            (suma_previa + valores) / nuevos['conteos_servidor'],
+                                                            np.nan)
+
+        for clave, supera in (('maximos_servidor', np.greater), ('minimos_servidor', np.less)):
+            if clave in anteriores:
+                indices, extremos = anteriores[clave]
+                with np.errstate(invalid='ignore'):
+                    actualizar = validos & ((indices == -1) | supera(columna, extremos))
+                nuevos[clave] = (np.where(actualizar, dia, indices), np.where(actualizar, columna, extremos))
+
+        if 'percentiles_dia' in anteriores:
+            percentiles = self.calculadora.calcular_percentiles_por_eje(columna[:, np.newaxis],
+                                                                       self.PERCENTILES_FLOTA, eje=0)
+            nuevos['percentiles_dia'] = np.hstack([anteriores['percentiles_dia'], percentiles])
+
+        for clave, buscar in (('maximos_dia', self.calculadora.encontrar_maximo),
+                              ('minimos_dia', self.calculadora.encontrar_minimo)):
+            if clave in anteriores:
+                indices, extremos = anteriores[clave]
+                indice, extremo = buscar(columna)
+                nuevos[clave] = (np.append(indices, indice), np.append(extremos, extremo))
+
+        self.invalidar_agregados()
+        for clave, valor in nuevos.items():
+            self._agregado(clave, lambda valor=valor: valor)
+
+    def _anexar_columna_en_archivo(self, archivo, columna):
+        """
+        Agrega la columna al final de cada línea del archivo de texto (y
+        las filas nuevas al final) y regenera el caché binario. El formato
+        es por filas, por lo que el archivo se reescribe completo
+
+        Args:
+            archivo: Archivo de texto del que se cargaron los datos
+            columna: Valores del nuevo día en porcentaje
+        """
+        temporal = f"{archivo}.tmp"
+        fila = 0
+        with open(archivo, 'r', encoding='utf-8') as origen, \
+                open(temporal, 'w', encoding='utf-8') as destino:
+            for linea in origen:
+                linea = linea.rstrip('\r\n')
+                if not linea.strip():
+                    continue
+                if fila >= self.num_servidores:
+                    break
+                destino.write(f"{linea};{columna[fila]:.2f}\n")
+                fila += 1
+
+            # Servidores que no estaban en el archivo: se escribe su historia
+            for nueva in range(fila, self.num_servidores):
+                historia = ";".join(f"{valor:.2f}" for valor in self._decodificar(self._datos_crudos[nueva]))
+                destino.write(f"{self.nombres_servidores[nueva]};{historia}\n")
+
+        os.replace(temporal, archivo)
+        try:
+            CacheBinario(archivo).guardar(self._datos_crudos, self.nombres_servidores,
+                                          (self.errores_carga, self.total_errores_carga))
+        except OSError as e:
+            print(f"Advertencia: No se pudo guardar el caché binario: {e}")
+
+    def _registrar_carga(self, inicio, desde_cache):
+        """
+        Guarda las estadísticas de la carga que comenzó en 'inicio'
+
+        Returns:
+            float: Duración de la carga en segundos
+        """
+        duracion = time.perf_counter() - inicio
+        self.estadisticas_carga = {
+            'filas': self.num_servidores,
+            'segundos': duracion,
+            'filas_por_segundo': self.num_servidores / duracion if duracion > 0 else 0.0,
+            'desde_cache': desde_cache,
+            'errores': self.total_errores_carga
+        }
+        return duracion
+
+    @_lectura
+    def describir_dia(self, indice):
+        """
+        Retorna el texto de un día a partir de su índice (base 0), usando el
+        periodo al que pertenece si se conoce (por ejemplo "24 de junio")
+        """
+        for periodo in self.periodos:
+            if periodo['inicio'] <= indice < periodo['inicio'] + periodo['dias']:
+                if periodo['mes']:
+                    return f"{indice - periodo['inicio'] + 1} de {periodo['etiqueta']}"
+                return f"{indice + 1} ({periodo['etiqueta']})"
+        return str(indice + 1)
+
+    def _asignar_periodo_unico(self, archivo):
+        """Registra el periodo de un archivo individual según su nombre"""
+        periodo = detectar_periodo(archivo)
+        self.periodos = [{
+            'etiqueta': etiqueta_periodo(periodo, archivo),
+            'mes': periodo is not None,
+            'inicio': 0,
+            'dias': self.num_dias
+        }]
+
+    @_escritura
+    def cargar_datos(self, archivo, tamano_bloque=None, usar_cache=True, max_errores=None):
+        """
+        Carga los datos desde el archivo uso_cpu_junio.txt
+        Lee el archivo por bloques de tamaño fijo, separa nombres de
+        servidores y valores numéricos y convierte cada bloque en bloque,
+        de modo que la memoria auxiliar no depende del tamaño del archivo.
+        Si existe un caché binario vigente (mismo mtime y tamaño del archivo)
+        se abre con np.memmap en lugar de procesar el texto.
+        Si 'archivo' es un directorio o un patrón glob se delega en
+        cargar_multiples; si empieza por "shm://" se adjunta el segmento de
+        memoria compartida con ese nombre y si es un archivo histórico
+        comprimido se descomprime con cargar_archivo_historico.
+        Los valores vacíos, no numéricos o fuera de rango y los días que
+        faltan en filas cortas quedan como ausentes (NaN) y se registran en
+        errores_carga con su línea, columna y motivo, sin abortar la carga
+
+        Args:
+            archivo: Ruta al archivo de datos, directorio, patrón glob o
+                     "shm://<segmento>"
+            tamano_bloque: Líneas por bloque (por defecto TAMANO_BLOQUE_CARGA)
+            usar_cache: Si es True lee y actualiza el caché binario
+            max_errores: Errores de formato tolerados antes de descartar la
+                         carga (por defecto max_errores_carga; None sin límite)
+        """
+        if archivo.startswith(self.PREFIJO_MEMORIA_COMPARTIDA):
+            self.adjuntar_memoria_compartida(archivo[len(self.PREFIJO_MEMORIA_COMPARTIDA):])
+            return
+
+        if ArchivoHistorico.es_archivo_historico(archivo):
+            self.cargar_archivo_historico(archivo)
+            return
+
+        if max_errores is None:
+            max_errores = self.max_errores_carga
+
+        if es_origen_multiple(archivo):
+            self.cargar_multiples(archivo, usar_cache=usar_cache, max_errores=max_errores)
+            return
+
+        tamano_bloque = tamano_bloque or self.TAMANO_BLOQUE_CARGA
+        cache = CacheBinario(archivo)
+
+        try:
+            inicio = time.perf_counter()
+            if usar_cache and cache.es_valido(np.dtype(self._dtype_cpu)):
+                self._cargar_desde_cache(cache)
+                self.errores_carga, self.total_errores_carga = cache.cargar_errores()
+                self._verificar_presupuesto_errores(max_errores)
+                self._asignar_periodo_unico(archivo)
+                self.datos_cargados = True
+                self._registrar_carga(inicio, desde_cache=True)
+                print("Datos cargados desde el caché binario (memmap):")
+                print(f"- Array de datos CPU: {self._datos_crudos.shape}")
+                print(f"- Array de nombres: {self.nombres_servidores.shape}")
+                self._mostrar_errores_carga()
+                return
+
+            with open(archivo, 'r', encoding='utf-8') as file:
+                self.limpiar()
+                filas_leidas = []
+                primera_linea = 1
+                while True:
+                    lineas = list(islice(file, tamano_bloque))
+                    if not lineas:
+                        break
+                    self._procesar_bloque(lineas, primera_linea, filas_leidas)
+                    # Se abandona en cuanto se agota el presupuesto de errores
+                    self._verificar_presupuesto_errores(max_errores)
+                    primera_linea += len(lineas)
+            self._revisar_filas_cortas(filas_leidas)
+            self._verificar_presupuesto_errores(max_errores)
+            self.errores_carga.sort(key=lambda error: (error['linea'], error['columna']))
+
+            self.compactar()
+            self._asignar_periodo_unico(archivo)
+            self.datos_cargados = True
+            duracion = self._registrar_carga(inicio, desde_cache=False)
+            print("Datos cargados exitosamente en arrays numpy:")
+            print(f"- Array de datos CPU: {self._datos_crudos.shape}")
+            print(f"- Array de nombres: {self.nombres_servidores.shape}")
+            print(f"- Velocidad de carga: {self.estadisticas_carga['filas_por_segundo']:.0f} filas/s "
+                  f"({duracion:.3f} s)")
+            self._mostrar_errores_carga()
+
+            if usar_cache:
+                try:
+                    cache.guardar(self._datos_crudos, self.nombres_servidores,
+                                  (self.errores_carga, self.total_errores_carga))
+                except OSError as e:
+                    print(f"Advertencia: No se pudo guardar el caché binario: {e}")
+            
+        except FileNotFoundError:
+            self.limpiar()
+            print(f"Error: No se pudo encontrar el archivo {archivo}")
+        except Exception as e:
+            # Nunca quedan datos a medio cargar
+            self.limpiar()
+            print(f"Error al cargar los datos: {e}")
+
+    @_escritura
+    def cargar_multiples(self, origen, procesos=None, usar_cache=True, max_errores=None):
+        """
+        Carga varios archivos (por ejemplo uno por mes y por centro de datos)
+        procesándolos en paralelo y los combina en una sola matriz
+        servidores x días alineada en el tiempo.
+
+        Los archivos del mismo mes comparten columnas y los meses se
+        concatenan en orden cronológico; los servidores se unen por nombre y
+        los días sin medición quedan como NaN (ausentes).
+
+        Args:
+            origen: Directorio (se cargan sus *.txt) o patrón glob
+            procesos: Número de procesos trabajadores (por defecto uno por núcleo)
+            usar_cache: Si es True cada trabajador entrega su matriz a través
+                        del caché binario en lugar de serializarla
+            max_errores: Errores de formato tolerados por archivo; un archivo
+                         que los supera se omite
+        """
+        rutas = expandir_rutas(origen)
+        if not rutas:
+            print(f"Error: No se encontraron archivos en {origen}")
+            return
+
+        inicio = time.perf_counter()
+        if procesos == 1 or len(rutas) == 1:
+            resultados = [procesar_archivo(ruta, self.almacenamiento, usar_cache, max_errores)
+                          for ruta in rutas]
+        else:
+            # Importación diferida: solo la carga de varios archivos usa procesos
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+                resultados = list(ejecutor.map(procesar_archivo, rutas, repeat(self.almacenamiento),
+                                               repeat(usar_cache), repeat(max_errores)))
+
+        validos = []
+        for resultado in resultados:
+            if resultado['error'] is not None:
+                print(f"Advertencia: Se omite {resultado['ruta']}: {resultado['error']}")
+                continue
+            if resultado['datos'] is None:
+                resultado['datos'] = CacheBinario(resultado['ruta']).cargar()[0]
+            resultado['periodo'] = detectar_periodo(resultado['ruta'])
+            validos.append(resultado)
+
+        if not validos:
+            print("Error: Ningún archivo pudo cargarse")
+            return
+
+        # Agrupar por periodo: meses en orden cronológico y luego los
+        # archivos sin mes reconocible, cada uno como periodo propio
+        fechados = sorted({r['periodo'] for r in validos if r['periodo'] is not None})
+        grupos = [(p, [r for r in validos if r['periodo'] == p]) for p in fechados]
+        grupos += [(None, [r]) for r in validos if r['periodo'] is None]
+
+        periodos = []
+        inicio_periodo = 0
+        for periodo, archivos in grupos:
+            dias = max(r['datos'].shape[1] for r in archivos)
+            periodos.append({
+                'etiqueta': etiqueta_periodo(periodo, archivos[0]['ruta']),
+                'mes': periodo is not None,
+                'inicio': inicio_periodo,
+                'dias': dias
+            })
+            for r in archivos:
+                r['inicio'] = inicio_periodo
+            inicio_periodo += dias
+
+        # Unir servidores por nombre conservando el orden de aparición
+        indice = {}
+        for r in validos:
+            for nombre in r['nombres']:
+                indice.setdefault(nombre, len(indice))
+
+        relleno = self._codificar([np.nan])[0]
+        matriz = np.full((len(indice), inicio_periodo), relleno, dtype=self._dtype_cpu)
+        for r in validos:
+            filas = np.fromiter((indice[nombre] for nombre in r['nombres']), dtype=np.intp,
+                                count=len(r['nombres']))
+            matriz[filas, r['inicio']:r['inicio'] + r['datos'].shape[1]] = r['datos']
+
+        self.limpiar()
+        self._buffer_cpu = matriz
+        self._buffer_nombres = np.array(list(indice), dtype=str if self.compacto else object)
+        self._indice_nombres = indice
+        self.num_servidores, self.num_dias = matriz.shape
+        self.periodos = periodos
+        for r in validos:
+            self.total_errores_carga += r['total_errores']
+            disponibles = self.MAX_REGISTROS_ERROR - len(self.errores_carga)
+            self.errores_carga.extend(dict(error, archivo=r['ruta']) for error in r['errores'][:disponibles])
+        self.datos_cargados = True
+        self.invalidar_agregados()
+        duracion = self._registrar_carga(inicio, desde_cache=False)
+
+        print(f"Datos combinados de {len(validos)} archivos en arrays numpy:")
+        print(f"- Array de datos CPU: {matriz.shape}")
+        print(f"- Periodos: {', '.join(p['etiqueta'] for p in periodos)}")
+        print(f"- Procesos: {1 if procesos == 1 or len(rutas) == 1 else (procesos or os.cpu_count())}")
+        print(f"- Velocidad de carga: {self.estadisticas_carga['filas_por_segundo']:.0f} filas/s "
+              f"({duracion:.3f} s)")
+        self._mostrar_errores_carga()
+    
+    @_lectura
+    def analizar_resumen(self):
+        """
+        Calcula la estructura y la memoria de los datos cargados
+
+        Returns:
+            ResultadoResumen: Forma, almacenamiento y memoria, o None sin datos
+        """
+        if not self.datos_cargados:
+            return None
+
+        datos = self._datos_crudos
+        nombres = self.nombres_servidores
+        memoria_nombres = self._memoria_nombres(nombres)
+        ahorro = porcentaje = None
+        if self.compacto:
+            # Comparar con el almacenamiento float64 + nombres como objetos
+            memoria_actual = datos.nbytes + memoria_nombres
+            memoria_base = datos.size * np.dtype(np.float64).itemsize + \
+                self._memoria_nombres(nombres.astype(object))
+            ahorro = memoria_base - memoria_actual
+            porcentaje = ahorro / memoria_base * 100 if memoria_base else 0.0
+
+        return ResultadoResumen(
+            servidores=self.num_servidores,
+            dias=self.num_dias,
+            mediciones=int(datos.size),
+            almacenamiento=self.almacenamiento,
+            periodos=tuple(periodo['etiqueta'] for periodo in self.periodos),
+            dtype_datos=str(datos.dtype),
+            dtype_nombres=str(nombres.dtype),
+            bytes_datos=int(datos.nbytes),
+            bytes_nombres=int(memoria_nombres),
+            bytes_ahorrados=ahorro,
+            porcentaje_ahorro=porcentaje
+        )
+
+    @_lectura
+    def analizar_promedios(self):
+        """
+        Calcula el promedio mensual de uso de CPU de cada servidor
+
+        Returns:
+            ResultadoPromedios: Nombres y promedios, o None sin datos
+        """
+        if not self.datos_cargados:
+            return None
+        return ResultadoPromedios(nombres=self.nombres_servidores, promedios=self.promedios_por_servidor())
+
+    @_lectura
+    def analizar_dia_mayor_carga(self):
+        """
+        Determina el día con mayor carga total de CPU (desempate por el
+        primer día)
+
+        Returns:
+            ResultadoDiaMayorCarga: Día (base 0), carga y uso de cada
+                                    servidor ese día, o None sin datos. Si la
+                                    carga no tiene días el día es None
+        """
+        if not self.datos_cargados:
+            return None
+
+        if not self.num_servidores or not self.num_dias:
+            return ResultadoDiaMayorCarga(dia=None, descripcion=None, carga_total=np.nan,
+                                          nombres=self.nombres_servidores, valores_dia=np.empty(0))
+        dia, carga = self.calculadora.encontrar_maximo(self.sumas_por_dia())
+        return ResultadoDiaMayorCarga(
+            dia=int(dia),
+            descripcion=self.describir_dia(dia),
+            carga_total=carga,
+            nombres=self.nombres_servidores,
+            valores_dia=self.obtener_datos_dia(dia + 1)
+        )
+
+    @_lectura
+    def analizar_servidor_menor_uso(self, dias_detalle=10):
+        """
+        Identifica el servidor con menor uso promedio de CPU (desempate por
+        el primer servidor)
+
+        Args:
+            dias_detalle: Número de días iniciales del servidor a incluir
+
+        Returns:
+            ResultadoServidorMenorUso: Fila (base 0), nombre, promedio y
+                                       primeros días, o None sin datos. Si
+                                       ningún servidor tiene mediciones la
+                                       fila es None
+        """
+        if not self.datos_cargados:
+            return None
+
+        fila = -1
+        if self.num_servidores and self.num_dias:
+            fila, promedio = self.calculadora.encontrar_minimo(self.promedios_por_servidor())
+        if fila < 0:
+            return ResultadoServidorMenorUso(fila=None, servidor=None, promedio=np.nan, primeros_dias=np.empty(0))
+        return ResultadoServidorMenorUso(
+            fila=int(fila),
+            servidor=str(self.nombres_servidores[fila]),
+            promedio=promedio,
+            primeros_dias=self._decodificar(self._datos_crudos[fila, :dias_detalle])
+        )
+
+    @_lectura
+    def analizar_top_servidores(self, k=10, metrica="promedio", mayores=True):
+        """
+        Selecciona los K servidores con mayor (o menor) valor de una métrica
+        con selección parcial O(servidores), sin ordenar toda la flota
+
+        Args:
+            k: Número de servidores a retornar
+            metrica: Una de METRICAS_RANKING
+            mayores: True para los de mayor valor, False para los de menor
+
+        Returns:
+            ResultadoTopServidores: Servidores ordenados del más extremo al
+                                    menos extremo, o None sin datos
+        """
+        if not self.datos_cargados:
+            return None
+
+        filas, valores = self.calculadora.seleccionar_k_extremos(self.valores_por_servidor(metrica), k, mayores)
+        return ResultadoTopServidores(metrica=metrica, mayores=mayores, filas=filas,
+                                      nombres=self.nombres_servidores[filas], valores=valores)
+
+    @_lectura
+    def pares_correlacionados(self, n=5):
+        """
+        Retorna los N servidores más correlacionados con cada servidor
+        (memorizado por N). El producto se calcula por bloques de filas, de
+        modo que la memoria no crece con el cuadrado de la flota
+
+        Returns:
+            tuple: (filas, correlaciones), ambas de forma (servidores x N)
+        """
+        return self._agregado(f'pares_correlacion_{n}',
+                              lambda: self.correlaciones.pares_mas_correlacionados(self.datos_cpu, n))
+
+    @_lectura
+    def analizar_correlaciones(self, n_pares=5, umbral=0.9):
+        """
+        Busca los servidores que cargan a la vez: la correlación de Pearson
+        del uso diario con los N servidores más correlacionados de cada uno,
+        y los grupos que forman los pares con correlación >= umbral
+
+        Args:
+            n_pares: Pares que se conservan por servidor
+            umbral: Correlación mínima para unir dos servidores en un grupo
+
+        Returns:
+            ResultadoCorrelaciones: Pares por servidor y grupos de dos o más
+                                    servidores (del mayor al menor), o None sin datos
+        """
+        if not self.datos_cargados:
+            return None
+        if not -1.0 <= umbral <= 1.0:
+            raise ValueError("El umbral de correlación debe estar entre -1 y 1")
+
+        filas, correlaciones = self.pares_correlacionados(n_pares)
+        etiquetas = self.correlaciones.agrupar(filas, correlaciones, umbral)
+        # Ordenar por etiqueta y cortar donde cambia; luego por tamaño descendente
+        orden = np.argsort(etiquetas, kind='stable')
+        cortes = np.flatnonzero(np.diff(etiquetas[orden])) + 1
+        grupos = [grupo for grupo in np.split(orden, cortes) if len(grupo) > 1]
+        grupos.sort(key=lambda grupo: (-len(grupo), grupo[0]))
+        return ResultadoCorrelaciones(pares_por_servidor=n_pares, umbral=umbral,
+                                      nombres=self.nombres_servidores, filas=filas,
+                                      correlaciones=correlaciones, grupos=tuple(grupos))
+
+    @_lectura
+    def asignacion_consolidacion(self, capacidad=100.0):
+        """
+        Retorna el host asignado a cada servidor al consolidar la flota en
+        hosts de la capacidad indicada (memorizado por capacidad)
+
+        Returns:
+            numpy.ndarray: Host (base 0, en orden de apertura) de cada servidor
+        """
+        return self._agregado(f'consolidacion_{capacidad}',
+                              lambda: self.consolidacion.planificar(self.datos_cpu, capacidad))
+
+    @_lectura
+    def analizar_consolidacion(self, capacidad=100.0):
+        """
+        Planifica la consolidación de los servidores en la menor cantidad de
+        hosts sin superar la capacidad de ningún host en ningún día
+        (empaquetado vectorial con first-fit decreasing)
+
+        Args:
+            capacidad: Capacidad de cada host en las unidades del uso de CPU
+                       (100 equivale a un servidor completo)
+
+        Returns:
+            ResultadoConsolidacion: Asignación, carga diaria de cada host y
+                                    holgura por día, o None sin datos
+        """
+        if not self.datos_cargados:
+            return None
+        if not capacidad > 0:
+            raise ValueError("La capacidad del host debe ser mayor que 0")
+
+        asignacion = self.asignacion_consolidacion(capacidad)
+        demanda = self.consolidacion.demanda(self.datos_cpu)
+        excedidos = np.flatnonzero((demanda > capacidad + self.consolidacion.TOLERANCIA).any(axis=1))
+        return ResultadoConsolidacion(capacidad=capacidad, nombres=self.nombres_servidores, asignacion=asignacion,
+                                      cargas=self.consolidacion.cargas_por_host(demanda, asignacion),
+                                      descripciones=tuple(self.describir_dia(dia) for dia in range(self.num_dias)),
+                                      excedidos=excedidos)
+
+    @_lectura
+    def analizar_rango(self, servidores=None, dias=None):
+        """
+        Calcula en una pasada vectorizada la suma, el promedio, el máximo y
+        el mínimo (con su día) de cada servidor seleccionado en un rango de
+        días, y los de toda la selección. Solo se lee la selección
+
+        Args:
+            servidores: Selector de servidores (ver seleccionar_servidores)
+            dias: Rango de días (ver seleccionar_dias)
+
+        Returns:
+            ResultadoRango: Agregados por servidor y de la selección (sin
+                            mediciones si no hay servidores o días
+                            seleccionados), o None sin datos
+
+        Raises:
+            ValueError: Si el selector no es válido
+        """
+        if not self.datos_cargados:
+            return None
+        filas = self.seleccionar_servidores(servidores)
+        columnas = self.seleccionar_dias(dias)
+        crudos = self._datos_crudos[filas, columnas]
+
+        if not crudos.size:
+            # Sin servidores o sin días: cada servidor queda sin mediciones
+            mediciones = np.zeros(crudos.shape[0], dtype=np.intp)
+            sumas = np.zeros(crudos.shape[0])
+            maximos = minimos = np.full(crudos.shape[0], np.nan)
+            dias_maximo = dias_minimo = np.full(crudos.shape[0], -1, dtype=np.intp)
+        else:
+            # Como en _matriz_agregados: con ausentes en "centesimas" se decodifica
+            escalar = self._escala != 1.0 and not (crudos == self.CENTESIMAS_AUSENTE).any()
+            matriz = crudos if escalar else self._decodificar(crudos)
+            if np.issubdtype(matriz.dtype, np.floating):
+                mediciones = matriz.shape[1] - np.isnan(matriz).sum(axis=1)
+            else:
+                mediciones = np.full(matriz.shape[0], matriz.shape[1])
+            sumas = self.calculadora.calcular_suma_por_eje(matriz, eje=1)
+            dias_maximo, maximos = self.calculadora.encontrar_maximo_por_eje(matriz, eje=1)
+            dias_minimo, minimos = self.calculadora.encontrar_minimo_por_eje(matriz, eje=1)
+            if escalar:
+                sumas = self._escalar(sumas)
+                maximos, minimos = self._escalar(maximos), self._escalar(minimos)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            promedios = sumas / mediciones
+
+        filas = np.arange(self.num_servidores)[filas]
+        con_dias = columnas.stop > columnas.start
+        return ResultadoRango(
+            filas=filas, nombres=self.nombres_servidores[filas],
+            dia_inicio=columnas.start, dia_fin=columnas.stop,
+            descripcion_inicio=self.describir_dia(columnas.start) if con_dias else None,
+            descripcion_fin=self.describir_dia(columnas.stop - 1) if con_dias else None,
+            mediciones=mediciones, sumas=sumas, promedios=promedios,
+            maximos=maximos.astype(np.float64), dias_maximo=np.where(dias_maximo >= 0, dias_maximo + columnas.start, -1),
+            minimos=minimos.astype(np.float64), dias_minimo=np.where(dias_minimo >= 0, dias_minimo + columnas.start, -1))
+
+    @_lectura
+    def analizar_percentiles_flota(self):
+        """
+        Calcula los percentiles p50/p90/p99 del uso de toda la flota por día
+
+        Returns:
+            ResultadoPercentilesDia: Percentiles por día, o None sin datos
+        """
+        if not self.datos_cargados:
+            return None
+
+        return ResultadoPercentilesDia(percentiles=self.PERCENTILES_FLOTA, valores=self.percentiles_por_dia(),
+                                       descripciones=tuple(self.describir_dia(dia) for dia in range(self.num_dias)))
+
+    def _mascara_alertas(self, regla, limite):
+        """
+        Retorna la máscara booleana (servidores x días) de mediciones en
+        alerta. Los límites se llevan a las unidades de almacenamiento para
+        comparar los datos sin decodificarlos; el z-score se evalúa como
+        uso fuera de [media - limite·desv, media + limite·desv]
+        """
+        crudos = self._datos_crudos
+        if regla == "umbral":
+            mascara = crudos > limite / self._escala
+        else:
+            promedios = self.promedios_por_servidor()
+            margenes = limite * self.desviaciones_por_servidor()
+            # Un servidor constante (o sin datos) no tiene anomalías
+            margenes = np.where(margenes > 0, margenes, np.nan)
+            superiores = ((promedios + margenes) / self._escala)[:, np.newaxis]
+            inferiores = ((promedios - margenes) / self._escala)[:, np.newaxis]
+            mascara = (crudos > superiores) | (crudos < inferiores)
+
+        if self._escala != 1.0:
+            mascara &= crudos != self.CENTESIMAS_AUSENTE
+        return mascara
+
+    @_lectura
+    def analizar_alertas(self, regla="umbral", limite=None):
+        """
+        Busca en toda la flota las mediciones en alerta, sus rachas de días
+        consecutivos y los días en alerta de cada servidor, con una máscara
+        booleana y codificación por longitud de rachas (sin recorrer filas)
+
+        Args:
+            regla: "umbral" (uso mayor que limite, en %) o "zscore" (|z|
+                   mayor que limite según media y desviación del servidor)
+            limite: Umbral de uso o de z-score (por defecto LIMITES_ALERTA)
+
+        Returns:
+            ResultadoAlertas: Pares (servidor, día), rachas y conteos, o None
+                              sin datos
+        """
+        if regla not in self.REGLAS_ALERTA:
+            raise ValueError(f"Regla desconocida '{regla}'. Opciones: {', '.join(self.REGLAS_ALERTA)}")
+        if not self.datos_cargados:
+            return None
+        if limite is None:
+            limite = self.LIMITES_ALERTA[regla]
+
+        mascara = self._mascara_alertas(regla, limite)
+        filas, dias = np.divmod(np.flatnonzero(mascara), self.num_dias)
+        conteos = np.bincount(filas, minlength=self.num_servidores)
+
+        # Rachas: con un día falso de relleno a cada lado de cada fila, los
+        # cambios de valor en la matriz aplanada alternan inicio y fin de racha
+        ancho = self.num_dias + 2
+        relleno = np.zeros((self.num_servidores, ancho), dtype=bool)
+        relleno[:, 1:-1] = mascara
+        plano = relleno.ravel()
+        cambios = np.flatnonzero(plano[1:] != plano[:-1]) + 1
+        inicios, fines = cambios[0::2], cambios[1::2]
+        rachas_filas, rachas_inicio = np.divmod(inicios, ancho)
+        rachas_inicio -= 1
+        rachas_longitud = fines - inicios
+
+        racha_maxima = np.zeros(self.num_servidores, dtype=np.intp)
+        if len(rachas_filas):
+            filas_racha, primeras = np.unique(rachas_filas, return_index=True)
+            racha_maxima[filas_racha] = np.maximum.reduceat(rachas_longitud, primeras)
+
+        return ResultadoAlertas(
+            regla=regla,
+            limite=float(limite),
+            total_mediciones=int(mascara.size),
+            nombres=self.nombres_servidores,
+            filas=filas,
+            dias=dias,
+            conteos=conteos,
+            racha_maxima=racha_maxima,
+            rachas_filas=rachas_filas,
+            rachas_inicio=rachas_inicio,
+            rachas_longitud=rachas_longitud
+        )
+
+    @_lectura
+    def analizar_ventana_movil(self, nombre_servidor, ventana=7):
+        """
+        Calcula promedio, mínimo, máximo y desviación móviles y la variación
+        diaria de un servidor
+
+        Args:
+            nombre_servidor: Nombre del servidor
+            ventana: Número de días de cada ventana
+
+        Returns:
+            ResultadoVentanaMovil: Una fila por ventana, o None sin datos o
+                                   si el servidor no existe
+        """
+        if not self.datos_cargados:
+            return None
+        fila = self.indice_servidor(nombre_servidor)
+        if fila is None:
+            return None
+
+        filas = slice(fila, fila + 1)
+        moviles = {operacion: self.calcular_ventana_movil(operacion, ventana, filas)[0]
+                   for operacion in ("promedio", "minimo", "maximo", "desviacion")}
+        dias = np.arange(ventana - 1, self.num_dias)
+        diferencias = np.concatenate([[np.nan], self.diferencias_diarias(filas)[0]])
+        return ResultadoVentanaMovil(
+            servidor=str(nombre_servidor),
+            ventana=ventana,
+            dias=dias,
+            descripciones=tuple(self.describir_dia(dia) for dia in dias),
+            valores=self._decodificar(self._datos_crudos[fila, ventana - 1:]),
+            diferencia=diferencias[ventana - 1:],
+            **moviles
+        )
+
+    def obtener_resumen(self):
+        """
+        Retorna la estructura de los datos cargados como diccionario
+
+        Returns:
+            dict: Forma, almacenamiento y memoria utilizada, o None sin datos
+        """
+        resultado = self.analizar_resumen()
+        return resultado.a_dict() if resultado is not None else None
+
+    def obtener_promedios(self):
+        """
+        Retorna el promedio de uso de cada servidor como diccionarios
+
+        Returns:
+            list: Diccionarios {'servidor', 'promedio'}, o None sin datos
+        """
+        resultado = self.analizar_promedios()
+        return resultado.a_dict() if resultado is not None else None
+
+    def obtener_dia_mayor_carga(self):
+        """
+        Retorna el día con mayor carga total como diccionario
+
+        Returns:
+            dict: Día (base 1), su descripción y la carga total, o None sin datos
+        """
+        resultado = self.analizar_dia_mayor_carga()
+        return resultado.a_dict() if resultado is not None else None
+
+    def obtener_servidor_menor_uso(self):
+        """
+        Retorna el servidor con menor uso promedio como diccionario
+
+        Returns:
+            dict: Servidor, su fila (base 1) y su promedio, o None sin datos
+        """
+        resultado = self.analizar_servidor_menor_uso()
+        return resultado.a_dict() if resultado is not None else None
+
+    def obtener_top_servidores(self, k=10, metrica="promedio", mayores=True):
+        """
+        Retorna los K servidores con mayor (o menor) métrica como diccionario
+
+        Returns:
+            dict: Métrica, orden y servidores seleccionados, o None sin datos
+        """
+        resultado = self.analizar_top_servidores(k, metrica, mayores)
+        return resultado.a_dict() if resultado is not None else None
+
+    def obtener_percentiles_flota(self):
+        """
+        Retorna los percentiles de la flota por día como diccionarios
+
+        Returns:
+            list: Diccionarios {'dia', 'descripcion', 'p50', 'p90', 'p99'},
+                  o None sin datos
+        """
+        resultado = self.analizar_percentiles_flota()
+        return resultado.a_dict() if resultado is not None else None
+
+    def obtener_alertas(self, regla="umbral", limite=None):
+        """
+        Retorna las alertas de la flota como diccionario
+
+        Returns:
+            dict: Regla, totales y por servidor sus días y rachas en alerta,
+                  o None sin datos
+        """
+        resultado = self.analizar_alertas(regla, limite)
+        return resultado.a_dict() if resultado is not None else None
+
+    def obtener_correlaciones(self, n_pares=5, umbral=0.9):
+        """
+        Retorna los servidores más correlacionados y los grupos como diccionario
+
+        Returns:
+            dict: Pares por servidor y grupos de carga conjunta, o None sin datos
+        """
+        resultado = self.analizar_correlaciones(n_pares, umbral)
+        return resultado.a_dict() if resultado is not None else None
+
+    def obtener_consolidacion(self, capacidad=100.0):
+        """
+        Retorna el plan de consolidación en hosts como diccionario
+
+        Returns:
+            dict: Hosts usados y ahorrados, servidores de cada host y holgura
+                  por día, o None sin datos
+        """
+        resultado = self.analizar_consolidacion(capacidad)
+        return resultado.a_dict() if resultado is not None else None
+
+    def obtener_rango(self, servidores=None, dias=None):
+        """
+        Retorna los agregados de una selección de servidores y días como diccionario
+
+        Returns:
+            dict: Totales, extremos y agregados por servidor, o None sin datos
+        """
+        resultado = self.analizar_rango(servidores, dias)
+        return resultado.a_dict() if resultado is not None else None
+
+    def calcular_promedio_mensual_por_servidor(self):
+        """
+        Calcula el promedio mensual de uso de CPU por servidor
+
+        Returns:
+            np.ndarray: Promedio de cada servidor, o None sin datos
+        """
+        resultado = self.analizar_promedios()
+        return resultado.promedios if resultado is not None else None
+    
+    def encontrar_dia_mayor_carga(self):
+        """
+        Determina el día con mayor carga total de CPU
+
+        Returns:
+            tuple: (día base 0 o None sin días, carga total), o None sin datos
+        """
+        resultado = self.analizar_dia_mayor_carga()
+        return (resultado.dia, resultado.carga_total) if resultado is not None else None
+    
+    def encontrar_servidor_menor_uso(self):
+        """
+        Identifica el servidor con menor uso promedio de CPU
+
+        Returns:
+            tuple: (fila base 0 o None sin mediciones, promedio), o None sin datos
+        """
+        resultado = self.analizar_servidor_menor_uso()
+        return (resultado.fila, resultado.promedio) if resultado is not None else None
+
+    @staticmethod
+    def _memoria_nombres(nombres):
+        """
+        Estima la memoria de un array de nombres; en arrays de objetos suma
+        también el tamaño de cada string referenciado
+        """
+        if nombres.dtype == object:
+            return nombres.nbytes + sum(sys.getsizeof(nombre) for nombre in nombres)
+        return nombres.nbytes
+    
+    def indice_servidor(self, nombre_servidor):
+        """
+        Retorna la fila de un servidor en O(1) o None si no existe
+        """
+        # El índice se comparte entre instantáneas y solo agrega nombres:
+        # las filas que esta instantánea aún no ve no cuentan
+        estado = self._estado
+        fila = estado.indice_nombres.get(nombre_servidor)
+        return fila if fila is not None and fila < estado.num_servidores else None
+
+    def _filas_de_nombres(self, nombres):
+        """Retorna la fila de cada nombre como array, con -1 para los desconocidos"""
+        indice, limite = self._indice_nombres, self.num_servidores
+        filas = np.array([indice.get(nombre, -1) for nombre in nombres], dtype=np.intp)
+        filas[filas >= limite] = -1
+        return filas
+
+    def _indice_ordenado(self):
+        """
+        Retorna (nombres ordenados, filas correspondientes), memorizado
+        hasta la siguiente modificación de los datos
+        """
+        def calcular():
+            orden = np.argsort(self.nombres_servidores, kind='stable')
+            return self.nombres_servidores[orden], orden
+        return self._agregado('indice_ordenado', calcular)
+
+    @_lectura
+    def buscar_servidores(self, patron):
+        """
+        Busca servidores por prefijo o patrón glob (por ejemplo "web-*")
+        usando búsqueda binaria sobre el índice ordenado de nombres
+
+        Args:
+            patron: Nombre exacto o patrón con *, ? o [...]
+
+        Returns:
+            numpy.ndarray: Filas de los servidores que coinciden, en orden alfabético
+        """
+        if not self.datos_cargados:
+            return np.empty(0, dtype=np.intp)
+
+        # Solo la parte literal inicial del patrón acota el rango de búsqueda
+        fin_prefijo = len(patron)
+        for comodin in '*?[':
+            posicion = patron.find(comodin)
+            if posicion != -1:
+                fin_prefijo = min(fin_prefijo, posicion)
+        prefijo = patron[:fin_prefijo]
+
+        if fin_prefijo == len(patron):
+            fila = self.indice_servidor(patron)
+            return np.array([] if fila is None else [fila], dtype=np.intp)
+
+        nombres_ordenados, orden = self._indice_ordenado()
+        inicio = np.searchsorted(nombres_ordenados, prefijo, side='left')
+        fin = np.searchsorted(nombres_ordenados, prefijo + '\U0010ffff', side='left')
+
+        candidatos = range(inicio, fin)
+        if patron != prefijo + '*':
+            candidatos = [i for i in candidatos if fnmatchcase(nombres_ordenados[i], patron)]
+        return np.asarray(orden[list(candidatos)], dtype=np.intp)
+
+    def obtener_datos_servidor(self, nombre_servidor):
+        """
+        Obtiene los datos de un servidor específico
+        """
+        estado = self._estado
+        if not estado.datos_cargados:
+            return None
+        
+        # Buscar la fila del servidor en el índice de nombres
+        fila = estado.indice_nombres.get(nombre_servidor)
+        if fila is not None and fila < estado.num_servidores:
+            return self._decodificar(estado.buffer_cpu[fila, :estado.num_dias])
+        return None
+
+    @_lectura
+    def obtener_datos_servidores(self, nombres):
+        """
+        Obtiene en una sola llamada los datos de varios servidores
+
+        Args:
+            nombres: Secuencia de nombres de servidores
+
+        Returns:
+            numpy.ndarray: Matriz (len(nombres) x días) en el mismo orden;
+            las filas de servidores inexistentes se rellenan con NaN
+        """
+        if not self.datos_cargados:
+            return None
+
+        filas = self._filas_de_nombres(nombres)
+        if not self.num_servidores:
+            return np.full((len(filas), self.num_dias), np.nan)
+        resultado = self._decodificar(self._datos_crudos[np.maximum(filas, 0)]).astype(np.float64)
+        resultado[filas < 0] = np.nan
+        return resultado
+    
+    def obtener_datos_dia(self, dia):
+        """
+        Obtiene los datos de un día específico (1-num_dias)
+        """
+        estado = self._estado
+        if not estado.datos_cargados or dia < 1 or dia > estado.num_dias:
+            return None
+        
+        return self._decodificar(estado.buffer_cpu[:estado.num_servidores, dia-1])
+
+    @_lectura
+    def seleccionar_servidores(self, servidores=None):
+        """
+        Convierte un selector de servidores en filas. Las filas contiguas se
+        expresan como slice para que la selección sea una vista sin copia
+
+        Args:
+            servidores: None (todos), slice o range de filas (base 0), nombre
+                        o patrón glob, secuencia de nombres, secuencia de
+                        filas (base 0) o máscara booleana de num_servidores
+
+        Returns:
+            slice o numpy.ndarray: Filas seleccionadas, en el orden dado
+
+        Raises:
+            ValueError: Si un nombre no existe, una fila está fuera de rango
+                        o la máscara no tiene el largo correcto
+        """
+        if servidores is None:
+            return slice(0, self.num_servidores)
+        if isinstance(servidores, range):
+            servidores = slice(servidores.start, servidores.stop, servidores.step)
+        if isinstance(servidores, slice):
+            return slice(*servidores.indices(self.num_servidores))
+
+        if isinstance(servidores, str):
+            filas = np.sort(self.buscar_servidores(servidores))
+            if not len(filas):
+                raise ValueError(f"No hay servidores que coincidan con '{servidores}'")
+        else:
+            seleccion = np.asarray(servidores).ravel()
+            if not seleccion.size:
+                filas = np.empty(0, dtype=np.intp)
+            elif seleccion.dtype == bool:
+                if len(seleccion) != self.num_servidores:
+                    raise ValueError(f"La máscara tiene {len(seleccion)} posiciones y hay "
+                                     f"{self.num_servidores} servidores")
+                filas = np.flatnonzero(seleccion)
+            elif np.issubdtype(seleccion.dtype, np.integer):
+                filas = seleccion.astype(np.intp)
+                if ((filas < 0) | (filas >= self.num_servidores)).any():
+                    raise ValueError(f"Filas fuera de rango (0-{self.num_servidores - 1})")
+            else:
+                filas = self._filas_de_nombres(seleccion)
+                desconocidos = seleccion[filas < 0]
+                if len(desconocidos):
+                    raise ValueError(f"Servidores desconocidos: {', '.join(str(n) for n in desconocidos[:5])}"
+                                     + (f" y {len(desconocidos) - 5} más" if len(desconocidos) > 5 else ""))
+
+        if len(filas) and filas[-1] - filas[0] == len(filas) - 1 and (np.diff(filas) == 1).all():
+            return slice(int(filas[0]), int(filas[-1]) + 1)
+        return filas
+
+    @_lectura
+    def seleccionar_dias(self, dias=None):
+        """
+        Convierte un rango de días en un slice de columnas
+
+        Args:
+            dias: None (todos) o slice / range contiguo de días (base 0)
+
+        Returns:
+            slice: Columnas seleccionadas (paso 1)
+
+        Raises:
+            ValueError: Si el rango no es contiguo
+        """
+        if dias is None:
+            return slice(0, self.num_dias)
+        if isinstance(dias, range):
+            dias = slice(dias.start, dias.stop, dias.step)
+        if not isinstance(dias, slice):
+            raise ValueError("Los días se seleccionan con un slice o range contiguo")
+        inicio, fin, paso = dias.indices(self.num_dias)
+        if paso != 1:
+            raise ValueError("Solo se admiten rangos de días contiguos")
+        return slice(inicio, max(inicio, fin))
+
+    @_lectura
+    def vista_rango(self, servidores=None, dias=None):
+        """
+        Retorna el uso de CPU de una selección de servidores y días. Si las
+        filas son contiguas y el almacenamiento no es "centesimas" es una
+        vista sin copia; si no, una copia solo de la selección
+
+        Args:
+            servidores: Selector de servidores (ver seleccionar_servidores)
+            dias: Rango de días (ver seleccionar_dias)
+
+        Returns:
+            numpy.ndarray: Matriz (servidores seleccionados x días), o None
+                           sin datos
+        """
+        if not self.datos_cargados:
+            return None
+        return self._decodificar(self._datos_crudos[self.seleccionar_servidores(servidores),
+                                                    self.seleccionar_dias(dias)])
@@ -0,0 +1,175 @@
+"""
+Publicación de los datos de CPU en memoria compartida
+Copia una vez la matriz y los nombres de servidores a un segmento de
+multiprocessing.shared_memory con una cabecera que describe su forma, dtype
+y tabla de nombres, para que otros procesos los abran como vistas numpy de
+solo lectura, sin procesar texto ni copiar datos
+"""
+
+import json
+import struct
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+
+class MemoriaCompartida:
+    """Clase que gestiona un segmento de memoria compartida con datos de CPU"""
+
+    VERSION = 1
+
+    # Identificador al inicio del segmento y formato de la longitud de la cabecera
+    MAGIA = b"CPUSHM\x00\x01"
+    FORMATO_LONGITUD = "<I"
+
+    # Alineación de la matriz y de los nombres dentro del segmento
+    ALINEACION = 64
+
+    def __init__(self, segmento, cabecera, propietario):
+        """
+        Crea las vistas sobre un segmento ya abierto; usar publicar() o
+        adjuntar() en lugar de llamarlo directamente
+
+        Args:
+            segmento: shared_memory.SharedMemory abierto
+            cabecera: Diccionario con la descripción del contenido
+            propietario: True si este proceso creó el segmento
+        """
+        self.segmento = segmento
+        self.cabecera = cabecera
+        self.propietario = propietario
+
+        buffer = segmento.buf
+        self.datos = np.ndarray(tuple(cabecera['forma']), dtype=np.dtype(cabecera['dtype']),
+                                buffer=buffer, offset=cabecera['desplazamiento_datos'])
+        self.nombres = np.ndarray((cabecera['forma'][0],), dtype=np.dtype(cabecera['dtype_nombres']),
+                                  buffer=buffer, offset=cabecera['desplazamiento_nombres'])
+        self.datos.flags.writeable = False
+        self.nombres.flags.writeable = False
+
+    @property
+    def nombre(self):
+        """Nombre del segmento con el que otros procesos pueden adjuntarlo"""
+        return self.segmento.name
+
+    @classmethod
+    def _alinear(cls, posicion):
+        """Redondea una posición al siguiente múltiplo de ALINEACION"""
+        return -(-posicion // cls.ALINEACION) * cls.ALINEACION
+
+    @classmethod
+    def publicar(cls, datos_cpu, nombres_servidores, metadatos=None, nombre=None):
+        """
+        Crea un segmento nuevo y copia en él la matriz y los nombres
+
+        Args:
+            datos_cpu: Matriz numpy (servidores x días) en su dtype de almacenamiento
+            nombres_servidores: Array con los nombres de los servidores
+            metadatos: Diccionario serializable adicional (almacenamiento, periodos)
+            nombre: Nombre del segmento; None para que el sistema elija uno
+
+        Returns:
+            MemoriaCompartida: Publicación propietaria del segmento; debe
+                               liberarse con liberar() al terminar
+        """
+        datos_cpu = np.ascontiguousarray(datos_cpu)
+        nombres = np.asarray(nombres_servidores, dtype=str)
+        if nombres.size == 0:
+            nombres = nombres.astype('<U1')
+
+        cabecera = dict(metadatos or {}, version=cls.VERSION, forma=list(datos_cpu.shape),
+                        dtype=datos_cpu.dtype.str, dtype_nombres=nombres.dtype.str)
+        # Los desplazamientos dependen del largo de la cabecera, que los incluye:
+        # se reservan con un valor del mismo ancho máximo y luego se fijan
+        prefijo = len(cls.MAGIA) + struct.calcsize(cls.FORMATO_LONGITUD)
+        cabecera['desplazamiento_datos'] = cabecera['desplazamiento_nombres'] = 2 ** 62
+        longitud_cabecera = len(json.dumps(cabecera).encode('utf-8'))
+        cabecera['desplazamiento_datos'] = cls._alinear(prefijo + longitud_cabecera)
+        cabecera['desplazamiento_nombres'] = cls._alinear(cabecera['desplazamiento_datos'] + datos_cpu.nbytes)
+        texto_cabecera = json.dumps(cabecera).encode('utf-8')
+        total = cabecera['desplazamiento_nombres'] + nombres.nbytes
+
+        segmento = shared_memory.SharedMemory(name=nombre, create=True, size=max(total, 1))
+        try:
+            segmento.buf[:len(cls.MAGIA)] = cls.MAGIA
+            struct.pack_into(cls.FORMATO_LONGITUD, segmento.buf, len(cls.MAGIA), len(texto_cabecera))
+            segmento.buf[prefijo:prefijo + len(texto_cabecera)] = texto_cabecera
+
+            publicacion = cls(segmento, cabecera, propietario=True)
+            publicacion.datos.flags.writeable = True
+            publicacion.nombres.flags.writeable = True
+            publicacion.datos[...] = datos_cpu
+            publicacion.nombres[...] = nombres
+            publicacion.datos.flags.writeable = False
+            publicacion.nombres.flags.writeable = False
+        except BaseException:
+            segmento.close()
+            segmento.unlink()
+            raise
+        return publicacion
+
+    @classmethod
+    def adjuntar(cls, nombre):
+        """
+        Abre un segmento publicado por otro proceso, sin copiar datos
+
+        Args:
+            nombre: Nombre del segmento
+
+        Returns:
+            MemoriaCompartida: Vistas de solo lectura sobre el segmento
+
+        Raises:
+            FileNotFoundError: Si no existe un segmento con ese nombre
+            ValueError: Si el segmento no contiene datos de CPU válidos
+        """
+        try:
+            segmento = shared_memory.SharedMemory(name=nombre, track=False)
+        except TypeError:
+            # Python < 3.13: el rastreador de recursos eliminaría el segmento
+            # al terminar este proceso aunque no sea su propietario
+            segmento = shared_memory.SharedMemory(name=nombre)
+            resource_tracker.unregister(segmento._name, "shared_memory")
+
+        try:
+            prefijo = len(cls.MAGIA) + struct.calcsize(cls.FORMATO_LONGITUD)
+            if bytes(segmento.buf[:len(cls.MAGIA)]) != cls.MAGIA:
+                raise ValueError(f"El segmento '{nombre}' no contiene datos de CPU")
+            longitud, = struct.unpack_from(cls.FORMATO_LONGITUD, segmento.buf, len(cls.MAGIA))
+            cabecera = json.loads(bytes(segmento.buf[prefijo:prefijo + longitud]).decode('utf-8'))
+            if cabecera.get('version') != cls.VERSION:
+                raise ValueError(f"Versión de segmento no soportada: {cabecera.get('version')}")
+            return cls(segmento, cabecera, propietario=False)
+        except BaseException:
+            segmento.close()
+            raise
+
+    def cerrar(self):
+        """
+        Cierra la vista de este proceso sobre el segmento. Si quedan arrays
+        derivados en uso el cierre se difiere hasta que se liberen
+        """
+        self.datos = self.nombres = None
+        try:
+            self.segmento.close()
+        except BufferError:
+            pass
+
+    def liberar(self):
+        """Cierra y elimina el segmento (solo el proceso propietario)"""
+        self.cerrar()
+        if self.propietario:
+            try:
+                self.segmento.unlink()
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        if self.propietario:
+            self.liberar()
+        else:
+            self.cerrar()
+        return False
@@ -0,0 +1,435 @@
+"""
+Objetos de resultado de los análisis del centro de datos
+Contienen solo datos (arrays numpy y escalares); la presentación en texto
+la hace InterfazUsuario y la conversión a diccionario sirve al modo lote
+"""
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+
+def reemplazar_nan(valor):
+    """Convierte los NaN en None para producir JSON válido"""
+    if isinstance(valor, float) and math.isnan(valor):
+        return None
+    if isinstance(valor, dict):
+        return {clave: reemplazar_nan(v) for clave, v in valor.items()}
+    if isinstance(valor, list):
+        return [reemplazar_nan(v) for v in valor]
+    return valor
+
+
+@dataclass(frozen=True)
+class ResultadoResumen:
+    """Estructura y memoria de los datos cargados"""
+    servidores: int
+    dias: int
+    mediciones: int
+    almacenamiento: str
+    periodos: tuple
+    dtype_datos: str
+    dtype_nombres: str
+    bytes_datos: int
+    bytes_nombres: int
+    bytes_ahorrados: int = None
+    porcentaje_ahorro: float = None
+
+    def a_dict(self):
+        """Retorna el resultado como diccionario serializable"""
+        return {
+            'servidores': self.servidores,
+            'dias': self.dias,
+            'mediciones': self.mediciones,
+            'almacenamiento': self.almacenamiento,
+            'periodos': list(self.periodos),
+            'bytes_datos': self.bytes_datos,
+            'bytes_nombres': self.bytes_nombres
+        }
+
+
+@dataclass(frozen=True)
+class ResultadoPromedios:
+    """Promedio de uso de CPU de cada servidor"""
+    nombres: np.ndarray
+    promedios: np.ndarray
+
+    def __len__(self):
+        return len(self.promedios)
+
+    def a_dict(self):
+        """Retorna el resultado como lista de diccionarios serializable"""
+        return [{'servidor': str(nombre), 'promedio': float(promedio)}
+                for nombre, promedio in zip(self.nombres, self.promedios)]
+
+
+@dataclass(frozen=True)
+class ResultadoDiaMayorCarga:
+    """
+    Día con mayor carga total y el uso de cada servidor ese día; sin días
+    cargados el día y su descripción son None
+    """
+    dia: int
+    descripcion: str
+    carga_total: float
+    nombres: np.ndarray
+    valores_dia: np.ndarray
+
+    @property
+    def vacio(self):
+        """Indica si no hay ningún día para elegir"""
+        return self.dia is None
+
+    def a_dict(self):
+        """Retorna el resultado como diccionario serializable"""
+        if self.vacio:
+            return {'dia': None, 'descripcion': None, 'carga_total': None}
+        return {'dia': self.dia + 1, 'descripcion': self.descripcion, 'carga_total': float(self.carga_total)}
+
+
+@dataclass(frozen=True)
+class ResultadoServidorMenorUso:
+    """
+    Servidor con menor uso promedio y sus primeros días; si ningún servidor
+    tiene mediciones la fila y el servidor son None
+    """
+    fila: int
+    servidor: str
+    promedio: float
+    primeros_dias: np.ndarray
+
+    @property
+    def vacio(self):
+        """Indica si no hay ningún servidor con mediciones"""
+        return self.fila is None
+
+    def a_dict(self):
+        """Retorna el resultado como diccionario serializable"""
+        if self.vacio:
+            return {'servidor': None, 'fila': None, 'promedio': None}
+        return {'servidor': self.servidor, 'fila': self.fila + 1, 'promedio': float(self.promedio)}
+
+
+@dataclass(frozen=True)
+class ResultadoTopServidores:
+    """Los K servidores con mayor (o menor) valor de una métrica"""
+    metrica: str
+    mayores: bool
+    filas: np.ndarray
+    nombres: np.ndarray
+    valores: np.ndarray
+
+    def __len__(self):
+        return len(self.filas)
+
+    def a_dict(self):
+        """Retorna el resultado como diccionario serializable"""
+        return {
+            'metrica': self.metrica,
+            'orden': 'mayores' if self.mayores else 'menores',
+            'servidores': [{'servidor': str(nombre), 'fila': int(fila) + 1, 'valor': float(valor)}
+                           for fila, nombre, valor in zip(self.filas, self.nombres, self.valores)]
+        }
+
+
+@dataclass(frozen=True)
+class ResultadoPercentilesDia:
+    """Percentiles del uso de CPU de toda la flota en cada día"""
+    percentiles: tuple
+    valores: np.ndarray
+    descripciones: tuple
+
+    def __len__(self):
+        return len(self.descripciones)
+
+    def a_dict(self):
+        """Retorna el resultado como lista de diccionarios serializable"""
+        return [dict({'dia': dia + 1, 'descripcion': descripcion},
+                     **{f"p{percentil}": float(valor) for percentil, valor in zip(self.percentiles, self.valores[:, dia])})
+                for dia, descripcion in enumerate(self.descripciones)]
+
+
+@dataclass(frozen=True)
+class ResultadoVentanaMovil:
+    """Ventanas móviles de un servidor; cada posición termina en un día"""
+    servidor: str
+    ventana: int
+    dias: np.ndarray
+    descripciones: tuple
+    valores: np.ndarray
+    promedio: np.ndarray
+    minimo: np.ndarray
+    maximo: np.ndarray
+    desviacion: np.ndarray
+    diferencia: np.ndarray
+
+    def __len__(self):
+        return len(self.dias)
+
+    def a_dict(self):
+        """Retorna el resultado como diccionario serializable"""
+        return {
+            'servidor': self.servidor,
+            'ventana': self.ventana,
+            'dias': [
+                {'dia': int(dia) + 1, 'descripcion': self.descripciones[i], 'valor': float(self.valores[i]),
+                 'promedio': float(self.promedio[i]), 'minimo': float(self.minimo[i]),
+                 'maximo': float(self.maximo[i]), 'desviacion': float(self.desviacion[i]),
+                 'diferencia': float(self.diferencia[i])}
+                for i, dia in enumerate(self.dias)
+            ]
+        }
+
+
+@dataclass(frozen=True)
+class ResultadoAlertas:
+    """
+    Mediciones que superan una regla de alerta. Los pares (fila, día) y las
+    rachas están ordenados por servidor y día; los arrays por servidor
+    tienen una posición por cada servidor cargado
+    """
+    regla: str
+    limite: float
+    total_mediciones: int
+    nombres: np.ndarray
+    filas: np.ndarray
+    dias: np.ndarray
+    conteos: np.ndarray
+    racha_maxima: np.ndarray
+    rachas_filas: np.ndarray
+    rachas_inicio: np.ndarray
+    rachas_longitud: np.ndarray
+
+    def __len__(self):
+        return len(self.filas)
+
+    @property
+    def filas_con_alerta(self):
+        """Filas de los servidores con al menos una alerta"""
+        return np.flatnonzero(self.conteos)
+
+    def a_dict(self):
+        """Retorna el resultado como diccionario serializable"""
+        # Los pares y las rachas vienen agrupados por fila: se cortan por servidor
+        filas_alerta = self.filas_con_alerta
+        cortes_dias = np.cumsum(self.conteos[filas_alerta])[:-1]
+        cortes_rachas = np.searchsorted(self.rachas_filas, filas_alerta[1:])
+        dias_por_servidor = np.split(self.dias + 1, cortes_dias)
+        inicios_por_servidor = np.split(self.rachas_inicio + 1, cortes_rachas)
+        longitudes_por_servidor = np.split(self.rachas_longitud, cortes_rachas)
+
+        servidores = []
+        for i, fila in enumerate(filas_alerta):
+            servidores.append({
+                'servidor': str(self.nombres[fila]),
+                'fila': int(fila) + 1,
+                'dias_en_alerta': int(self.conteos[fila]),
+                'racha_maxima': int(self.racha_maxima[fila]),
+                'dias': dias_por_servidor[i].tolist(),
+                'rachas': [{'inicio': inicio, 'fin': inicio + longitud - 1, 'dias': longitud}
+                           for inicio, longitud in zip(inicios_por_servidor[i].tolist(),
+                                                       longitudes_por_servidor[i].tolist())]
+            })
+        return {
+            'regla': self.regla,
+            'limite': self.limite,
+            'mediciones_en_alerta': len(self),
+            'total_mediciones': self.total_mediciones,
+            'servidores_con_alerta': len(servidores),
+            'servidores': servidores
+        }
+
+
+@dataclass(frozen=True)
+class ResultadoCorrelaciones:
+    """Servidores más correlacionados de cada servidor y grupos de carga conjunta"""
+    pares_por_servidor: int
+    umbral: float
+    nombres: np.ndarray
+    filas: np.ndarray
+    correlaciones: np.ndarray
+    grupos: tuple
+
+    def __len__(self):
+        return len(self.grupos)
+
+    def mejores_pares(self, cantidad):
+        """
+        Retorna los pares distintos con mayor correlación de toda la flota
+
+        Args:
+            cantidad: Número máximo de pares
+
+        Returns:
+            tuple: (filas a, filas b, correlaciones) con a < b, de mayor a
+                   menor correlación
+        """
+        origenes = np.broadcast_to(np.arange(len(self.filas))[:, np.newaxis], self.filas.shape)
+        validos = self.filas >= 0
+        a = np.minimum(origenes[validos], self.filas[validos])
+        b = np.maximum(origenes[validos], self.filas[validos])
+        # Cada par aparece una vez por cada extremo que lo tiene entre sus N mejores
+        _, unicos = np.unique(a * len(self.filas) + b, return_index=True)
+        a, b, valores = a[unicos], b[unicos], self.correlaciones[validos][unicos]
+        orden = np.lexsort((b, a, -valores))[:cantidad]
+        return a[orden], b[orden], valores[orden]
+
+    def a_dict(self):
+        """Retorna el resultado como diccionario serializable"""
+        servidores = []
+        for nombre, filas, correlaciones in zip(self.nombres, self.filas, self.correlaciones):
+            validos = filas >= 0
+            servidores.append({
+                'servidor': str(nombre),
+                'correlacionados': [{'servidor': str(self.nombres[fila]), 'correlacion': valor}
+                                    for fila, valor in zip(filas[validos], correlaciones[validos].tolist())]
+            })
+        return {
+            'pares_por_servidor': self.pares_por_servidor,
+            'umbral': self.umbral,
+            'servidores': servidores,
+            'grupos': [[str(nombre) for nombre in self.nombres[grupo]] for grupo in self.grupos]
+        }
+
+
+@dataclass(frozen=True)
+class ResultadoConsolidacion:
+    """
+    Plan de consolidación de los servidores en hosts de igual capacidad. Las
+    cargas tienen una fila por host, en el orden en que se abrieron
+    """
+    capacidad: float
+    nombres: np.ndarray
+    asignacion: np.ndarray
+    cargas: np.ndarray
+    descripciones: tuple
+    excedidos: np.ndarray
+
+    def __len__(self):
+        return len(self.cargas)
+
+    @property
+    def hosts_ahorrados(self):
+        """Hosts que se liberan respecto de un host por servidor"""
+        return len(self.nombres) - len(self)
+
+    @property
+    def holgura_por_dia(self):
+        """Capacidad libre sumando todos los hosts, por día"""
+        return len(self) * self.capacidad - self.cargas.sum(axis=0)
+
+    @property
+    def holgura_minima_por_dia(self):
+        """Capacidad libre del host más cargado, por día"""
+        return self.capacidad - self.cargas.max(axis=0, initial=0.0)
+
+    def servidores_por_host(self):
+        """Retorna las filas de los servidores asignados a cada host"""
+        if len(self) == 0:
+            return []
+        orden = np.argsort(self.asignacion, kind='stable')
+        cortes = np.searchsorted(self.asignacion[orden], np.arange(1, len(self)))
+        return np.split(orden, cortes)
+
+    def a_dict(self):
+        """Retorna el resultado como diccionario serializable"""
+        picos = self.cargas.max(axis=1, initial=0.0)
+        return {
+            'capacidad': self.capacidad,
+            'servidores': len(self.nombres),
+            'hosts': len(self),
+            'hosts_ahorrados': self.hosts_ahorrados,
+            'servidores_excedidos': [str(nombre) for nombre in self.nombres[self.excedidos]],
+            'asignacion': [{'host': host + 1, 'pico': pico,
+                            'servidores': [str(nombre) for nombre in self.nombres[filas]]}
+                           for host, (filas, pico) in enumerate(zip(self.servidores_por_host(), picos.tolist()))],
+            'dias': [{'dia': dia + 1, 'descripcion': descripcion, 'holgura_total': total, 'holgura_minima': minima}
+                     for dia, (descripcion, total, minima) in enumerate(zip(self.descripciones,
+                                                                            self.holgura_por_dia.tolist(),
+                                                                            self.holgura_minima_por_dia.tolist()))]
+        }
+
+
+@dataclass(frozen=True)
+class ResultadoRango:
+    """
+    Agregados de una selección de servidores y de un rango de días. Los
+    arrays tienen una posición por servidor seleccionado; los días son
+    índices absolutos (base 0) y -1 en servidores sin mediciones. Las
+    descripciones son None si el rango no tiene días
+    """
+    filas: np.ndarray
+    nombres: np.ndarray
+    dia_inicio: int
+    dia_fin: int
+    descripcion_inicio: str
+    descripcion_fin: str
+    mediciones: np.ndarray
+    sumas: np.ndarray
+    promedios: np.ndarray
+    maximos: np.ndarray
+    dias_maximo: np.ndarray
+    minimos: np.ndarray
+    dias_minimo: np.ndarray
+
+    def __len__(self):
+        return len(self.filas)
+
+    @property
+    def total_mediciones(self):
+        """Mediciones válidas (no NaN) de toda la selección"""
+        return int(self.mediciones.sum())
+
+    @property
+    def suma(self):
+        """Suma del uso de toda la selección"""
+        return float(self.sumas.sum())
+
+    @property
+    def promedio(self):
+        """Promedio del uso de toda la selección (NaN sin mediciones)"""
+        return self.suma / self.total_mediciones if self.total_mediciones else float('nan')
+
+    def extremo(self, mayor=True):
+        """
+        Retorna el máximo (o mínimo) de toda la selección
+
+        Returns:
+            tuple: (posición del servidor en la selección, día, valor), o
+                   None si no hay mediciones
+        """
+        con_datos = self.mediciones > 0
+        if not con_datos.any():
+            return None
+        valores = self.maximos if mayor else self.minimos
+        posicion = np.where(con_datos, valores, -np.inf if mayor else np.inf)
+        posicion = int(posicion.argmax() if mayor else posicion.argmin())
+        dias = self.dias_maximo if mayor else self.dias_minimo
+        return posicion, int(dias[posicion]), float(valores[posicion])
+
+    def a_dict(self):
+        """Retorna el resultado como diccionario serializable"""
+        extremos = {}
+        for clave, mayor in (('maximo', True), ('minimo', False)):
+            extremo = self.extremo(mayor)
+            extremos[clave] = None if extremo is None else {
+                'servidor': str(self.nombres[extremo[0]]), 'dia': extremo[1] + 1, 'valor': extremo[2]}
+        return {
+            'dias': {'inicio': self.dia_inicio + 1, 'fin': self.dia_fin,
+                     'descripcion_inicio': self.descripcion_inicio, 'descripcion_fin': self.descripcion_fin},
+            'servidores_seleccionados': len(self),
+            'mediciones': self.total_mediciones,
+            'suma': self.suma,
+            'promedio': self.promedio,
+            **extremos,
+            'servidores': [
+                {'servidor': str(nombre), 'fila': fila + 1, 'mediciones': mediciones, 'suma': suma,
+                 'promedio': promedio, 'maximo': maximo, 'dia_maximo': dia_maximo + 1,
+                 'minimo': minimo, 'dia_minimo': dia_minimo + 1}
+                for nombre, fila, mediciones, suma, promedio, maximo, dia_maximo, minimo, dia_minimo in zip(
+                    self.nombres, self.filas.tolist(), self.mediciones.tolist(), self.sumas.tolist(),
+                    self.promedios.tolist(), self.maximos.tolist(), self.dias_maximo.tolist(),
+                    self.minimos.tolist(), self.dias_minimo.tolist())
+            ]
+        }
@@ -0,0 +1 @@
+"""Utilidades de cálculo, series de tiempo, instrumentación y benchmarks"""
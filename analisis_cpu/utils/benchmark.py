@@ -0,0 +1,292 @@
+"""
+Suite de benchmarks del sistema de análisis de CPU
+Genera archivos sintéticos "Servidor_N;v1;...;vD" de tamaño configurable,
+mide la carga, cada análisis y cada consulta, y reporta latencias,
+throughput y memoria pico en JSON. También compara dos reportes para
+detectar regresiones.
+
+Uso:
+    python -m analisis_cpu.utils.benchmark --servidores 100000 --dias 365 --salida base.json
+    python -m analisis_cpu.utils.benchmark --comparar base.json nuevo.json --tolerancia 0.1
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from analisis_cpu.interface.interfaz_usuario import InterfazUsuario
+from analisis_cpu.models.centro_datos import CentroDeDatos
+from analisis_cpu.utils.calculadora import Calculadora
+
+try:
+    import resource
+except ImportError:  # Windows no dispone del módulo resource
+    resource = None
+
+
+def generar_archivo_sintetico(ruta, servidores, dias, semilla=0, filas_por_bloque=10000):
+    """
+    Escribe un archivo de uso de CPU sintético en el formato del sistema
+
+    Args:
+        ruta: Archivo a generar
+        servidores: Número de servidores (filas)
+        dias: Número de días (columnas de valores)
+        semilla: Semilla del generador aleatorio
+        filas_por_bloque: Filas generadas y escritas por bloque
+    """
+    generador = np.random.default_rng(semilla)
+    formato = "Servidor_%d" + ";%.2f" * dias
+    with open(ruta, 'w', encoding='utf-8') as file:
+        for inicio in range(0, servidores, filas_por_bloque):
+            filas = min(filas_por_bloque, servidores - inicio)
+            valores = np.round(generador.uniform(0.0, 100.0, size=(filas, dias)), 2)
+            numeros = np.arange(inicio + 1, inicio + filas + 1, dtype=np.float64)
+            np.savetxt(file, np.column_stack([numeros, valores]), fmt=formato)
+
+
+def memoria_pico_kb():
+    """Retorna el RSS pico del proceso en KB, o None si no se puede medir"""
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reporta bytes y Linux kilobytes
+    return pico // 1024 if sys.platform == "darwin" else pico
+
+
+def medir(funcion, repeticiones, preparar=None, elementos=1):
+    """
+    Mide la latencia de una función
+
+    Args:
+        funcion: Función sin argumentos a medir
+        repeticiones: Número de ejecuciones
+        preparar: Función opcional ejecutada antes de cada medición, fuera del tiempo
+        elementos: Elementos procesados por ejecución para calcular throughput
+
+    Returns:
+        dict: Latencias (media y percentiles) en segundos y throughput
+    """
+    tiempos = np.empty(repeticiones, dtype=np.float64)
+    for i in range(repeticiones):
+        if preparar is not None:
+            preparar()
+        inicio = time.perf_counter()
+        funcion()
+        tiempos[i] = time.perf_counter() - inicio
+
+    media = float(tiempos.mean())
+    return {
+        'repeticiones': repeticiones,
+        'media_s': media,
+        'min_s': float(tiempos.min()),
+        'p50_s': float(np.percentile(tiempos, 50)),
+        'p90_s': float(np.percentile(tiempos, 90)),
+        'p99_s': float(np.percentile(tiempos, 99)),
+        'elementos_por_segundo': elementos / media if media > 0 else None
+    }
+
+
+def ejecutar_benchmarks(archivo, repeticiones=5, consultas=1000, backend="numpy",
+                        almacenamiento="float64", semilla=0):
+    """
+    Ejecuta todos los benchmarks sobre un archivo de datos
+
+    Args:
+        archivo: Archivo de datos a cargar
+        repeticiones: Repeticiones por benchmark de carga y análisis
+        consultas: Número de consultas por benchmark de búsqueda
+        backend: Motor de la calculadora
+        almacenamiento: Modo de almacenamiento de CentroDeDatos
+        semilla: Semilla para elegir servidores y días consultados
+
+    Returns:
+        dict: Resultados por benchmark
+    """
+    resultados = {}
+    centro = CentroDeDatos(backend=backend, almacenamiento=almacenamiento)
+    silencio = open(os.devnull, 'w', encoding='utf-8')
+
+    with silencio, contextlib.redirect_stdout(silencio):
+        resultados['carga_texto'] = medir(lambda: centro.cargar_datos(archivo, usar_cache=False),
+                                          repeticiones)
+        servidores, dias = centro.num_servidores, centro.num_dias
+        resultados['carga_texto']['elementos_por_segundo'] = \
+            servidores / resultados['carga_texto']['media_s']
+
+        centro.cargar_datos(archivo, usar_cache=True)
+        resultados['carga_cache'] = medir(lambda: centro.cargar_datos(archivo, usar_cache=True),
+                                          repeticiones, elementos=servidores)
+
+        # Análisis sin agregados memorizados (costo del primer cálculo)
+        sin_memoria = centro.invalidar_agregados
+        analisis = {
+            'promedios': centro.obtener_promedios,
+            'dia_mayor_carga': centro.obtener_dia_mayor_carga,
+            'servidor_menor_uso': centro.obtener_servidor_menor_uso,
+            'resumen': centro.obtener_resumen,
+            'completo': InterfazUsuario(centro).ejecutar_analisis_completo
+        }
+        for nombre, funcion in analisis.items():
+            resultados[f"analisis_{nombre}"] = medir(funcion, repeticiones, preparar=sin_memoria,
+                                                     elementos=servidores)
+            resultados[f"analisis_{nombre}_memorizado"] = medir(funcion, repeticiones,
+                                                                elementos=servidores)
+
+    # Consultas puntuales con nombres y días aleatorios
+    generador = np.random.default_rng(semilla)
+    nombres = [str(nombre) for nombre in
+               centro.nombres_servidores[generador.integers(0, servidores, size=consultas)]]
+    dias_consulta = generador.integers(1, dias + 1, size=consultas).tolist()
+    iterador_nombres = iter(nombres * repeticiones)
+    iterador_dias = iter(dias_consulta * repeticiones)
+
+    resultados['consulta_servidor'] = medir(
+        lambda: centro.obtener_datos_servidor(next(iterador_nombres)), consultas)
+    resultados['consulta_dia'] = medir(lambda: centro.obtener_datos_dia(next(iterador_dias)), consultas)
+    resultados['consulta_prefijo'] = medir(lambda: centro.buscar_servidores("Servidor_1*"), repeticiones)
+    resultados['consulta_lote_servidores'] = medir(lambda: centro.obtener_datos_servidores(nombres),
+                                                   repeticiones, elementos=len(nombres))
+
+    # Métodos de la calculadora sobre una fila y sobre la matriz completa
+    fila = centro.obtener_datos_servidor(nombres[0])
+    matriz = centro.datos_cpu
+    for motor in Calculadora.BACKENDS:
+        calculadora = Calculadora(backend=motor)
+        for metodo in ('calcular_promedio', 'calcular_suma', 'encontrar_maximo',
+                       'encontrar_minimo', 'calcular_estadisticas'):
+            funcion = getattr(calculadora, metodo)
+            resultados[f"calculadora_{motor}_{metodo}"] = medir(lambda: funcion(fila), repeticiones,
+                                                                elementos=len(fila))
+        if motor == "numpy":
+            for metodo in ('calcular_promedio_por_eje', 'calcular_suma_por_eje',
+                           'encontrar_maximo_por_eje', 'encontrar_minimo_por_eje'):
+                funcion = getattr(calculadora, metodo)
+                resultados[f"calculadora_{motor}_{metodo}"] = medir(lambda: funcion(matriz),
+                                                                    repeticiones, elementos=matriz.size)
+
+    return resultados
+
+
+def crear_reporte(resultados, configuracion):
+    """Construye el documento JSON del reporte"""
+    return {
+        'configuracion': configuracion,
+        'entorno': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'plataforma': platform.platform(),
+            'procesadores': os.cpu_count()
+        },
+        'rss_pico_kb': memoria_pico_kb(),
+        'resultados': resultados
+    }
+
+
+def comparar_reportes(base, nuevo, tolerancia=0.10, metrica='p50_s'):
+    """
+    Compara dos reportes y detecta regresiones de latencia
+
+    Args:
+        base: Reporte de referencia
+        nuevo: Reporte a evaluar
+        tolerancia: Aumento relativo permitido (0.10 = 10 %)
+        metrica: Métrica de latencia a comparar
+
+    Returns:
+        dict: Comparación por benchmark y lista de regresiones
+    """
+    comparacion = {}
+    regresiones = []
+    for nombre, resultado_base in base['resultados'].items():
+        resultado_nuevo = nuevo['resultados'].get(nombre)
+        if resultado_nuevo is None or not resultado_base[metrica]:
+            continue
+        razon = resultado_nuevo[metrica] / resultado_base[metrica]
+        comparacion[nombre] = {'base': resultado_base[metrica], 'nuevo': resultado_nuevo[metrica],
+                               'razon': razon}
+        if razon > 1.0 + tolerancia:
+            regresiones.append(nombre)
+
+    rss_base, rss_nuevo = base.get('rss_pico_kb'), nuevo.get('rss_pico_kb')
+    if rss_base and rss_nuevo and rss_nuevo > rss_base * (1.0 + tolerancia):
+        regresiones.append('rss_pico_kb')
+
+    return {'metrica': metrica, 'tolerancia': tolerancia, 'comparacion': comparacion,
+            'regresiones': regresiones}
+
+
+def crear_parser():
+    """Crea el parser de argumentos del benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmarks del sistema de análisis de CPU")
+    parser.add_argument("--servidores", type=int, default=1000, help="Servidores del archivo sintético")
+    parser.add_argument("--dias", type=int, default=30, help="Días del archivo sintético")
+    parser.add_argument("--archivo", help="Usar este archivo en lugar de generar uno sintético")
+    parser.add_argument("--repeticiones", type=int, default=5, help="Repeticiones por benchmark")
+    parser.add_argument("--consultas", type=int, default=1000, help="Consultas por benchmark de búsqueda")
+    parser.add_argument("--backend", choices=Calculadora.BACKENDS, default="numpy")
+    parser.add_argument("--almacenamiento", choices=CentroDeDatos.ALMACENAMIENTOS, default="float64")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--salida", help="Archivo JSON del reporte (por defecto stdout)")
+    parser.add_argument("--comparar", nargs=2, metavar=("BASE", "NUEVO"),
+                        help="Compara dos reportes en lugar de ejecutar benchmarks")
+    parser.add_argument("--tolerancia", type=float, default=0.10,
+                        help="Aumento relativo de latencia tolerado al comparar")
+    return parser
+
+
+def _escribir_json(documento, salida):
+    """Escribe un documento JSON en un archivo o en stdout"""
+    texto = json.dumps(documento, indent=2, ensure_ascii=False) + "\n"
+    if salida:
+        with open(salida, 'w', encoding='utf-8') as file:
+            file.write(texto)
+    else:
+        sys.stdout.write(texto)
+
+
+def main(argv=None):
+    """
+    Punto de entrada del benchmark
+
+    Returns:
+        int: 0 si no hay regresiones, 1 si las hay
+    """
+    args = crear_parser().parse_args(argv)
+
+    if args.comparar:
+        with open(args.comparar[0], 'r', encoding='utf-8') as file:
+            base = json.load(file)
+        with open(args.comparar[1], 'r', encoding='utf-8') as file:
+            nuevo = json.load(file)
+        comparacion = comparar_reportes(base, nuevo, args.tolerancia)
+        _escribir_json(comparacion, args.salida)
+        return 1 if comparacion['regresiones'] else 0
+
+    configuracion = vars(args).copy()
+    del configuracion['comparar'], configuracion['salida']
+
+    with tempfile.TemporaryDirectory() as directorio:
+        archivo = args.archivo
+        if archivo is None:
+            archivo = os.path.join(directorio, "uso_cpu_sintetico.txt")
+            inicio = time.perf_counter()
+            generar_archivo_sintetico(archivo, args.servidores, args.dias, args.semilla)
+            configuracion['segundos_generacion'] = time.perf_counter() - inicio
+
+        resultados = ejecutar_benchmarks(archivo, args.repeticiones, args.consultas,
+                                         args.backend, args.almacenamiento, args.semilla)
+
+    _escribir_json(crear_reporte(resultados, configuracion), args.salida)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,497 @@
+import heapq
+import warnings
+
+import numpy as np
+
+
+def _tiene_nan(array_datos):
+    """Indica si un array de punto flotante contiene valores NaN"""
+    array_datos = np.asarray(array_datos)
+    return np.issubdtype(array_datos.dtype, np.floating) and bool(np.isnan(array_datos).any())
+
+
+class Calculadora:
+    """
+    Clase que implementa cálculos manuales
+
+    Admite dos motores: "python" recorre los arrays elemento por elemento y
+    sirve como referencia; "numpy" usa las primitivas vectorizadas y devuelve
+    los mismos resultados (incluido el desempate por el primer índice).
+
+    Los valores NaN (mediciones ausentes) se ignoran en todas las
+    reducciones; si un array no tiene ningún valor válido el promedio y los
+    extremos son NaN y el índice es -1.
+    """
+
+    BACKENDS = ("python", "numpy")
+
+    def __init__(self, backend="python"):
+        """
+        Inicializa la calculadora con el motor de cálculo indicado
+
+        Args:
+            backend: "python" (bucles manuales) o "numpy" (vectorizado)
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Backend desconocido '{backend}'. Opciones: {', '.join(self.BACKENDS)}")
+        self.backend = backend
+
+    @property
+    def vectorizada(self):
+        """Indica si la calculadora usa el motor numpy"""
+        return self.backend == "numpy"
+    
+    def calcular_promedio(self, array_datos):
+        """
+        Calcula el promedio de un array numpy 
+        
+        Args:
+            array_datos: Array numpy con los datos
+            
+        Returns:
+            float: Promedio calculado 
+        """
+        if len(array_datos) == 0:
+            return 0.0
+
+        if self.vectorizada:
+            if not _tiene_nan(array_datos):
+                return np.mean(array_datos)
+            validos = array_datos[~np.isnan(array_datos)]
+            return np.mean(validos) if len(validos) else np.nan
+
+        suma = 0.0
+        contador = 0
+        
+        # Iterar manualmente por todos los elementos del array
+        for valor in array_datos:
+            if valor != valor:  # NaN: medición ausente
+                continue
+            suma += valor
+            contador += 1
+        
+        if contador == 0:
+            return np.nan
+        
+        return suma / contador
+    
+    def calcular_suma(self, array_datos):
+        """
+        Calcula la suma de un array numpy 
+        
+        Args:
+            array_datos: Array numpy con los datos
+            
+        Returns:
+            float: Suma calculada manualmente
+        """
+        if self.vectorizada:
+            return np.nansum(array_datos, dtype=np.float64)
+
+        suma = 0.0
+        
+        # Iterar manualmente por todos los elementos del array
+        for valor in array_datos:
+            if valor != valor:  # NaN: medición ausente
+                continue
+            suma += valor
+        
+        return suma
+    
+    def encontrar_maximo(self, array_datos):
+        """
+        Encuentra el valor máximo y su índice
+        
+        Args:
+            array_datos: Array numpy con los datos
+            
+        Returns:
+            tuple: (índice_máximo, valor_máximo)
+        """
+        if len(array_datos) == 0:
+            return -1, 0.0
+
+        if self.vectorizada:
+            indices, valores = self._extremo_numpy(np.asarray(array_datos)[np.newaxis, :], 1, np.argmax, -np.inf)
+            return int(indices[0]), valores[0]
+        
+        max_valor = np.nan
+        max_indice = -1
+        
+        # Iterar manualmente para encontrar el máximo
+        for i in range(len(array_datos)):
+            if array_datos[i] != array_datos[i]:  # NaN: medición ausente
+                continue
+            if max_indice == -1 or array_datos[i] > max_valor:
+                max_valor = array_datos[i]
+                max_indice = i
+        
+        return max_indice, max_valor
+    
+    def encontrar_minimo(self, array_datos):
+        """
+        Encuentra el valor mínimo y su índice de forma manual
+        
+        Args:
+            array_datos: Array numpy con los datos
+            
+        Returns:
+            tuple: (índice_mínimo, valor_mínimo)
+        """
+        if len(array_datos) == 0:
+            return -1, 0.0
+
+        if self.vectorizada:
+            indices, valores = self._extremo_numpy(np.asarray(array_datos)[np.newaxis, :], 1, np.argmin, np.inf)
+            return int(indices[0]), valores[0]
+        
+        min_valor = np.nan
+        min_indice = -1
+        
+        # Iterar manualmente para encontrar el mínimo
+        for i in range(len(array_datos)):
+            if array_datos[i] != array_datos[i]:  # NaN: medición ausente
+                continue
+            if min_indice == -1 or array_datos[i] < min_valor:
+                min_valor = array_datos[i]
+                min_indice = i
+        
+        return min_indice, min_valor
+    
+    def calcular_estadisticas(self, array_datos):
+        """
+        Calcula estadísticas básicas
+        
+        Args:
+            array_datos: Array numpy con los datos
+            
+        Returns:
+            dict: Diccionario con las estadísticas calculadas
+        """
+        if len(array_datos) == 0:
+            return {
+                'promedio': 0.0,
+                'suma': 0.0,
+                'maximo': 0.0,
+                'minimo': 0.0,
+                'indice_maximo': -1,
+                'indice_minimo': -1
+            }
+
+        if self.vectorizada:
+            max_indice, max_valor = self.encontrar_maximo(array_datos)
+            min_indice, min_valor = self.encontrar_minimo(array_datos)
+            return {
+                'promedio': self.calcular_promedio(array_datos),
+                'suma': self.calcular_suma(array_datos),
+                'maximo': max_valor,
+                'minimo': min_valor,
+                'indice_maximo': max_indice,
+                'indice_minimo': min_indice,
+                'total_elementos': len(array_datos)
+            }
+        
+        # Calcular todas las estadísticas en una sola pasada
+        suma = 0.0
+        validos = 0
+        max_valor = np.nan
+        min_valor = np.nan
+        max_indice = -1
+        min_indice = -1
+        
+        for i, valor in enumerate(array_datos):
+            if valor != valor:  # NaN: medición ausente
+                continue
+            suma += valor
+            validos += 1
+            
+            if max_indice == -1 or valor > max_valor:
+                max_valor = valor
+                max_indice = i
+            
+            if min_indice == -1 or valor < min_valor:
+                min_valor = valor
+                min_indice = i
+        
+        promedio = suma / validos if validos else np.nan
+        
+        return {
+            'promedio': promedio,
+            'suma': suma,
+            'maximo': max_valor,
+            'minimo': min_valor,
+            'indice_maximo': max_indice,
+            'indice_minimo': min_indice,
+            'total_elementos': len(array_datos)
+        }
+    
+    def comparar_arrays(self, array1, array2):
+        """
+        Compara dos arrays elemento por elemento 
+        
+        Args:
+            array1: Primer array numpy
+            array2: Segundo array numpy
+            
+        Returns:
+            dict: Diccionario con los resultados de la comparación
+        """
+        if len(array1) != len(array2):
+            return {'error': 'Los arrays tienen diferentes tamaños'}
+
+        if self.vectorizada:
+            return self._comparar_arrays_numpy(np.asarray(array1), np.asarray(array2))
+        
+        elementos_iguales = 0
+        diferencias = []
+        
+        for i in range(len(array1)):
+            if abs(array1[i] - array2[i]) < 1e-10:  # Consideramos iguales con tolerancia
+                elementos_iguales += 1
+            else:
+                diferencias.append({
+                    'indice': i,
+                    'valor1': array1[i],
+                    'valor2': array2[i],
+                    'diferencia': abs(array1[i] - array2[i])
+                })
+        
+        return {
+            'elementos_iguales': elementos_iguales,
+            'elementos_diferentes': len(diferencias),
+            'porcentaje_igualdad': (elementos_iguales / len(array1)) * 100,
+            'diferencias': diferencias
+        }
+
+    def _comparar_arrays_numpy(self, array1, array2):
+        """Versión vectorizada de comparar_arrays con el mismo formato de salida"""
+        diferencia = np.abs(array1 - array2)
+        distintos = np.nonzero(~(diferencia < 1e-10))[0]
+        elementos_iguales = len(array1) - len(distintos)
+
+        diferencias = [
+            {
+                'indice': int(i),
+                'valor1': array1[i],
+                'valor2': array2[i],
+                'diferencia': diferencia[i]
+            }
+            for i in distintos
+        ]
+
+        return {
+            'elementos_iguales': elementos_iguales,
+            'elementos_diferentes': len(diferencias),
+            'porcentaje_igualdad': (elementos_iguales / len(array1)) * 100,
+            'diferencias': diferencias
+        }
+
+    def _reducir_por_eje(self, matriz, eje, funcion):
+        """
+        Aplica una reducción escalar a cada fila (eje=1) o columna (eje=0)
+        de la matriz; es el camino de referencia del motor "python"
+        """
+        if eje not in (0, 1):
+            raise ValueError("El eje debe ser 0 (columnas) o 1 (filas)")
+        vectores = matriz.T if eje == 0 else matriz
+        return [funcion(vector) for vector in vectores]
+
+    def calcular_promedio_por_eje(self, matriz, eje=1):
+        """
+        Calcula el promedio de cada fila o columna de una matriz en una llamada
+
+        Args:
+            matriz: Array numpy bidimensional
+            eje: 1 para promediar cada fila, 0 para cada columna
+
+        Returns:
+            numpy.ndarray: Promedios resultantes
+        """
+        if self.vectorizada and matriz.shape[eje] > 0:
+            if not _tiene_nan(matriz):
+                return np.mean(matriz, axis=eje)
+            validos = ~np.isnan(matriz)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                return np.where(validos, matriz, 0.0).sum(axis=eje, dtype=np.float64) / validos.sum(axis=eje)
+        return np.array(self._reducir_por_eje(matriz, eje, self.calcular_promedio), dtype=np.float64)
+
+    def calcular_suma_por_eje(self, matriz, eje=1):
+        """
+        Calcula la suma de cada fila o columna de una matriz en una llamada
+
+        Args:
+            matriz: Array numpy bidimensional
+            eje: 1 para sumar cada fila, 0 para cada columna
+
+        Returns:
+            numpy.ndarray: Sumas resultantes
+        """
+        if self.vectorizada:
+            return np.nansum(matriz, axis=eje, dtype=np.float64)
+        return np.array(self._reducir_por_eje(matriz, eje, self.calcular_suma), dtype=np.float64)
+
+    def encontrar_maximo_por_eje(self, matriz, eje=1):
+        """
+        Encuentra el máximo de cada fila o columna y su índice
+
+        Args:
+            matriz: Array numpy bidimensional
+            eje: 1 para cada fila, 0 para cada columna
+
+        Returns:
+            tuple: (array_índices, array_valores)
+        """
+        return self._extremo_por_eje(matriz, eje, np.argmax, -np.inf, self.encontrar_maximo)
+
+    def encontrar_minimo_por_eje(self, matriz, eje=1):
+        """
+        Encuentra el mínimo de cada fila o columna y su índice
+
+        Args:
+            matriz: Array numpy bidimensional
+            eje: 1 para cada fila, 0 para cada columna
+
+        Returns:
+            tuple: (array_índices, array_valores)
+        """
+        return self._extremo_por_eje(matriz, eje, np.argmin, np.inf, self.encontrar_minimo)
+
+    def _extremo_por_eje(self, matriz, eje, arg_funcion, neutro, funcion_escalar):
+        """Comparte la lógica de máximo/mínimo por eje entre ambos motores"""
+        if self.vectorizada and matriz.shape[eje] > 0:
+            return self._extremo_numpy(matriz, eje, arg_funcion, neutro)
+
+        resultados = self._reducir_por_eje(matriz, eje, funcion_escalar)
+        indices = np.array([indice for indice, _ in resultados], dtype=np.intp)
+        valores = np.array([valor for _, valor in resultados], dtype=matriz.dtype)
+        return indices, valores
+
+    @staticmethod
+    def _extremo_numpy(matriz, eje, arg_funcion, neutro):
+        """
+        Máximo/mínimo vectorizado ignorando NaN; los NaN se sustituyen por
+        el neutro de la comparación y las filas sin datos válidos devuelven
+        índice -1 y valor NaN
+        """
+        if not _tiene_nan(matriz):
+            indices = arg_funcion(matriz, axis=eje)
+            valores = np.take_along_axis(matriz, np.expand_dims(indices, axis=eje), axis=eje)
+            return indices, valores.squeeze(axis=eje)
+
+        ausentes = np.isnan(matriz)
+        indices = arg_funcion(np.where(ausentes, neutro, matriz), axis=eje)
+        valores = np.take_along_axis(matriz, np.expand_dims(indices, axis=eje), axis=eje).squeeze(axis=eje)
+        sin_datos = ausentes.all(axis=eje)
+        indices[sin_datos] = -1
+        return indices, valores
+
+    def seleccionar_k_extremos(self, array_datos, k, mayores=True):
+        """
+        Selecciona los k valores mayores (o menores) y sus índices, ordenados
+        del más extremo al menos extremo, con desempate por el primer índice.
+        El motor numpy usa selección parcial (argpartition) en O(n) y solo
+        ordena los k elegidos
+
+        Args:
+            array_datos: Array numpy con los datos (los NaN se ignoran)
+            k: Número de elementos a seleccionar
+            mayores: True para los mayores, False para los menores
+
+        Returns:
+            tuple: (array_índices, array_valores) con a lo sumo k elementos
+        """
+        array_datos = np.asarray(array_datos)
+        if k < 0:
+            raise ValueError("k debe ser mayor o igual a 0")
+
+        if self.vectorizada:
+            indices = np.flatnonzero(~np.isnan(array_datos)) if _tiene_nan(array_datos) \
+                else np.arange(len(array_datos))
+            clave = array_datos[indices].astype(np.float64)
+            if mayores:
+                clave = -clave
+            k = min(k, len(indices))
+            if 0 < k < len(indices):
+                # El k-ésimo valor de la partición es el umbral: entran todos
+                # los estrictamente mejores y los empatados de menor índice
+                umbral = np.partition(clave, k - 1)[k - 1]
+                mejores = np.flatnonzero(clave < umbral)
+                empatados = np.flatnonzero(clave == umbral)[:k - len(mejores)]
+                elegidos = np.concatenate([mejores, empatados])
+            else:
+                elegidos = np.arange(k)
+            orden = elegidos[np.lexsort((elegidos, clave[elegidos]))]
+            return indices[orden], array_datos[indices[orden]]
+
+        signo = -1 if mayores else 1
+        validos = [i for i in range(len(array_datos)) if array_datos[i] == array_datos[i]]
+        elegidos = heapq.nsmallest(k, validos, key=lambda i: (signo * array_datos[i], i))
+        return (np.array(elegidos, dtype=np.intp),
+                np.array([array_datos[i] for i in elegidos], dtype=array_datos.dtype))
+
+    def calcular_percentil(self, array_datos, percentil):
+        """
+        Calcula un percentil con interpolación lineal, ignorando los NaN
+
+        Args:
+            array_datos: Array numpy con los datos
+            percentil: Percentil entre 0 y 100
+
+        Returns:
+            float: Valor del percentil, o NaN si no hay valores válidos
+        """
+        if self.vectorizada:
+            return self.calcular_percentiles_por_eje(np.asarray(array_datos)[np.newaxis, :], (percentil,))[0, 0]
+
+        ordenados = sorted(valor for valor in array_datos if valor == valor)
+        if not ordenados:
+            return np.nan
+        posicion = (len(ordenados) - 1) * percentil / 100.0
+        inferior = int(posicion)
+        superior = min(inferior + 1, len(ordenados) - 1)
+        return ordenados[inferior] + (ordenados[superior] - ordenados[inferior]) * (posicion - inferior)
+
+    def calcular_percentiles_por_eje(self, matriz, percentiles, eje=1):
+        """
+        Calcula varios percentiles de cada fila o columna en una sola pasada
+        (np.percentile usa selección parcial, no un ordenamiento completo)
+
+        Args:
+            matriz: Array numpy bidimensional
+            percentiles: Secuencia de percentiles entre 0 y 100
+            eje: 1 para cada fila, 0 para cada columna
+
+        Returns:
+            numpy.ndarray: Matriz (percentiles x filas o columnas)
+        """
+        if any(not 0 <= percentil <= 100 for percentil in percentiles):
+            raise ValueError("Los percentiles deben estar entre 0 y 100")
+
+        if self.vectorizada and matriz.shape[eje] > 0:
+            if not _tiene_nan(matriz):
+                return self._percentiles_numpy(matriz, percentiles, eje)
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)  # filas sin datos válidos
+                return np.nanpercentile(matriz, percentiles, axis=eje)
+
+        columnas = [self._reducir_por_eje(matriz, eje, lambda vector: self.calcular_percentil(vector, percentil))
+                    for percentil in percentiles]
+        return np.array(columnas, dtype=np.float64).reshape(len(percentiles), matriz.shape[1 - eje])
+
+    @staticmethod
+    def _percentiles_numpy(matriz, percentiles, eje):
+        """
+        Percentiles sin NaN mediante una única partición in situ de una copia
+        contigua (una fila por vector reducido), seleccionando a la vez todas
+        las posiciones que necesita la interpolación lineal
+        """
+        # Siempre una copia: la partición in situ no debe reordenar los datos
+        vectores = np.array(matriz.T if eje == 0 else matriz, dtype=np.float64, order='C')
+        n = vectores.shape[1]
+        posiciones = np.asarray(percentiles, dtype=np.float64) / 100.0 * (n - 1)
+        inferiores = np.floor(posiciones).astype(np.intp)
+        superiores = np.minimum(inferiores + 1, n - 1)
+        vectores.partition(np.unique(np.concatenate([inferiores, superiores])), axis=1)
+        fraccion = (posiciones - inferiores)[:, np.newaxis]
+        bajos, altos = vectores[:, inferiores].T, vectores[:, superiores].T
+        return bajos + (altos - bajos) * fraccion
@@ -0,0 +1,207 @@
+"""
+Planificación de la consolidación de servidores
+Asigna la carga diaria de cada servidor a la menor cantidad de hosts
+posible sin que ningún host supere su capacidad en ningún día: un problema
+de empaquetado vectorial (una dimensión por día) resuelto con el heurístico
+first-fit decreasing.
+"""
+
+import numpy as np
+
+
+class Consolidacion:
+    """
+    Clase que asigna servidores a hosts con first-fit decreasing vectorial
+
+    Los servidores se ordenan por su carga total (suma de todos los días) de
+    mayor a menor y cada uno va al primer host abierto en el que cabe todos
+    los días; si no cabe en ninguno se abre un host nuevo. Un día sin
+    medición se toma como el pico del propio servidor, de modo que el plan
+    nunca subestima la carga.
+
+    Como Calculadora, admite el motor "numpy" (descarta hosts con dos
+    condiciones necesarias vectorizadas y verifica los restantes por bloques)
+    y el motor "python" de referencia (recorre hosts y días uno a uno).
+    """
+
+    BACKENDS = ("python", "numpy")
+
+    # Hosts candidatos verificados día a día en cada paso del motor numpy
+    HOSTS_POR_BLOQUE = 32
+
+    # Días usados para descartar hosts antes de verificar todos los días:
+    # los de mayor demanda del servidor y los de menor holgura de cada host
+    DIAS_FILTRO = 8
+
+    # Tolerancia de las comparaciones con la capacidad
+    TOLERANCIA = 1e-9
+
+    def __init__(self, backend="numpy"):
+        """
+        Inicializa el planificador
+
+        Args:
+            backend: "python" (bucles manuales) o "numpy" (vectorizado)
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Backend desconocido '{backend}'. Opciones: {', '.join(self.BACKENDS)}")
+        self.backend = backend
+
+    @property
+    def vectorizada(self):
+        """Indica si se usa el motor numpy"""
+        return self.backend == "numpy"
+
+    @staticmethod
+    def demanda(matriz):
+        """
+        Prepara la demanda diaria de cada servidor: float64 y los días sin
+        medición reemplazados por el pico del servidor (0 si no tiene datos)
+
+        Args:
+            matriz: Array numpy bidimensional (servidores x días)
+
+        Returns:
+            numpy.ndarray: Demanda (servidores x días)
+        """
+        matriz = np.asarray(matriz, dtype=np.float64)
+        if matriz.ndim != 2:
+            raise ValueError("Se esperaba una matriz (servidores x días)")
+        ausentes = np.isnan(matriz)
+        if not ausentes.any():
+            return matriz
+        picos = np.where(ausentes.all(axis=1), 0.0, np.nanmax(np.where(ausentes, -np.inf, matriz), axis=1))
+        return np.where(ausentes, picos[:, np.newaxis], matriz)
+
+    def planificar(self, matriz, capacidad):
+        """
+        Asigna cada servidor a un host
+
+        Args:
+            matriz: Array numpy bidimensional (servidores x días)
+            capacidad: Capacidad de cada host en las mismas unidades que el uso
+
+        Returns:
+            numpy.ndarray: Host (0, 1, ... en orden de apertura) de cada
+                           servidor. Un servidor que supera la capacidad
+                           algún día queda solo en su host
+        """
+        if capacidad <= 0:
+            raise ValueError("La capacidad del host debe ser mayor que 0")
+        demanda = self.demanda(matriz)
+        totales = demanda.sum(axis=1)
+        # Mayor carga total primero; a igual carga, la primera fila
+        orden = np.lexsort((np.arange(len(totales)), -totales))
+        if self.vectorizada:
+            return self._planificar_numpy(demanda, totales, orden, capacidad)
+        return self._planificar_python(demanda, orden, capacidad)
+
+    @staticmethod
+    def cargas_por_host(demanda, asignacion):
+        """
+        Suma la demanda de los servidores asignados a cada host
+
+        Args:
+            demanda: Demanda (servidores x días) según demanda()
+            asignacion: Host de cada servidor según planificar()
+
+        Returns:
+            numpy.ndarray: Carga diaria de cada host (hosts x días)
+        """
+        if not len(asignacion):
+            return np.zeros((0, demanda.shape[1]))
+        orden = np.argsort(asignacion, kind='stable')
+        inicios = np.searchsorted(asignacion[orden], np.arange(asignacion.max() + 1))
+        return np.add.reduceat(demanda[orden], inicios, axis=0)
+
+    def _planificar_numpy(self, demanda, totales, orden, capacidad):
+        """
+        First-fit decreasing con verificaciones vectorizadas. Antes de
+        comparar todos los días se descartan, en una pasada sobre los hosts
+        abiertos, los que tienen una holgura total menor que la carga total
+        del servidor o no tienen holgura en los DIAS_FILTRO días de mayor
+        demanda del servidor o en sus propios DIAS_FILTRO días más justos
+        """
+        servidores, dias = demanda.shape
+        if not dias:
+            # Sin días no hay carga: todos los servidores caben en un host
+            return np.zeros(servidores, dtype=np.intp)
+        # Holgura por día y host (días x hosts): los días de un servidor son
+        # filas contiguas y la holgura de los días más justos de cada host se
+        # guarda aparte para que los descartes no recorran la matriz completa
+        holgura = np.empty((dias, servidores))
+        holgura_total = np.empty(servidores)
+        k = min(self.DIAS_FILTRO, dias)
+        dias_pico = np.argpartition(-demanda, k - 1, axis=1)[:, :k]
+        # El día de mayor demanda en la primera columna
+        dias_pico = np.take_along_axis(dias_pico, np.argsort(-np.take_along_axis(demanda, dias_pico, axis=1),
+                                                              axis=1, kind='stable'), axis=1)
+        dias_justos = np.zeros((k, servidores), dtype=np.intp)
+        holgura_justa = np.empty((k, servidores))
+        asignacion = np.full(servidores, -1, dtype=np.intp)
+        abiertos = 0
+
+        for fila in orden:
+            carga = demanda[fila]
+            minimo = carga - self.TOLERANCIA
+            # Descartes de menor a mayor costo: una pasada sobre los hosts
+            # abiertos con la holgura total, el día de mayor demanda del
+            # servidor y el día más justo de cada host; luego los demás días
+            # pico y días justos, uno a uno, solo sobre los candidatos
+            picos = dias_pico[fila]
+            candidatos = np.flatnonzero((holgura_total[:abiertos] >= totales[fila] - self.TOLERANCIA)
+                                        & (holgura[picos[0], :abiertos] >= minimo[picos[0]])
+                                        & (holgura_justa[0, :abiertos] >= minimo[dias_justos[0, :abiertos]]))
+            for j in range(1, k):
+                if not candidatos.size:
+                    break
+                candidatos = candidatos[(holgura[picos[j]].take(candidatos) >= minimo[picos[j]])
+                                        & (holgura_justa[j].take(candidatos)
+                                           >= minimo.take(dias_justos[j].take(candidatos)))]
+            host = -1
+            for inicio in range(0, len(candidatos), self.HOSTS_POR_BLOQUE):
+                bloque = candidatos[inicio:inicio + self.HOSTS_POR_BLOQUE]
+                caben = (holgura[:, bloque] >= minimo[:, np.newaxis]).all(axis=0)
+                if caben.any():
+                    host = bloque[caben.argmax()]
+                    break
+            if host < 0:
+                host = abiertos
+                abiertos += 1
+                holgura[:, host] = capacidad
+                holgura_total[host] = capacidad * dias
+
+            holgura[:, host] -= carga
+            holgura_total[host] -= totales[fila]
+            # El día más justo en la primera columna
+            justos = np.argpartition(holgura[:, host], k - 1)[:k]
+            justos = justos[np.argsort(holgura[justos, host], kind='stable')]
+            dias_justos[:, host] = justos
+            holgura_justa[:, host] = holgura[justos, host]
+            asignacion[fila] = host
+        return asignacion
+
+    def _planificar_python(self, demanda, orden, capacidad):
+        """Referencia: first-fit decreasing recorriendo hosts y días"""
+        servidores, dias = demanda.shape
+        holguras = []
+        asignacion = np.full(servidores, -1, dtype=np.intp)
+        for fila in orden:
+            carga = demanda[fila]
+            host = -1
+            for candidato, holgura in enumerate(holguras):
+                cabe = True
+                for dia in range(dias):
+                    if holgura[dia] < carga[dia] - self.TOLERANCIA:
+                        cabe = False
+                        break
+                if cabe:
+                    host = candidato
+                    break
+            if host < 0:
+                host = len(holguras)
+                holguras.append([capacidad] * dias)
+            for dia in range(dias):
+                holguras[host][dia] -= carga[dia]
+            asignacion[fila] = host
+        return asignacion
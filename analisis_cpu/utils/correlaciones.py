@@ -0,0 +1,205 @@
+"""
+Correlación entre servidores
+Calcula la correlación de Pearson del uso diario entre todos los pares de
+servidores como un producto de matrices de filas centradas y normalizadas,
+por bloques de filas, conservando solo los N pares más correlacionados de
+cada servidor; la matriz completa servidores x servidores nunca se guarda.
+"""
+
+import heapq
+
+import numpy as np
+
+
+class Correlaciones:
+    """
+    Clase que calcula los servidores más correlacionados y los agrupa
+
+    Los días sin medición (NaN) se reemplazan por la media del propio
+    servidor, de modo que no aportan a la covarianza. Los servidores con uso
+    constante no tienen correlación definida y no forman pares.
+
+    Como Calculadora, admite el motor "numpy" (producto de matrices por
+    bloques) y el motor "python" de referencia (sumas par a par).
+    """
+
+    BACKENDS = ("python", "numpy")
+
+    # Elementos de cada bloque del producto (filas del bloque x servidores):
+    # 2**22 valores float32 son 16 MB sin importar el tamaño de la flota
+    ELEMENTOS_POR_BLOQUE = 2 ** 22
+
+    # dtype del producto del motor numpy: float32 duplica la velocidad y su
+    # error (~1e-6 en una correlación) no altera los pares relevantes
+    DTYPE_PRODUCTO = np.float32
+
+    def __init__(self, backend="numpy"):
+        """
+        Inicializa el motor de correlaciones
+
+        Args:
+            backend: "python" (bucles manuales) o "numpy" (vectorizado)
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Backend desconocido '{backend}'. Opciones: {', '.join(self.BACKENDS)}")
+        self.backend = backend
+
+    @property
+    def vectorizada(self):
+        """Indica si se usa el motor numpy"""
+        return self.backend == "numpy"
+
+    @staticmethod
+    def normalizar(matriz):
+        """
+        Centra cada fila en su media y la divide por su norma, de modo que
+        el producto escalar de dos filas es su correlación de Pearson
+
+        Args:
+            matriz: Array numpy bidimensional (servidores x días)
+
+        Returns:
+            tuple: (filas normalizadas float64, máscara de filas con variación)
+        """
+        matriz = np.asarray(matriz, dtype=np.float64)
+        if matriz.ndim != 2:
+            raise ValueError("Se esperaba una matriz (servidores x días)")
+        validos = ~np.isnan(matriz)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            medias = np.where(validos.any(axis=1), np.nansum(matriz, axis=1) / validos.sum(axis=1), 0.0)
+        centrada = np.where(validos, matriz - medias[:, np.newaxis], 0.0)
+        normas = np.sqrt(np.einsum('ij,ij->i', centrada, centrada))
+        # Una fila constante tiene norma ~0 respecto de su escala: sin correlación
+        con_variacion = normas > 1e-12 * np.maximum(np.abs(medias), 1.0) * np.sqrt(matriz.shape[1])
+        centrada[con_variacion] /= normas[con_variacion, np.newaxis]
+        centrada[~con_variacion] = 0.0
+        return centrada, con_variacion
+
+    def pares_mas_correlacionados(self, matriz, n, tamano_bloque=None):
+        """
+        Retorna para cada servidor los N servidores con mayor correlación
+
+        Args:
+            matriz: Array numpy bidimensional (servidores x días)
+            n: Pares por servidor
+            tamano_bloque: Filas por bloque del producto (por defecto según
+                           ELEMENTOS_POR_BLOQUE)
+
+        Returns:
+            tuple: (filas, correlaciones), ambas de forma (servidores x n) y
+                   ordenadas de mayor a menor correlación (desempate por la
+                   primera fila); los huecos quedan con fila -1 y NaN
+        """
+        if n < 1:
+            raise ValueError("El número de pares debe ser mayor o igual a 1")
+        normalizada, con_variacion = self.normalizar(matriz)
+        if self.vectorizada:
+            return self._pares_numpy(normalizada, con_variacion, n, tamano_bloque)
+        return self._pares_python(normalizada, con_variacion, n)
+
+    def _pares_numpy(self, normalizada, con_variacion, n, tamano_bloque):
+        """Producto por bloques de filas y selección parcial de los N mayores"""
+        servidores = normalizada.shape[0]
+        filas = np.full((servidores, n), -1, dtype=np.intp)
+        correlaciones = np.full((servidores, n), np.nan)
+        k = min(n, servidores - 1)
+        if k < 1:
+            return filas, correlaciones
+
+        normalizada = normalizada.astype(self.DTYPE_PRODUCTO)
+        sin_variacion = np.flatnonzero(~con_variacion)
+        tamano_bloque = tamano_bloque or max(1, self.ELEMENTOS_POR_BLOQUE // servidores)
+        for inicio in range(0, servidores, tamano_bloque):
+            fin = min(inicio + tamano_bloque, servidores)
+            bloque = normalizada[inicio:fin] @ normalizada.T
+            # Excluir el propio servidor y los servidores sin variación
+            bloque[np.arange(fin - inicio), np.arange(inicio, fin)] = -np.inf
+            if sin_variacion.size:
+                bloque[:, sin_variacion] = -np.inf
+
+            candidatos = np.argpartition(bloque, servidores - k, axis=1)[:, servidores - k:]
+            valores = np.take_along_axis(bloque, candidatos, axis=1)
+            orden = np.lexsort((candidatos, -valores), axis=1)
+            candidatos = np.take_along_axis(candidatos, orden, axis=1)
+            valores = np.take_along_axis(valores, orden, axis=1)
+
+            validos = np.isfinite(valores) & con_variacion[inicio:fin, np.newaxis]
+            filas[inicio:fin, :k] = np.where(validos, candidatos, -1)
+            correlaciones[inicio:fin, :k] = np.where(validos, np.clip(valores, -1.0, 1.0), np.nan)
+        return filas, correlaciones
+
+    @staticmethod
+    def _pares_python(normalizada, con_variacion, n):
+        """Referencia: producto escalar de cada par con bucles manuales"""
+        servidores, dias = normalizada.shape
+        filas = np.full((servidores, n), -1, dtype=np.intp)
+        correlaciones = np.full((servidores, n), np.nan)
+        for i in range(servidores):
+            if not con_variacion[i]:
+                continue
+            candidatos = []
+            for j in range(servidores):
+                if j == i or not con_variacion[j]:
+                    continue
+                producto = 0.0
+                for d in range(dias):
+                    producto += normalizada[i, d] * normalizada[j, d]
+                candidatos.append((min(max(producto, -1.0), 1.0), j))
+            mejores = heapq.nsmallest(n, candidatos, key=lambda par: (-par[0], par[1]))
+            for posicion, (valor, j) in enumerate(mejores):
+                filas[i, posicion] = j
+                correlaciones[i, posicion] = valor
+        return filas, correlaciones
+
+    def agrupar(self, filas, correlaciones, umbral):
+        """
+        Agrupa los servidores unidos por pares con correlación mayor o igual
+        al umbral (componentes conexas del grafo de pares)
+
+        Args:
+            filas: Filas de los pares por servidor (servidores x n)
+            correlaciones: Correlación de cada par (servidores x n)
+            umbral: Correlación mínima para unir dos servidores
+
+        Returns:
+            numpy.ndarray: Etiqueta de grupo por servidor: la menor fila del
+                           grupo (un servidor aislado se etiqueta a sí mismo)
+        """
+        servidores = filas.shape[0]
+        with np.errstate(invalid='ignore'):
+            unidos = (filas >= 0) & (correlaciones >= umbral)
+        origenes = np.repeat(np.arange(servidores), unidos.sum(axis=1))
+        destinos = filas[unidos]
+
+        if not self.vectorizada:
+            return self._agrupar_python(servidores, origenes, destinos)
+
+        # Propagación de la menor etiqueta por las aristas con saltos de
+        # punteros; converge en pocas pasadas por el diámetro de los grupos
+        etiquetas = np.arange(servidores)
+        while True:
+            minimas = np.minimum(etiquetas[origenes], etiquetas[destinos])
+            nuevas = etiquetas.copy()
+            np.minimum.at(nuevas, origenes, minimas)
+            np.minimum.at(nuevas, destinos, minimas)
+            nuevas = nuevas[nuevas]
+            if np.array_equal(nuevas, etiquetas):
+                return etiquetas
+            etiquetas = nuevas
+
+    @staticmethod
+    def _agrupar_python(servidores, origenes, destinos):
+        """Referencia: unión-búsqueda con compresión de caminos"""
+        padres = list(range(servidores))
+
+        def raiz(x):
+            while padres[x] != x:
+                padres[x] = padres[padres[x]]
+                x = padres[x]
+            return x
+
+        for origen, destino in zip(origenes, destinos):
+            a, b = raiz(origen), raiz(destino)
+            if a != b:
+                padres[max(a, b)] = min(a, b)
+        return np.array([raiz(x) for x in range(servidores)], dtype=np.intp)
@@ -0,0 +1,297 @@
+"""
+Instrumentación opcional de rendimiento
+Registra tiempo de pared, tiempo de CPU y memoria asignada (tracemalloc) por
+acción del menú y por llamada a CentroDeDatos/Calculadora, con contadores
+acumulados e histogramas en memoria. Puede además perfilar cada acción con
+cProfile y guardar un archivo .prof.
+
+Está desactivada por defecto: mientras no se llame a activar() las clases no
+se modifican y el costo es nulo. Se activa con la variable de entorno
+ANALISIS_CPU_INSTRUMENTACION=1 o con la opción --instrumentar de main.py.
+
+Puede medirse desde varios hilos a la vez (por ejemplo los bloques paralelos
+de CentroDeDatos): la profundidad de anidamiento es propia de cada hilo y los
+contadores se actualizan con un lock. El pico de memoria de tracemalloc, en
+cambio, es uno solo para todo el proceso, así que solo se informa para las
+mediciones exteriores que no se solaparon con otra de otro hilo; las demás
+cuentan en 'picos_omitidos'. Sus bytes netos incluyen lo que asignaron los
+otros hilos mientras tanto.
+"""
+
+import cProfile
+import functools
+import json
+import os
+import re
+import threading
+import time
+import tracemalloc
+
+VARIABLE_ENTORNO = "ANALISIS_CPU_INSTRUMENTACION"
+VARIABLE_PERFIL = "ANALISIS_CPU_PERFIL_DIR"
+
+# Límites superiores (segundos) de los intervalos del histograma de tiempos
+LIMITES_HISTOGRAMA = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 10.0, float("inf"))
+
+
+class Instrumentacion:
+    """Clase que acumula las mediciones de rendimiento del sistema"""
+
+    def __init__(self):
+        """Inicializa la instrumentación desactivada y sin mediciones"""
+        self.activa = False
+        self.directorio_perfil = None
+        self._metricas = {}
+        self._hilo = threading.local()
+        self._lock = threading.Lock()
+        # Mediciones exteriores en curso en todos los hilos y cuántas veces
+        # comenzó una mientras había otra (invalida el pico de memoria)
+        self._exteriores_activas = 0
+        self._solapamientos = 0
+        self._perfiles_guardados = 0
+        self._clases_instrumentadas = []
+
+    def activar(self, directorio_perfil=None, clases=()):
+        """
+        Activa la instrumentación e instrumenta los métodos públicos de las
+        clases indicadas
+
+        Args:
+            directorio_perfil: Si se indica, cada acción se perfila con
+                               cProfile y se guarda un .prof en ese directorio
+            clases: Clases cuyos métodos públicos se medirán
+        """
+        self.activa = True
+        self.directorio_perfil = directorio_perfil
+        if directorio_perfil:
+            os.makedirs(directorio_perfil, exist_ok=True)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        for clase in clases:
+            self.instrumentar_clase(clase)
+
+    def desactivar(self):
+        """Restaura las clases instrumentadas y detiene tracemalloc"""
+        for clase, nombre, original in self._clases_instrumentadas:
+            setattr(clase, nombre, original)
+        self._clases_instrumentadas = []
+        self.activa = False
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def reiniciar(self):
+        """Descarta las mediciones acumuladas"""
+        with self._lock:
+            self._metricas = {}
+
+    @property
+    def _profundidad(self):
+        """Mediciones abiertas en el hilo actual"""
+        return getattr(self._hilo, 'profundidad', 0)
+
+    @_profundidad.setter
+    def _profundidad(self, valor):
+        self._hilo.profundidad = valor
+
+    def _comenzar_exterior(self):
+        """
+        Registra el comienzo de una medición exterior
+
+        Returns:
+            tuple: (exclusiva, solapamientos) al comenzar; solo una medición
+                   que empezó sin otras en curso puede reiniciar el pico
+        """
+        with self._lock:
+            exclusiva = self._exteriores_activas == 0
+            if exclusiva:
+                if tracemalloc.is_tracing():
+                    tracemalloc.reset_peak()
+            else:
+                self._solapamientos += 1
+            self._exteriores_activas += 1
+            return exclusiva, self._solapamientos
+
+    def _terminar_exterior(self, exclusiva, solapamientos):
+        """
+        Registra el fin de una medición exterior
+
+        Returns:
+            bool: True si nadie más midió mientras tanto, de modo que el pico
+                  de tracemalloc le pertenece
+        """
+        with self._lock:
+            self._exteriores_activas -= 1
+            return exclusiva and self._solapamientos == solapamientos
+
+    def instrumentar_clase(self, clase):
+        """
+        Reemplaza los métodos públicos de una clase por versiones medidas.
+        Los métodos ya instrumentados se dejan como están, de modo que
+        instrumentar dos veces la misma clase no duplica las mediciones
+
+        Args:
+            clase: Clase a instrumentar (por ejemplo CentroDeDatos)
+        """
+        envueltos = {(instrumentada, nombre) for instrumentada, nombre, _ in self._clases_instrumentadas}
+        for nombre, atributo in list(vars(clase).items()):
+            if nombre.startswith('_') or not callable(atributo) or isinstance(atributo, (staticmethod, classmethod)):
+                continue
+            if (clase, nombre) in envueltos:
+                continue
+            setattr(clase, nombre, self._envolver(f"{clase.__name__}.{nombre}", atributo))
+            self._clases_instrumentadas.append((clase, nombre, atributo))
+
+    def _envolver(self, nombre_metrica, funcion):
+        """Retorna una versión de la función que registra sus mediciones"""
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            with self.medir(nombre_metrica):
+                return funcion(*args, **kwargs)
+        return envoltura
+
+    def medir(self, nombre, perfilar=False):
+        """
+        Context manager que mide un bloque de código
+
+        Args:
+            nombre: Nombre de la métrica
+            perfilar: Si es True y hay directorio de perfil, ejecuta el
+                      bloque bajo cProfile y guarda el .prof
+        """
+        return _Medicion(self, nombre, perfilar and self.directorio_perfil is not None)
+
+    def medir_accion(self, nombre):
+        """Mide una acción del menú (perfilándola si está configurado)"""
+        return self.medir(f"accion.{nombre}", perfilar=True)
+
+    def _registrar(self, nombre, pared, cpu, bytes_netos, bytes_pico, pico_omitido=False):
+        """Acumula una medición en los contadores y el histograma"""
+        with self._lock:
+            self._acumular(nombre, pared, cpu, bytes_netos, bytes_pico, pico_omitido)
+
+    def _acumular(self, nombre, pared, cpu, bytes_netos, bytes_pico, pico_omitido):
+        """Actualiza la métrica de una medición; se llama con el lock tomado"""
+        metrica = self._metricas.get(nombre)
+        if metrica is None:
+            metrica = self._metricas[nombre] = {
+                'llamadas': 0,
+                'pared_total_s': 0.0,
+                'pared_max_s': 0.0,
+                'cpu_total_s': 0.0,
+                'bytes_netos_total': 0,
+                'bytes_pico_max': 0,
+                'picos_omitidos': 0,
+                'histograma_pared': [0] * len(LIMITES_HISTOGRAMA)
+            }
+        metrica['llamadas'] += 1
+        metrica['pared_total_s'] += pared
+        metrica['pared_max_s'] = max(metrica['pared_max_s'], pared)
+        metrica['cpu_total_s'] += cpu
+        metrica['bytes_netos_total'] += bytes_netos
+        if bytes_pico is not None:
+            metrica['bytes_pico_max'] = max(metrica['bytes_pico_max'], bytes_pico)
+        if pico_omitido:
+            metrica['picos_omitidos'] += 1
+        for i, limite in enumerate(LIMITES_HISTOGRAMA):
+            if pared <= limite:
+                metrica['histograma_pared'][i] += 1
+                break
+
+    def _guardar_perfil(self, nombre, perfil):
+        """Escribe el perfil de cProfile de una acción en un archivo .prof"""
+        with self._lock:
+            self._perfiles_guardados += 1
+            numero = self._perfiles_guardados
+        nombre_archivo = re.sub(r"[^\w.-]", "_", nombre)
+        ruta = os.path.join(self.directorio_perfil, f"{numero:04d}_{nombre_archivo}.prof")
+        perfil.dump_stats(ruta)
+        return ruta
+
+    def exportar(self):
+        """
+        Retorna las mediciones acumuladas como diccionario serializable
+
+        Returns:
+            dict: Métricas por nombre con promedios calculados
+        """
+        with self._lock:
+            copias = {nombre: dict(metrica, histograma_pared=list(metrica['histograma_pared']))
+                      for nombre, metrica in self._metricas.items()}
+        metricas = {}
+        for nombre, metrica in sorted(copias.items()):
+            resultado = dict(metrica)
+            resultado['pared_media_s'] = metrica['pared_total_s'] / metrica['llamadas']
+            resultado['histograma_pared'] = dict(zip((str(limite) for limite in LIMITES_HISTOGRAMA),
+                                                     metrica['histograma_pared']))
+            metricas[nombre] = resultado
+        return {'activa': self.activa, 'perfiles_guardados': self._perfiles_guardados,
+                'metricas': metricas}
+
+    def volcar_json(self, ruta):
+        """Guarda las mediciones acumuladas en un archivo JSON"""
+        with open(ruta, 'w', encoding='utf-8') as file:
+            json.dump(self.exportar(), file, indent=2, ensure_ascii=False)
+
+
+class _Medicion:
+    """Context manager de una medición individual"""
+
+    def __init__(self, instrumentacion, nombre, perfilar):
+        self.instrumentacion = instrumentacion
+        self.nombre = nombre
+        self.perfil = cProfile.Profile() if perfilar else None
+
+    def __enter__(self):
+        instrumentacion = self.instrumentacion
+        # Solo el nivel exterior de cada hilo puede reiniciar el pico, y solo
+        # si no hay otra medición exterior en curso en otro hilo
+        self.exterior = instrumentacion._profundidad == 0
+        instrumentacion._profundidad += 1
+        if self.exterior:
+            self.exclusiva, self.solapamientos = instrumentacion._comenzar_exterior()
+        self.memoria_inicial = 0
+        if tracemalloc.is_tracing():
+            self.memoria_inicial = tracemalloc.get_traced_memory()[0]
+        if self.perfil is not None:
+            self.perfil.enable()
+        self.cpu_inicial = time.process_time()
+        self.pared_inicial = time.perf_counter()
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        pared = time.perf_counter() - self.pared_inicial
+        cpu = time.process_time() - self.cpu_inicial
+        if self.perfil is not None:
+            self.perfil.disable()
+            self.instrumentacion._guardar_perfil(self.nombre, self.perfil)
+
+        bytes_netos, bytes_pico = 0, None
+        actual, pico = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (None, None)
+        # Se lee antes de terminar: mientras esta siga en curso nadie reinicia el pico
+        propia = self.exterior and self.instrumentacion._terminar_exterior(self.exclusiva, self.solapamientos)
+        if actual is not None:
+            bytes_netos = actual - self.memoria_inicial
+            if propia:
+                bytes_pico = pico - self.memoria_inicial
+
+        self.instrumentacion._profundidad -= 1
+        pico_omitido = self.exterior and not propia and actual is not None
+        self.instrumentacion._registrar(self.nombre, pared, cpu, bytes_netos, bytes_pico, pico_omitido)
+        return False
+
+
+# Instancia compartida por todo el sistema
+instrumentacion = Instrumentacion()
+
+
+def activar_desde_entorno(clases=()):
+    """
+    Activa la instrumentación si la variable de entorno lo indica y aún no
+    está activa
+
+    Returns:
+        bool: True si la instrumentación quedó activa
+    """
+    if not instrumentacion.activa and os.environ.get(VARIABLE_ENTORNO, "").lower() in ("1", "true", "si", "sí"):
+        instrumentacion.activar(os.environ.get(VARIABLE_PERFIL) or None, clases)
+    return instrumentacion.activa
@@ -0,0 +1,264 @@
+"""
+Series de tiempo sobre la matriz servidores x días
+Calcula ventanas móviles (suma, promedio, mínimo, máximo y desviación
+estándar) y diferencias entre días para todos los servidores a la vez, con
+un costo O(servidores x días) que no depende del tamaño de la ventana.
+"""
+
+from collections import deque
+
+import numpy as np
+
+
+class SeriesTiempo:
+    """
+    Clase que calcula ventanas móviles sobre el eje de los días
+
+    Todas las operaciones reciben una matriz (servidores x días) y devuelven
+    una matriz (servidores x (días - ventana + 1)): la columna j resume los
+    días j a j + ventana - 1. Los NaN (mediciones ausentes) se ignoran; una
+    ventana sin valores válidos produce NaN.
+
+    Como Calculadora, admite el motor "numpy" (sumas acumuladas y el
+    algoritmo de van Herk/Gil-Werman para los extremos) y el motor "python"
+    de referencia (sumas deslizantes y colas monótonas fila por fila).
+    """
+
+    BACKENDS = ("python", "numpy")
+
+    OPERACIONES = ("suma", "promedio", "minimo", "maximo", "desviacion")
+
+    def __init__(self, backend="numpy"):
+        """
+        Inicializa el motor de series de tiempo
+
+        Args:
+            backend: "python" (bucles manuales) o "numpy" (vectorizado)
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Backend desconocido '{backend}'. Opciones: {', '.join(self.BACKENDS)}")
+        self.backend = backend
+
+    @property
+    def vectorizada(self):
+        """Indica si se usa el motor numpy"""
+        return self.backend == "numpy"
+
+    def calcular(self, operacion, matriz, ventana):
+        """
+        Aplica una de OPERACIONES con la ventana indicada
+
+        Args:
+            operacion: Nombre de la operación ("suma", "promedio", ...)
+            matriz: Array numpy bidimensional (servidores x días)
+            ventana: Número de días de cada ventana
+
+        Returns:
+            numpy.ndarray: Matriz (servidores x ventanas)
+        """
+        if operacion not in self.OPERACIONES:
+            raise ValueError(f"Operación desconocida '{operacion}'. Opciones: {', '.join(self.OPERACIONES)}")
+        return getattr(self, f"{operacion}_movil")(matriz, ventana)
+
+    def suma_movil(self, matriz, ventana):
+        """Suma de cada ventana (0 si la ventana no tiene valores válidos)"""
+        matriz = self._preparar(matriz, ventana)
+        if self.vectorizada:
+            return self._sumas_ventana(self._sin_nan(matriz), ventana)
+        return self._deslizar_sumas(matriz, ventana)[0]
+
+    def promedio_movil(self, matriz, ventana):
+        """Promedio de cada ventana"""
+        matriz = self._preparar(matriz, ventana)
+        if self.vectorizada:
+            ausentes = np.isnan(matriz)
+            if not ausentes.any():
+                return self._sumas_ventana(matriz, ventana) / ventana
+            sumas = self._sumas_ventana(np.where(ausentes, 0.0, matriz), ventana)
+            conteos = self._sumas_ventana(~ausentes, ventana)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                return np.where(conteos > 0, sumas / conteos, np.nan)
+
+        sumas, conteos = self._deslizar_sumas(matriz, ventana)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(conteos > 0, sumas / conteos, np.nan)
+
+    def desviacion_movil(self, matriz, ventana):
+        """
+        Desviación estándar poblacional de cada ventana
+
+        Usa E[x²] - E[x]² con sumas acumuladas de cada fila centrada en su
+        media, lo que mantiene chicas las sumas que se restan. La varianza
+        negativa que deja el redondeo se lleva a 0, y las ventanas sin
+        cambios entre valores válidos consecutivos dan 0 exacto en lugar del
+        residuo de la resta
+        """
+        matriz = self._preparar(matriz, ventana)
+        validos = ~np.isnan(matriz)
+        completa = validos.all()
+        if completa:
+            centrada = matriz - matriz.mean(axis=1, keepdims=True)
+        else:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                centros = np.where(validos.any(axis=1), np.nansum(matriz, axis=1) / validos.sum(axis=1), 0.0)
+            centrada = np.where(validos, matriz - centros[:, np.newaxis], 0.0)
+        cambios = self._cambios(matriz, validos)[:, 1:]
+
+        if self.vectorizada:
+            sumas = self._sumas_ventana(centrada, ventana)
+            centrada *= centrada
+            cuadrados = self._sumas_ventana(centrada, ventana)
+            conteos = np.full(sumas.shape, float(ventana)) if completa else self._sumas_ventana(validos, ventana)
+            cambios_ventana = self._sumas_ventana(cambios, ventana - 1) if ventana > 1 else None
+        else:
+            sumas, conteos = self._deslizar_sumas(np.where(validos, centrada, np.nan), ventana)
+            cuadrados, _ = self._deslizar_sumas(np.where(validos, centrada * centrada, np.nan), ventana)
+            cambios_ventana = self._deslizar_sumas(cambios.astype(np.float64), ventana - 1)[0] \
+                if ventana > 1 else None
+
+        # Ventanas sin valores válidos: 0/0 da NaN y se descartan al final
+        with np.errstate(invalid='ignore', divide='ignore'):
+            sumas /= conteos
+            cuadrados /= conteos
+            sumas *= sumas
+            cuadrados -= sumas
+            varianzas = np.maximum(cuadrados, 0.0, out=cuadrados)
+        if cambios_ventana is None:
+            varianzas[:] = 0.0
+        else:
+            varianzas[cambios_ventana == 0] = 0.0
+        desviaciones = np.sqrt(varianzas, out=varianzas)
+        return desviaciones if completa else np.where(conteos > 0, desviaciones, np.nan)
+
+    def maximo_movil(self, matriz, ventana):
+        """Máximo de cada ventana"""
+        return self._extremo_movil(self._preparar(matriz, ventana), ventana, np.maximum, -np.inf)
+
+    def minimo_movil(self, matriz, ventana):
+        """Mínimo de cada ventana"""
+        return self._extremo_movil(self._preparar(matriz, ventana), ventana, np.minimum, np.inf)
+
+    def diferencias_diarias(self, matriz):
+        """
+        Diferencia de cada día con el anterior
+
+        Returns:
+            numpy.ndarray: Matriz (servidores x (días - 1)); NaN si alguno de
+                           los dos días no tiene medición
+        """
+        matriz = np.asarray(matriz, dtype=np.float64)
+        if self.vectorizada:
+            return np.diff(matriz, axis=1)
+        filas, dias = matriz.shape
+        resultado = np.empty((filas, max(dias - 1, 0)))
+        for i in range(filas):
+            for j in range(1, dias):
+                resultado[i, j - 1] = matriz[i, j] - matriz[i, j - 1]
+        return resultado
+
+    @staticmethod
+    def _preparar(matriz, ventana):
+        """Valida la ventana y lleva la matriz a float64 bidimensional"""
+        matriz = np.asarray(matriz, dtype=np.float64)
+        if matriz.ndim != 2:
+            raise ValueError("Se esperaba una matriz (servidores x días)")
+        if not 1 <= ventana <= max(matriz.shape[1], 1):
+            raise ValueError(f"La ventana debe estar entre 1 y {matriz.shape[1]} días")
+        return matriz
+
+    @staticmethod
+    def _sin_nan(matriz):
+        """Reemplaza los NaN por 0 solo si los hay, evitando la copia"""
+        ausentes = np.isnan(matriz)
+        return np.where(ausentes, 0.0, matriz) if ausentes.any() else matriz
+
+    @staticmethod
+    def _cambios(matriz, validos):
+        """
+        Marca los días cuyo valor difiere del valor válido anterior de la
+        fila. Con NaN se compara contra el último valor válido, así que un
+        día ausente no cuenta como cambio
+        """
+        if validos.all():
+            cambios = np.zeros(matriz.shape, dtype=bool)
+            np.not_equal(matriz[:, 1:], matriz[:, :-1], out=cambios[:, 1:])
+            return cambios
+        filas, dias = matriz.shape
+        ultimo = np.maximum.accumulate(np.where(validos, np.arange(dias), -1), axis=1)
+        arrastrado = matriz[np.arange(filas)[:, np.newaxis], np.maximum(ultimo, 0)]
+        cambios = np.zeros(matriz.shape, dtype=bool)
+        cambios[:, 1:] = validos[:, 1:] & (ultimo[:, :-1] >= 0) & (matriz[:, 1:] != arrastrado[:, :-1])
+        return np.where(validos, cambios, False)
+
+    @staticmethod
+    def _sumas_ventana(matriz, ventana):
+        """Sumas de cada ventana como diferencia de sumas acumuladas"""
+        acumuladas = np.zeros((matriz.shape[0], matriz.shape[1] + 1))
+        np.cumsum(matriz, axis=1, out=acumuladas[:, 1:])
+        return acumuladas[:, ventana:] - acumuladas[:, :-ventana]
+
+    def _extremo_movil(self, matriz, ventana, comparar, neutro):
+        """
+        Máximo/mínimo móvil. El motor numpy usa van Herk/Gil-Werman: divide
+        los días en bloques del tamaño de la ventana y combina un acumulado
+        por la derecha y otro por la izquierda de cada bloque, con dos
+        pasadas independientes de la ventana
+        """
+        if not self.vectorizada:
+            return self._extremo_movil_cola(matriz, ventana, comparar)
+
+        filas, dias = matriz.shape
+        ausentes = np.isnan(matriz)
+        hay_ausentes = ausentes.any()
+        bloques = -(-dias // ventana)
+        relleno = np.full((filas, bloques * ventana), neutro)
+        relleno[:, :dias] = np.where(ausentes, neutro, matriz) if hay_ausentes else matriz
+        por_bloque = relleno.reshape(filas, bloques, ventana)
+
+        desde_inicio = comparar.accumulate(por_bloque, axis=2).reshape(filas, -1)
+        hasta_fin = comparar.accumulate(por_bloque[:, :, ::-1], axis=2)[:, :, ::-1].reshape(filas, -1)
+
+        resultado = comparar(hasta_fin[:, :dias - ventana + 1], desde_inicio[:, ventana - 1:dias])
+        if not hay_ausentes:
+            return resultado
+        return np.where(self._sumas_ventana(~ausentes, ventana) > 0, resultado, np.nan)
+
+    @staticmethod
+    def _extremo_movil_cola(matriz, ventana, comparar):
+        """Referencia con una cola monótona de índices por fila"""
+        filas, dias = matriz.shape
+        resultado = np.full((filas, dias - ventana + 1), np.nan)
+        for i in range(filas):
+            fila = matriz[i]
+            cola = deque()
+            for j in range(dias):
+                if cola and cola[0] <= j - ventana:
+                    cola.popleft()
+                if fila[j] == fila[j]:  # NaN: medición ausente
+                    while cola and comparar(fila[j], fila[cola[-1]]) == fila[j]:
+                        cola.pop()
+                    cola.append(j)
+                if j >= ventana - 1 and cola:
+                    resultado[i, j - ventana + 1] = fila[cola[0]]
+        return resultado
+
+    @staticmethod
+    def _deslizar_sumas(matriz, ventana):
+        """Referencia: suma y conteo de válidos deslizando la ventana por fila"""
+        filas, dias = matriz.shape
+        sumas = np.zeros((filas, dias - ventana + 1))
+        conteos = np.zeros((filas, dias - ventana + 1))
+        for i in range(filas):
+            suma, conteo = 0.0, 0
+            for j in range(dias):
+                if matriz[i, j] == matriz[i, j]:
+                    suma += matriz[i, j]
+                    conteo += 1
+                saliente = j - ventana
+                if saliente >= 0 and matriz[i, saliente] == matriz[i, saliente]:
+                    suma -= matriz[i, saliente]
+                    conteo -= 1
+                if saliente >= -1:
+                    sumas[i, saliente + 1] = suma
+                    conteos[i, saliente + 1] = conteo
+        return sumas, conteos
@@ -3,31 +3,31 @@ Sistema de Análisis de CPU - Centro de Datos
 Autor: Sistema de Análisis
 Fecha: Julio 2025
 
-Este sistema analiza el uso de CPU de 25 servidores durante el mes de junio
-usando programación orientada a objetos y arrays numpy estáticos.
+Este sistema analiza el uso de CPU de los servidores de un centro de datos
+usando programación orientada a objetos y arrays numpy dimensionados según
+los datos cargados.
 
-Punto de entrada principal del sistema.
-"""
+Punto de entrada principal del sistema; la línea de comandos está en
+analisis_cpu/cli.py y, con el paquete instalado, también se ejecuta como analisis-cpu.
+
+Sin argumentos abre el menú interactivo. Con --run ejecuta los análisis
+indicados sin menú y termina, por ejemplo:
 
-import sys
-import os
+    python main.py --file uso_cpu_junio.txt --run promedios,dia-max,servidor-min --format json
 
-# Agregar src al path para importaciones
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+Con --servir expone las consultas como JSON por HTTP en localhost:
 
-from controllers.controlador_principal import ejecutar_sistema
+    python main.py --file uso_cpu_junio.txt --servir --puerto 8080
 
+Con --publicar carga los datos una sola vez en memoria compartida y otros
+procesos los adjuntan sin copia con --file shm://<segmento>:
+
+    python main.py --file uso_cpu_junio.txt --publicar cpu_junio
+    python main.py --file shm://cpu_junio --run promedios
+"""
 
-def main():
-    """
-    Función principal - Punto de entrada del sistema
-    """
-    try:
-        ejecutar_sistema()
-    except Exception as e:
-        print(f"Error crítico del sistema: {e}")
-        print("El sistema se cerrará.")
+from analisis_cpu.cli import main
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1 @@
+"""Pruebas de comportamiento del sistema de análisis de uso de CPU"""
@@ -0,0 +1,38 @@
+"""
+Utilidades compartidas por las pruebas
+"""
+
+import numpy as np
+import pytest
+
+
+def escribir_datos(ruta, nombres, valores):
+    """
+    Escribe un archivo de uso de CPU con el formato de uso_cpu_junio.txt
+
+    Args:
+        ruta: Ruta del archivo a crear
+        nombres: Nombre de cada servidor
+        valores: Matriz (servidores x días); NaN se escribe como celda vacía
+    """
+    with open(ruta, 'w', encoding='utf-8') as file:
+        for nombre, fila in zip(nombres, valores):
+            celdas = ("" if np.isnan(valor) else f"{valor:.2f}" for valor in fila)
+            file.write(";".join([nombre, *celdas]) + "\n")
+    return str(ruta)
+
+
+def matriz_uso(servidores, dias, semilla=0, ausentes=0.0):
+    """Matriz de uso aleatoria con dos decimales y una fracción de NaN"""
+    generador = np.random.default_rng(semilla)
+    valores = np.round(generador.uniform(0, 100, (servidores, dias)), 2)
+    valores[generador.random((servidores, dias)) < ausentes] = np.nan
+    return valores
+
+
+@pytest.fixture
+def archivo_datos(tmp_path):
+    """Archivo de 25 servidores x 30 días con algunos valores ausentes"""
+    valores = matriz_uso(25, 30, semilla=1, ausentes=0.05)
+    nombres = [f"Servidor_{i + 1}" for i in range(25)]
+    return escribir_datos(tmp_path / "uso.txt", nombres, valores), nombres, valores
@@ -0,0 +1,97 @@
+"""
+Pruebas del análisis de alertas: pares en alerta, rachas y racha máxima
+"""
+
+import numpy as np
+import pytest
+
+from analisis_cpu.models.centro_datos import CentroDeDatos
+from tests.conftest import escribir_datos, matriz_uso
+
+
+def cargar(ruta, almacenamiento="float64"):
+    centro = CentroDeDatos(almacenamiento=almacenamiento)
+    centro.cargar_datos(ruta, usar_cache=False)
+    return centro
+
+
+def rachas_de_referencia(mascara):
+    """Rachas (fila, inicio, longitud) recorriendo cada fila día a día"""
+    rachas = []
+    for fila, dias in enumerate(mascara):
+        inicio = None
+        for dia, alerta in enumerate([*dias, False]):
+            if alerta and inicio is None:
+                inicio = dia
+            elif not alerta and inicio is not None:
+                rachas.append((fila, inicio, dia - inicio))
+                inicio = None
+    return rachas
+
+
+def comprobar(resultado, mascara):
+    """Compara un ResultadoAlertas con la máscara esperada"""
+    filas, dias = np.nonzero(mascara)
+    np.testing.assert_array_equal(resultado.filas, filas)
+    np.testing.assert_array_equal(resultado.dias, dias)
+    np.testing.assert_array_equal(resultado.conteos, mascara.sum(axis=1))
+
+    rachas = rachas_de_referencia(mascara)
+    obtenidas = list(zip(resultado.rachas_filas.tolist(), resultado.rachas_inicio.tolist(),
+                         resultado.rachas_longitud.tolist()))
+    assert obtenidas == rachas
+    maximas = np.zeros(len(mascara), dtype=int)
+    for fila, _, longitud in rachas:
+        maximas[fila] = max(maximas[fila], longitud)
+    np.testing.assert_array_equal(resultado.racha_maxima, maximas)
+
+
+def test_rachas_no_cruzan_el_borde_de_la_fila(tmp_path, capsys):
+    # A termina en alerta y B empieza en alerta: son dos rachas distintas
+    valores = np.array([[10, 95, 95, 20, 99, 99],
+                        [97, 98, 10, np.nan, 96, 10],
+                        [10, 10, 10, 10, 10, 10]], dtype=float)
+    centro = cargar(escribir_datos(tmp_path / "uso.txt", ["A", "B", "C"], valores))
+
+    resultado = centro.analizar_alertas("umbral", 90)
+    comprobar(resultado, valores > 90)
+    assert resultado.racha_maxima.tolist() == [2, 2, 0]
+
+    datos = resultado.a_dict()
+    assert datos['servidores_con_alerta'] == 2
+    assert datos['servidores'][0]['rachas'] == [{'inicio': 2, 'fin': 3, 'dias': 2},
+                                                {'inicio': 5, 'fin': 6, 'dias': 2}]
+    assert datos['servidores'][1]['dias'] == [1, 2, 5]
+
+
+@pytest.mark.parametrize("almacenamiento", ["float64", "float32", "centesimas"])
+def test_umbral_coincide_con_la_referencia(tmp_path, capsys, almacenamiento):
+    valores = matriz_uso(40, 31, semilla=4, ausentes=0.1)
+    nombres = [f"S{i}" for i in range(40)]
+    centro = cargar(escribir_datos(tmp_path / "uso.txt", nombres, valores), almacenamiento)
+
+    comprobar(centro.analizar_alertas("umbral", 70), valores > 70)
+
+
+def test_zscore_coincide_con_la_referencia(tmp_path, capsys):
+    valores = matriz_uso(30, 28, semilla=5, ausentes=0.05)
+    valores[3] = 42.0  # un servidor constante no tiene anomalías
+    nombres = [f"S{i}" for i in range(30)]
+    centro = cargar(escribir_datos(tmp_path / "uso.txt", nombres, valores))
+
+    promedios = np.nanmean(valores, axis=1, keepdims=True)
+    desviaciones = np.nanstd(valores, axis=1, keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        esperada = np.abs(valores - promedios) > 1.5 * desviaciones
+    esperada[3] = False
+    resultado = centro.analizar_alertas("zscore", 1.5)
+
+    comprobar(resultado, esperada)
+    assert resultado.conteos[3] == 0
+
+
+def test_regla_desconocida(archivo_datos, capsys):
+    centro = cargar(archivo_datos[0])
+
+    with pytest.raises(ValueError, match="Regla desconocida"):
+        centro.analizar_alertas("media")
@@ -0,0 +1,111 @@
+"""
+Pruebas del archivo histórico comprimido
+"""
+
+import numpy as np
+import pytest
+
+from analisis_cpu.models.archivo_historico import ArchivoHistorico
+from analisis_cpu.models.centro_datos import CentroDeDatos
+from tests.conftest import escribir_datos, matriz_uso
+
+# Más de un bloque en cada eje, con bordes incompletos
+SERVIDORES, DIAS = ArchivoHistorico.BLOQUE_SERVIDORES * 2 + 5, ArchivoHistorico.BLOQUE_DIAS * 2 + 3
+
+
+@pytest.fixture
+def datos_grandes(tmp_path):
+    valores = matriz_uso(SERVIDORES, DIAS, semilla=23, ausentes=0.05)
+    valores[7, :] = 100.0
+    valores[8, :] = 0.0
+    nombres = [f"host-{i:03d}" for i in range(SERVIDORES)]
+    return escribir_datos(tmp_path / "uso.txt", nombres, valores), nombres, valores
+
+
+@pytest.mark.parametrize("compresion", ArchivoHistorico.COMPRESIONES)
+@pytest.mark.parametrize("almacenamiento", CentroDeDatos.ALMACENAMIENTOS)
+def test_ida_y_vuelta_exacta(datos_grandes, tmp_path, capsys, compresion, almacenamiento):
+    ruta, nombres, valores = datos_grandes
+    centro = CentroDeDatos(almacenamiento=almacenamiento)
+    centro.cargar_datos(ruta, usar_cache=False)
+    archivo = str(tmp_path / "uso.cpuh")
+
+    tamano = centro.guardar_archivo_historico(archivo, compresion)
+
+    assert ArchivoHistorico.es_archivo_historico(archivo)
+    with ArchivoHistorico(archivo) as historico:
+        assert historico.tamano == tamano
+        assert historico.forma == (SERVIDORES, DIAS)
+        assert historico.compresion == compresion
+        np.testing.assert_array_equal(historico.leer(), valores)
+        assert list(historico.nombres) == nombres
+
+    releido = CentroDeDatos(almacenamiento=almacenamiento)
+    releido.cargar_datos(archivo)
+    np.testing.assert_array_equal(releido.datos_cpu, centro.datos_cpu)
+    assert list(releido.nombres_servidores) == nombres
+    assert releido.periodos == centro.periodos
+
+
+def test_lecturas_parciales(datos_grandes, tmp_path, capsys):
+    ruta, nombres, valores = datos_grandes
+    centro = CentroDeDatos()
+    centro.cargar_datos(ruta, usar_cache=False)
+    archivo = str(tmp_path / "uso.cpuh")
+    centro.guardar_archivo_historico(archivo)
+
+    with ArchivoHistorico(archivo) as historico:
+        casos = [
+            (slice(60, 70), slice(30, 35), valores[60:70, 30:35]),     # cruza bloques en ambos ejes
+            (slice(0, 1), slice(None), valores[:1]),
+            (5, slice(64, None), valores[5:6, 64:]),                   # índice de servidor
+            (slice(None), -1, valores[:, -1:]),                        # índice negativo de día
+            (slice(100, 100), slice(None), valores[100:100]),          # rango vacío
+        ]
+        for filas, dias, esperado in casos:
+            np.testing.assert_array_equal(historico.leer(filas, dias), esperado)
+        np.testing.assert_array_equal(historico.obtener_datos_servidor("host-130"), valores[130])
+        np.testing.assert_array_equal(historico.obtener_datos_dia(DIAS), valores[:, -1])
+        assert historico.obtener_datos_servidor("no-existe") is None
+        assert historico.obtener_datos_dia(DIAS + 1) is None
+        with pytest.raises(ValueError):
+            historico.leer(slice(0, 10, 2))
+
+
+def test_series_suaves_ocupan_menos_que_las_centesimas(tmp_path):
+    dias = np.arange(365)
+    valores = np.round(50 + 20 * np.sin(dias / 20.0) + np.arange(100)[:, np.newaxis] % 7, 2)
+    archivo = str(tmp_path / "suave.cpuh")
+
+    tamano = ArchivoHistorico.escribir(archivo, ArchivoHistorico.a_centesimas(valores), [str(i) for i in range(100)])
+
+    assert tamano < valores.size * 2 / 4
+    with ArchivoHistorico(archivo) as historico:
+        np.testing.assert_array_equal(historico.leer(), valores)
+
+
+@pytest.mark.parametrize("valores", [[[12.345]], [[-1.0]], [[700.0]]])
+def test_solo_guarda_valores_con_dos_decimales_en_rango(valores):
+    with pytest.raises(ValueError):
+        ArchivoHistorico.a_centesimas(valores)
+
+
+def test_archivos_invalidos(tmp_path, datos_grandes, capsys):
+    texto = tmp_path / "texto.cpuh"
+    texto.write_text("A;1;2\n", encoding='utf-8')
+    assert not ArchivoHistorico.es_archivo_historico(str(texto))
+    with pytest.raises(ValueError):
+        ArchivoHistorico(str(texto))
+
+    centro = CentroDeDatos()
+    centro.cargar_datos(datos_grandes[0], usar_cache=False)
+    archivo = tmp_path / "truncado.cpuh"
+    centro.guardar_archivo_historico(str(archivo))
+    archivo.write_bytes(archivo.read_bytes()[:-20])
+    with pytest.raises(ValueError):
+        ArchivoHistorico(str(archivo))
+
+    with pytest.raises(ValueError):
+        ArchivoHistorico.escribir(str(tmp_path / "otro.cpuh"), centro.datos_cpu, centro.nombres_servidores)
+    with pytest.raises(ValueError):
+        CentroDeDatos().guardar_archivo_historico(str(tmp_path / "vacio.cpuh"))
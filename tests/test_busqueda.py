@@ -0,0 +1,74 @@
+"""
+Pruebas de la búsqueda de servidores por nombre, patrón glob y en lote
+"""
+
+import fnmatch
+
+import numpy as np
+import pytest
+
+from analisis_cpu.models.centro_datos import CentroDeDatos
+from tests.conftest import escribir_datos, matriz_uso
+
+NOMBRES = ["web-1", "web-10", "web-2", "db-1", "db-2", "cache", "web", "Web-3", "api_web-4", "db-[x]", "ñandú"]
+
+
+@pytest.fixture
+def centro(tmp_path, capsys):
+    centro = CentroDeDatos()
+    valores = matriz_uso(len(NOMBRES), 5, semilla=16)
+    centro.cargar_datos(escribir_datos(tmp_path / "uso.txt", NOMBRES, valores), usar_cache=False)
+    return centro
+
+
+@pytest.mark.parametrize("patron", ["web-*", "web*", "*web*", "db-?", "*1", "[cd]*", "db-[[]x]", "web",
+                                    "web-3", "W*", "ñ*", "zzz*", "*"])
+def test_glob_coincide_con_fnmatch(centro, patron):
+    esperadas = sorted((nombre for nombre in NOMBRES if fnmatch.fnmatchcase(nombre, patron)))
+
+    filas = centro.buscar_servidores(patron)
+    assert [NOMBRES[fila] for fila in filas] == esperadas
+
+
+def test_glob_ve_los_servidores_agregados(centro):
+    assert len(centro.buscar_servidores("web-*")) == 3
+    centro.agregar_servidor("web-0", [1.0] * 5)
+
+    filas = centro.buscar_servidores("web-*")
+    assert [str(centro.nombres_servidores[fila]) for fila in filas] == ["web-0", "web-1", "web-10", "web-2"]
+
+
+@pytest.mark.parametrize("almacenamiento", ["float64", "float32", "centesimas"])
+def test_datos_de_varios_servidores(tmp_path, capsys, almacenamiento):
+    valores = matriz_uso(6, 4, semilla=17, ausentes=0.2)
+    centro = CentroDeDatos(almacenamiento=almacenamiento)
+    centro.cargar_datos(escribir_datos(tmp_path / "uso.txt", list("ABCDEF"), valores), usar_cache=False)
+
+    datos = centro.obtener_datos_servidores(["E", "X", "A", "E"])
+    assert datos.dtype == np.float64 and datos.shape == (4, 4)
+    np.testing.assert_allclose(datos[[0, 2, 3]], valores[[4, 0, 4]], rtol=1e-6)
+    assert np.isnan(datos[1]).all()
+    np.testing.assert_array_equal(centro.obtener_datos_servidores([]).shape, (0, 4))
+    for nombre, fila in zip("ABCDEF", valores):
+        np.testing.assert_allclose(centro.obtener_datos_servidor(nombre), fila, rtol=1e-6)
+    assert centro.obtener_datos_servidor("X") is None
+
+
+def test_nombre_repetido_resuelve_a_la_primera_fila(tmp_path, capsys):
+    centro = CentroDeDatos()
+    centro.cargar_datos(escribir_datos(tmp_path / "uso.txt", ["A", "B", "A"], matriz_uso(3, 2, semilla=18)),
+                        usar_cache=False)
+
+    assert centro.indice_servidor("A") == 0
+    assert centro.buscar_servidores("A").tolist() == [0]
+
+
+def test_busqueda_sin_servidores(tmp_path, capsys):
+    ruta = tmp_path / "vacio.txt"
+    ruta.write_text("", encoding='utf-8')
+    centro = CentroDeDatos()
+    centro.cargar_datos(str(ruta), usar_cache=False)
+
+    assert centro.buscar_servidores("*").size == 0
+    datos = centro.obtener_datos_servidores(["A", "B"])
+    assert datos.shape == (2, 0)
@@ -0,0 +1,124 @@
+"""
+Pruebas de equivalencia entre los motores "python" y "numpy" de Calculadora
+"""
+
+import numpy as np
+import pytest
+
+from analisis_cpu.models.centro_datos import CentroDeDatos
+from analisis_cpu.utils.calculadora import Calculadora
+from tests.conftest import escribir_datos, matriz_uso
+
+PYTHON = Calculadora("python")
+NUMPY = Calculadora("numpy")
+
+
+def _matriz():
+    matriz = matriz_uso(9, 14, semilla=2, ausentes=0.1)
+    matriz[3] = np.nan                  # servidor sin mediciones
+    matriz[5, :] = matriz[5, 0]         # empates en toda la fila
+    matriz[:, 7] = np.nan               # día sin mediciones
+    return matriz
+
+
+def _iguales(a, b):
+    np.testing.assert_allclose(np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64),
+                               rtol=1e-12, equal_nan=True)
+
+
+def _redondear(valor):
+    """Redondea los float de una estructura JSON para compararla entre motores"""
+    if isinstance(valor, dict):
+        return {clave: _redondear(elemento) for clave, elemento in valor.items()}
+    if isinstance(valor, list):
+        return [_redondear(elemento) for elemento in valor]
+    if isinstance(valor, float):
+        return "nan" if valor != valor else round(valor, 9)
+    return valor
+
+
+def test_backend_desconocido():
+    with pytest.raises(ValueError):
+        Calculadora("fortran")
+
+
+@pytest.mark.parametrize("fila", range(9))
+def test_reducciones_de_un_array(fila):
+    datos = _matriz()[fila]
+
+    _iguales(PYTHON.calcular_promedio(datos), NUMPY.calcular_promedio(datos))
+    _iguales(PYTHON.calcular_suma(datos), NUMPY.calcular_suma(datos))
+    assert PYTHON.encontrar_maximo(datos)[0] == NUMPY.encontrar_maximo(datos)[0]
+    assert PYTHON.encontrar_minimo(datos)[0] == NUMPY.encontrar_minimo(datos)[0]
+    _iguales(PYTHON.calcular_percentil(datos, 95), NUMPY.calcular_percentil(datos, 95))
+
+
+def test_reducciones_ignoran_nan_y_desempatan_por_el_primer_indice():
+    datos = np.array([np.nan, 4.0, 9.0, 9.0, 1.0, 1.0])
+    for calculadora in (PYTHON, NUMPY):
+        assert calculadora.calcular_promedio(datos) == pytest.approx(4.8)
+        assert calculadora.encontrar_maximo(datos) == (2, 9.0)
+        assert calculadora.encontrar_minimo(datos) == (4, 1.0)
+        assert calculadora.encontrar_maximo(np.full(3, np.nan))[0] == -1
+
+
+@pytest.mark.parametrize("eje", [0, 1])
+def test_reducciones_por_eje(eje):
+    matriz = _matriz()
+
+    _iguales(PYTHON.calcular_promedio_por_eje(matriz, eje), NUMPY.calcular_promedio_por_eje(matriz, eje))
+    _iguales(PYTHON.calcular_suma_por_eje(matriz, eje), NUMPY.calcular_suma_por_eje(matriz, eje))
+    for metodo in ("encontrar_maximo_por_eje", "encontrar_minimo_por_eje"):
+        indices_python, valores_python = getattr(PYTHON, metodo)(matriz, eje)
+        indices_numpy, valores_numpy = getattr(NUMPY, metodo)(matriz, eje)
+        np.testing.assert_array_equal(indices_python, indices_numpy)
+        _iguales(valores_python, valores_numpy)
+    _iguales(PYTHON.calcular_percentiles_por_eje(matriz, (50, 90, 99), eje),
+             NUMPY.calcular_percentiles_por_eje(matriz, (50, 90, 99), eje))
+
+
+@pytest.mark.parametrize("k", [0, 1, 3, 9, 20])
+@pytest.mark.parametrize("mayores", [True, False])
+def test_k_extremos(k, mayores):
+    datos = _matriz()[:, 0]
+
+    indices_python, valores_python = PYTHON.seleccionar_k_extremos(datos, k, mayores)
+    indices_numpy, valores_numpy = NUMPY.seleccionar_k_extremos(datos, k, mayores)
+
+    np.testing.assert_array_equal(indices_python, indices_numpy)
+    _iguales(valores_python, valores_numpy)
+
+
+def test_percentiles_no_modifican_la_matriz():
+    matriz = matriz_uso(9, 14, semilla=4)  # sin NaN: partición propia del motor numpy
+    copia = matriz.copy()
+
+    NUMPY.calcular_percentiles_por_eje(matriz, (50, 95), 0)
+    NUMPY.calcular_percentiles_por_eje(matriz, (50, 95), 1)
+
+    np.testing.assert_array_equal(matriz, copia)
+
+
+def test_percentiles_sobre_datos_de_solo_lectura():
+    matriz = matriz_uso(9, 14, semilla=4)
+    matriz.setflags(write=False)  # como el memmap del caché binario
+
+    _iguales(NUMPY.calcular_percentiles_por_eje(matriz, (95,), 1),
+             PYTHON.calcular_percentiles_por_eje(matriz, (95,), 1))
+
+
+def test_analisis_del_centro_iguales_en_ambos_motores(tmp_path, capsys):
+    ruta = escribir_datos(tmp_path / "uso.txt", [f"S{i}" for i in range(9)], _matriz())
+    resultados = {}
+    for backend in Calculadora.BACKENDS:
+        centro = CentroDeDatos(backend=backend)
+        centro.cargar_datos(ruta, usar_cache=False)
+        resultados[backend] = {
+            'promedios': centro.obtener_promedios(),
+            'dia': centro.obtener_dia_mayor_carga(),
+            'servidor': centro.obtener_servidor_menor_uso(),
+            'top': centro.obtener_top_servidores(4, "p95"),
+            'percentiles': centro.obtener_percentiles_flota(),
+        }
+
+    assert _redondear(resultados['python']) == _redondear(resultados['numpy'])
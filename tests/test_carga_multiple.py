@@ -0,0 +1,86 @@
+"""
+Pruebas de la carga combinada de varios archivos (meses y centros de datos)
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from analisis_cpu.models.carga_multiple import detectar_periodo, expandir_rutas
+from analisis_cpu.models.centro_datos import CentroDeDatos
+from tests.conftest import escribir_datos, matriz_uso
+
+
+@pytest.fixture
+def directorio(tmp_path):
+    """Dos centros en junio, uno en mayo de 2025 y un archivo sin mes"""
+    junio_1, junio_2 = matriz_uso(2, 30, semilla=12, ausentes=0.05), matriz_uso(2, 28, semilla=13)
+    mayo, extra = matriz_uso(2, 31, semilla=14), matriz_uso(1, 3, semilla=15)
+    escribir_datos(tmp_path / "dc1_uso_cpu_junio_2025.txt", ["A", "B"], junio_1)
+    escribir_datos(tmp_path / "dc2_uso_cpu_junio_2025.txt", ["C", "D"], junio_2)
+    escribir_datos(tmp_path / "uso_cpu_mayo_2025.txt", ["B", "E"], mayo)
+    escribir_datos(tmp_path / "pruebas.txt", ["A"], extra)
+    (tmp_path / "notas.md").write_text("no es un archivo de datos", encoding='utf-8')
+    return tmp_path, {"junio_1": junio_1, "junio_2": junio_2, "mayo": mayo, "extra": extra}
+
+
+def test_expandir_rutas_y_periodos(directorio):
+    ruta, _ = directorio
+
+    assert [os.path.basename(r) for r in expandir_rutas(str(ruta))] == [
+        "dc1_uso_cpu_junio_2025.txt", "dc2_uso_cpu_junio_2025.txt", "pruebas.txt", "uso_cpu_mayo_2025.txt"]
+    assert len(expandir_rutas(str(ruta / "*junio*"))) == 2
+    assert detectar_periodo("dc1_uso_cpu_marzo_2025.txt") == (2025, 3)
+    assert detectar_periodo("uso_cpu_JUNIO.txt") == (0, 6)
+    assert detectar_periodo("pruebas.txt") is None
+
+
+@pytest.mark.parametrize("procesos, usar_cache", [(1, False), (1, True), (2, False)])
+def test_combina_meses_y_centros(directorio, capsys, procesos, usar_cache):
+    ruta, datos = directorio
+    centro = CentroDeDatos()
+    centro.cargar_multiples(str(ruta), procesos=procesos, usar_cache=usar_cache)
+
+    # Mayo (31 días), junio (30: el más largo de sus archivos) y el archivo sin mes
+    assert [(p['etiqueta'], p['inicio'], p['dias']) for p in centro.periodos] == [
+        ("mayo 2025", 0, 31), ("junio 2025", 31, 30), ("pruebas.txt", 61, 3)]
+    assert list(centro.nombres_servidores) == ["A", "B", "C", "D", "E"]
+
+    esperada = np.full((5, 64), np.nan)
+    esperada[[1, 4], :31] = datos["mayo"]
+    esperada[[0, 1], 31:61] = datos["junio_1"]
+    esperada[[2, 3], 31:59] = datos["junio_2"]
+    esperada[0, 61:] = datos["extra"][0]
+    np.testing.assert_array_equal(centro.datos_cpu, esperada)
+    assert centro.describir_dia(31) == "1 de junio 2025"
+    assert centro.describir_dia(62) == "63 (pruebas.txt)"
+    np.testing.assert_array_equal(centro.obtener_datos_servidor("E")[31:], np.nan)
+
+
+def test_cargar_datos_delega_en_patrones_glob(directorio, capsys):
+    ruta, datos = directorio
+    centro = CentroDeDatos()
+    centro.cargar_datos(str(ruta / "dc?_*.txt"), usar_cache=False)
+
+    assert centro.datos_cpu.shape == (4, 30)
+    np.testing.assert_array_equal(centro.datos_cpu[2:, :28], datos["junio_2"])
+
+
+def test_archivo_con_demasiados_errores_se_omite(directorio, capsys):
+    ruta, _ = directorio
+    (ruta / "uso_cpu_julio_2025.txt").write_text("X;x;y;z\n", encoding='utf-8')
+    centro = CentroDeDatos()
+    centro.cargar_multiples(str(ruta), procesos=1, usar_cache=False, max_errores=2)
+
+    assert "Se omite" in capsys.readouterr().out
+    assert "X" not in list(centro.nombres_servidores)
+    assert [p['etiqueta'] for p in centro.periodos] == ["mayo 2025", "junio 2025", "pruebas.txt"]
+
+
+def test_sin_archivos(tmp_path, capsys):
+    centro = CentroDeDatos()
+    centro.cargar_multiples(str(tmp_path / "*.txt"))
+
+    assert not centro.datos_cargados
+    assert "No se encontraron archivos" in capsys.readouterr().out
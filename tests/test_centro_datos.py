@@ -0,0 +1,258 @@
+"""
+Pruebas de carga y análisis de CentroDeDatos
+"""
+
+import numpy as np
+import pytest
+
+from analisis_cpu.models.centro_datos import CentroDeDatos
+from tests.conftest import escribir_datos, matriz_uso
+
+
+def cargar(ruta, **opciones):
+    """Crea un CentroDeDatos y carga el archivo sin caché binario"""
+    centro = CentroDeDatos(**opciones)
+    centro.cargar_datos(ruta, usar_cache=False)
+    return centro
+
+
+# --- Tamaño según los datos cargados ---
+
+def test_la_matriz_se_dimensiona_con_los_datos(tmp_path, capsys):
+    valores = matriz_uso(70, 45, semilla=3)  # más que la capacidad inicial
+    nombres = [f"S{i}" for i in range(70)]
+    centro = cargar(escribir_datos(tmp_path / "grande.txt", nombres, valores))
+
+    assert (centro.num_servidores, centro.num_dias) == (70, 45)
+    assert centro.datos_cpu.shape == (70, 45)
+    np.testing.assert_array_equal(centro.datos_cpu, valores)
+    assert list(centro.nombres_servidores) == nombres
+    np.testing.assert_allclose(centro.promedios_por_servidor(), valores.mean(axis=1))
+
+
+def test_filas_cortas_y_celdas_invalidas_quedan_ausentes(tmp_path, capsys):
+    ruta = tmp_path / "irregular.txt"
+    ruta.write_text("A;10;20;30\nB;5\nC;x;150;7\n", encoding='utf-8')
+    centro = cargar(str(ruta))
+
+    np.testing.assert_array_equal(centro.datos_cpu, [[10, 20, 30], [5, np.nan, np.nan], [np.nan, np.nan, 7]])
+    assert centro.total_errores_carga == 3  # x, 150 y la fila corta
+    assert [(error['linea'], error['columna']) for error in centro.errores_carga] == [(2, 2), (3, 1), (3, 2)]
+
+
+def test_max_errores_descarta_la_carga(tmp_path, capsys):
+    ruta = tmp_path / "irregular.txt"
+    ruta.write_text("A;10;20;30\nB;5\nC;x;150;7\n", encoding='utf-8')
+    centro = CentroDeDatos()
+
+    centro.cargar_datos(str(ruta), usar_cache=False, max_errores=2)
+    assert not centro.datos_cargados
+    centro.cargar_datos(str(ruta), usar_cache=False, max_errores=3)
+    assert centro.datos_cargados
+
+
+@pytest.mark.parametrize("contenido, total", [("A;10;nan;30\nB;NaN;5;-nan\n", 3),
+                                              ("A;10;nan;30;1\nB;NaN;5;;x\n", 4)])
+def test_texto_nan_cuenta_como_valor_no_numerico(tmp_path, capsys, contenido, total):
+    # Bloque limpio (conversión de una vez) y bloque con otros errores (por línea)
+    ruta = tmp_path / "nan.txt"
+    ruta.write_text(contenido, encoding='utf-8')
+    centro = cargar(str(ruta))
+
+    errores = {(error['linea'], error['columna']): error['motivo'] for error in centro.errores_carga}
+    assert errores[(1, 2)] == "valor no numérico 'nan'"
+    assert errores[(2, 1)] == "valor no numérico 'NaN'"
+    assert centro.total_errores_carga == len(errores) == total
+    assert np.isnan(centro.datos_cpu[0, 1]) and np.isnan(centro.datos_cpu[1, 0])
+
+
+def test_texto_nan_consume_el_presupuesto_de_errores(tmp_path, capsys):
+    ruta = tmp_path / "nan.txt"
+    ruta.write_text("A;nan;20\nB;5;NAN\n", encoding='utf-8')
+    centro = CentroDeDatos()
+
+    centro.cargar_datos(str(ruta), usar_cache=False, max_errores=1)
+    assert not centro.datos_cargados
+    centro.cargar_datos(str(ruta), usar_cache=False, max_errores=2)
+    assert centro.datos_cargados
+
+
+def test_resultados_sin_datos_cargados():
+    centro = CentroDeDatos()
+
+    assert centro.analizar_promedios() is None
+    assert centro.obtener_dia_mayor_carga() is None
+    assert centro.obtener_servidor_menor_uso() is None
+
+
+@pytest.mark.parametrize("contenido, servidores", [("", 0), ("S1\nS2\n", 2)])
+def test_carga_sin_dias_da_resultados_vacios(tmp_path, capsys, contenido, servidores):
+    ruta = tmp_path / "vacio.txt"
+    ruta.write_text(contenido, encoding='utf-8')
+    centro = cargar(str(ruta))
+
+    assert (centro.num_servidores, centro.num_dias) == (servidores, 0)
+    dia = centro.analizar_dia_mayor_carga()
+    assert dia.vacio and dia.dia is None
+    menor = centro.analizar_servidor_menor_uso()
+    assert menor.vacio and menor.fila is None and menor.servidor is None
+    assert centro.obtener_dia_mayor_carga() == {'dia': None, 'descripcion': None, 'carga_total': None}
+    assert centro.obtener_servidor_menor_uso() == {'servidor': None, 'fila': None, 'promedio': None}
+
+
+def test_buffers_crecen_despues_de_una_carga_vacia(tmp_path, capsys):
+    ruta = tmp_path / "vacio.txt"
+    ruta.write_text("", encoding='utf-8')
+    centro = cargar(str(ruta))
+
+    centro.agregar_servidor("nuevo", [10.0, 30.0])
+    centro.agregar_dia([50.0])
+
+    np.testing.assert_array_equal(centro.obtener_datos_servidor("nuevo"), [10, 30, 50])
+    assert centro.obtener_servidor_menor_uso()['servidor'] == "nuevo"
+    assert centro.obtener_dia_mayor_carga()['dia'] == 3
+
+
+def test_servidor_sin_mediciones_no_es_el_de_menor_uso(tmp_path, capsys):
+    ruta = tmp_path / "ausentes.txt"
+    ruta.write_text("A;;\nB;40;70\nC;20;\n", encoding='utf-8')
+    centro = cargar(str(ruta))
+
+    assert centro.obtener_servidor_menor_uso()['servidor'] == "C"
+    assert centro.obtener_dia_mayor_carga()['dia'] == 2
+
+
+# --- Modos de almacenamiento ---
+
+BYTES_POR_CELDA = {"float64": 8, "float32": 4, "centesimas": 2}
+
+
+def test_almacenamiento_desconocido():
+    with pytest.raises(ValueError):
+        CentroDeDatos(almacenamiento="float16")
+
+
+@pytest.mark.parametrize("almacenamiento", CentroDeDatos.ALMACENAMIENTOS)
+@pytest.mark.parametrize("usar_cache", [False, True])
+def test_modos_de_almacenamiento_conservan_los_datos(archivo_datos, capsys, almacenamiento, usar_cache):
+    ruta, nombres, valores = archivo_datos
+    CentroDeDatos().cargar_datos(ruta)  # crea el caché binario
+    centro = CentroDeDatos(almacenamiento=almacenamiento)
+    centro.cargar_datos(ruta, usar_cache=usar_cache)
+
+    datos = centro.datos_cpu
+    np.testing.assert_array_equal(np.isnan(datos), np.isnan(valores))
+    np.testing.assert_allclose(datos, valores, rtol=0, atol=1e-4)
+    np.testing.assert_allclose(centro.promedios_por_servidor(), np.nanmean(valores, axis=1), atol=1e-4)
+    assert list(centro.nombres_servidores) == nombres
+    np.testing.assert_allclose(centro.obtener_datos_servidor("Servidor_3"), valores[2], atol=1e-4)
+
+    resumen = centro.analizar_resumen()
+    assert resumen.almacenamiento == almacenamiento
+    assert resumen.bytes_datos == valores.size * BYTES_POR_CELDA[almacenamiento]
+
+
+def test_centesimas_redondean_y_guardan_ausentes(archivo_datos, capsys):
+    ruta, _, _ = archivo_datos
+    centro = CentroDeDatos(almacenamiento="centesimas")
+    centro.cargar_datos(ruta, usar_cache=False)
+    nuevos = np.full(25, 50.0)
+    nuevos[:5] = [12.344, 12.346, 0.0, 100.0, np.nan]
+
+    dia = centro.agregar_dia(nuevos)
+
+    np.testing.assert_allclose(centro.obtener_datos_dia(dia + 1)[:5], [12.34, 12.35, 0.0, 100.0, np.nan],
+                               atol=1e-5)
+
+
+@pytest.mark.parametrize("almacenamiento", ["float32", "centesimas"])
+def test_compactar_ahorra_memoria(archivo_datos, capsys, almacenamiento):
+    ruta, _, valores = archivo_datos
+    centro = CentroDeDatos(almacenamiento=almacenamiento)
+    centro.cargar_datos(ruta, usar_cache=False)
+    antes = centro.datos_cpu.copy()
+
+    centro.compactar()
+
+    resumen = centro.analizar_resumen()
+    assert resumen.bytes_ahorrados > 0
+    assert resumen.dtype_nombres.startswith("<U")
+    np.testing.assert_array_equal(centro.datos_cpu, antes)
+
+
+# --- Días agregados de forma incremental ---
+
+AGREGADOS = ("promedios_por_servidor", "sumas_por_servidor", "sumas_por_dia", "maximos_por_servidor",
+             "minimos_por_servidor", "maximos_por_dia", "minimos_por_dia", "percentiles_por_dia")
+
+
+def _agregados(centro):
+    return {nombre: getattr(centro, nombre)() for nombre in AGREGADOS}
+
+
+def _iguales(obtenido, esperado, tolerancia):
+    if isinstance(esperado, tuple):
+        for parte_obtenida, parte_esperada in zip(obtenido, esperado):
+            _iguales(parte_obtenida, parte_esperada, tolerancia)
+        return
+    np.testing.assert_allclose(np.asarray(obtenido, dtype=np.float64), np.asarray(esperado, dtype=np.float64),
+                               rtol=tolerancia, atol=tolerancia, equal_nan=True)
+
+
+@pytest.mark.parametrize("backend", ["numpy", "python"])
+@pytest.mark.parametrize("almacenamiento", CentroDeDatos.ALMACENAMIENTOS)
+def test_agregar_dia_actualiza_los_agregados(archivo_datos, tmp_path, capsys, backend, almacenamiento):
+    ruta, nombres, valores = archivo_datos
+    centro = CentroDeDatos(backend=backend, almacenamiento=almacenamiento)
+    centro.cargar_datos(ruta, usar_cache=False)
+    _agregados(centro)  # memoriza todo antes de agregar
+    nuevos = matriz_uso(25, 3, semilla=9, ausentes=0.2)
+    nuevos[0, 1] = 100.0  # nuevo máximo
+    nuevos[1, :] = np.nan
+
+    for dia in range(3):
+        assert centro.agregar_dia(nuevos[:, dia]) == 30 + dia
+
+    completo = escribir_datos(tmp_path / "completo.txt", nombres, np.hstack([valores, nuevos]))
+    referencia = CentroDeDatos(backend=backend, almacenamiento=almacenamiento)
+    referencia.cargar_datos(completo, usar_cache=False)
+    assert centro.num_dias == referencia.num_dias == 33
+    obtenidos, esperados = _agregados(centro), _agregados(referencia)
+    # Los modos compactos recalculan desde cero con precisión float32
+    tolerancia = 1e-9 if almacenamiento == "float64" else 1e-5
+    for nombre in AGREGADOS:
+        _iguales(obtenidos[nombre], esperados[nombre], tolerancia)
+
+
+def test_agregar_dia_valida_la_cantidad_de_valores(archivo_datos, capsys):
+    centro = cargar(archivo_datos[0])
+
+    with pytest.raises(ValueError):
+        centro.agregar_dia(np.zeros(24))
+    assert centro.num_dias == 30
+
+
+def test_agregar_mediciones_por_nombre(archivo_datos, capsys):
+    centro = cargar(archivo_datos[0])
+
+    dia = centro.agregar_mediciones({"Servidor_2": 40.0, "Nuevo": 10.0})
+
+    assert centro.num_servidores == 26
+    columna = centro.obtener_datos_dia(dia + 1)
+    assert columna[1] == 40.0 and columna[-1] == 10.0 and np.isnan(columna[0])
+    assert np.isnan(centro.obtener_datos_servidor("Nuevo")[:-1]).all()
+
+
+def test_agregar_dia_al_archivo_regenera_el_cache(archivo_datos, capsys):
+    ruta, _, valores = archivo_datos
+    centro = cargar(ruta)
+    nuevos = np.round(np.linspace(1, 99, 25), 2)
+    nuevos[3] = np.nan
+
+    centro.agregar_dia(nuevos, archivo=ruta)
+
+    releido = CentroDeDatos()
+    releido.cargar_datos(ruta)
+    assert releido.estadisticas_carga['desde_cache']
+    np.testing.assert_array_equal(releido.datos_cpu, np.hstack([valores, nuevos[:, np.newaxis]]))
+    np.testing.assert_array_equal(cargar(ruta).datos_cpu, releido.datos_cpu)
@@ -0,0 +1,126 @@
+"""
+Pruebas del arranque de la línea de comandos
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pytest
+
+from analisis_cpu.cli import crear_parser, main
+from analisis_cpu.controllers.analisis_lote import ANALISIS_LOTE
+from analisis_cpu.models.centro_datos import CentroDeDatos
+from analisis_cpu.models.resultados import reemplazar_nan
+from tests.conftest import escribir_datos, matriz_uso
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Tiempo de pared que --help puede sumar al de un intérprete vacío
+PRESUPUESTO_AYUDA_S = 0.5
+
+
+def _ejecutar(*argumentos):
+    """Ejecuta Python en la raíz del proyecto y retorna (segundos, proceso)"""
+    inicio = time.perf_counter()
+    proceso = subprocess.run([sys.executable, *argumentos], cwd=RAIZ, capture_output=True,
+                             text=True, encoding='utf-8', timeout=60)
+    return time.perf_counter() - inicio, proceso
+
+
+def test_ayuda_no_importa_numpy():
+    # -X importtime lista en stderr cada módulo que importó el proceso
+    _, proceso = _ejecutar("-X", "importtime", "-m", "analisis_cpu.cli", "--help")
+
+    assert proceso.returncode == 0
+    assert "--servir" in proceso.stdout
+    importados = {linea.rsplit("|", 1)[-1].strip() for linea in proceso.stderr.splitlines()
+                  if linea.startswith("import time:")}
+    assert "analisis_cpu.controllers.analisis_lote" in importados
+    assert not any(modulo.split(".")[0] == "numpy" for modulo in importados)
+    assert "analisis_cpu.controllers.controlador_principal" not in importados
+
+
+def test_ayuda_dentro_del_presupuesto():
+    _ejecutar("-m", "analisis_cpu.cli", "--help")  # compila el bytecode si falta
+    vacio = min(_ejecutar("-c", "pass")[0] for _ in range(3))
+    ayuda = min(_ejecutar("-m", "analisis_cpu.cli", "--help")[0] for _ in range(3))
+
+    assert ayuda - vacio < PRESUPUESTO_AYUDA_S, f"--help tardó {ayuda:.3f} s (intérprete vacío {vacio:.3f} s)"
+
+
+@pytest.mark.parametrize("argumentos", [["--servir", "--run", "promedios"],
+                                        ["--publicar", "cpu", "--archivar", "datos.cpuz"],
+                                        ["--run", "promedios", "--archivar", "datos.cpuz"]])
+def test_modos_son_excluyentes(argumentos, capsys):
+    with pytest.raises(SystemExit) as salida:
+        crear_parser().parse_args(argumentos)
+
+    assert salida.value.code == 2
+    assert "not allowed with" in capsys.readouterr().err
+
+
+def _lote(*argumentos):
+    """Ejecuta main() en modo lote y retorna su código de salida"""
+    with pytest.raises(SystemExit) as salida:
+        main(list(argumentos))
+    return salida.value.code
+
+
+@pytest.fixture
+def archivo_lote(tmp_path):
+    """25 servidores x 30 días; Servidor_4 sin mediciones"""
+    valores = matriz_uso(25, 30, semilla=1, ausentes=0.05)
+    valores[3] = np.nan
+    return escribir_datos(tmp_path / "uso.txt", [f"Servidor_{i + 1}" for i in range(25)], valores)
+
+
+def test_lote_json_con_todos_los_analisis(archivo_lote, capsys):
+    assert _lote("--file", archivo_lote, "--run", ",".join(ANALISIS_LOTE), "--format", "json") == 0
+
+    salida = capsys.readouterr()
+    documento = json.loads(salida.out)
+    assert list(documento['analisis']) == list(ANALISIS_LOTE)
+    assert "errores de formato" in salida.err
+
+    centro = CentroDeDatos()
+    centro.cargar_datos(archivo_lote)
+    assert documento['analisis']['promedios'] == reemplazar_nan(centro.obtener_promedios())
+    assert documento['analisis']['promedios'][3] == {'servidor': "Servidor_4", 'promedio': None}
+    assert documento['analisis']['dia-max'] == reemplazar_nan(centro.obtener_dia_mayor_carga())
+
+
+def test_lote_parametros_de_alertas_y_consolidacion(archivo_lote, capsys):
+    assert _lote("--file", archivo_lote, "--run", "alertas,consolidacion", "--regla-alerta", "zscore",
+                 "--limite-alerta", "1.5", "--capacidad-host", "250") == 0
+
+    analisis = json.loads(capsys.readouterr().out)['analisis']
+    assert (analisis['alertas']['regla'], analisis['alertas']['limite']) == ("zscore", 1.5)
+    assert analisis['consolidacion']['capacidad'] == 250.0
+
+
+def test_lote_texto_a_archivo_con_limite_de_filas(archivo_lote, tmp_path, capsys):
+    destino = tmp_path / "informe.txt"
+    assert _lote("--file", archivo_lote, "--run", "promedios,dia-max", "--format", "texto",
+                 "--limite-filas", "3", "--output", str(destino)) == 0
+
+    assert capsys.readouterr().out == ""
+    lineas = destino.read_text(encoding='utf-8').splitlines()
+    assert "=== PROMEDIO MENSUAL DE USO DE CPU POR SERVIDOR ===" in lineas
+    assert "=== DÍA CON MAYOR CARGA TOTAL DE CPU ===" in lineas
+    # Ambos listados (promedios y detalle del día) se cortan en 3 servidores
+    assert sum(linea.startswith("Servidor_") for linea in lineas) == 6
+    assert lineas.count("... y 22 más (página 1 de 9)") == 2
+
+
+def test_lote_con_carga_fallida_o_analisis_desconocido(tmp_path, capsys):
+    assert _lote("--file", str(tmp_path / "no_existe.txt"), "--run", "promedios") == 1
+    salida = capsys.readouterr()
+    assert salida.out == "" and salida.err
+
+    assert _lote("--run", "promedios,inexistente") == 2
+    assert "análisis desconocidos: inexistente" in capsys.readouterr().err
+
@@ -0,0 +1,136 @@
+"""
+Pruebas de concurrencia: lectores concurrentes mientras otro hilo recarga los
+datos y agrega días al mismo CentroDeDatos, y transacciones descartadas
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from analisis_cpu.models.centro_datos import CentroDeDatos
+from tests.conftest import escribir_datos, matriz_uso
+
+DURACION_S = 1.5
+DIAS_AGREGADOS = 3
+VALOR_AGREGADO = 50.0
+
+
+def _conjuntos(tmp_path):
+    """Dos archivos con distinta forma y nombres: {servidores: (ruta, nombres, valores)}"""
+    conjuntos = {}
+    for prefijo, servidores, dias in (("A", 8, 10), ("B", 12, 6)):
+        nombres = [f"{prefijo}{i}" for i in range(servidores)]
+        valores = matriz_uso(servidores, dias, semilla=servidores)
+        ruta = escribir_datos(tmp_path / f"{prefijo}.txt", nombres, valores)
+        conjuntos[servidores] = (ruta, nombres, valores)
+    return conjuntos
+
+
+def _comprobar_resumen(resumen, conjuntos):
+    _, _, valores = conjuntos[resumen['servidores']]
+    agregados = resumen['dias'] - valores.shape[1]
+    assert 0 <= agregados <= DIAS_AGREGADOS
+    assert resumen['mediciones'] == resumen['servidores'] * resumen['dias']
+    return agregados
+
+
+def _comprobar_promedios(promedios, conjuntos, agregados=None):
+    _, nombres, valores = conjuntos[len(promedios)]
+    assert [fila['servidor'] for fila in promedios] == nombres
+    obtenidos = np.array([fila['promedio'] for fila in promedios])
+    candidatos = range(DIAS_AGREGADOS + 1) if agregados is None else (agregados,)
+    esperados = [np.hstack([valores, np.full((len(nombres), k), VALOR_AGREGADO)]).mean(axis=1)
+                 for k in candidatos]
+    assert any(np.allclose(obtenidos, esperado) for esperado in esperados)
+
+
+def _comprobar_dia(datos, dia, conjuntos, dias=None):
+    if datos is None:  # día fuera de rango en la instantánea consultada
+        assert dias is None or dia > dias
+        return
+    _, _, valores = conjuntos[len(datos)]
+    assert dias is None or dia <= dias
+    if dia <= valores.shape[1]:
+        np.testing.assert_array_equal(datos, valores[:, dia - 1])
+    else:
+        assert (datos == VALOR_AGREGADO).all()
+
+
+def test_lectores_concurrentes_ven_instantaneas_consistentes(tmp_path, capsys):
+    conjuntos = _conjuntos(tmp_path)
+    rutas = [ruta for ruta, _, _ in conjuntos.values()]
+    centro = CentroDeDatos(hilos=4)
+    centro.MIN_CELDAS_PARALELO = 1  # reparte también los agregados en el pool
+    centro.cargar_datos(rutas[0], usar_cache=False)
+
+    fin = time.perf_counter() + DURACION_S
+    errores, lecturas, recargas = [], [], []
+
+    def lector(semilla):
+        generador = np.random.default_rng(semilla)
+        cuenta = 0
+        try:
+            while time.perf_counter() < fin:
+                dia = int(generador.integers(1, 14))
+                # Consultas sueltas: cada una fija su propia instantánea
+                _comprobar_resumen(centro.obtener_resumen(), conjuntos)
+                _comprobar_promedios(centro.obtener_promedios(), conjuntos)
+                _comprobar_dia(centro.obtener_datos_dia(dia), dia, conjuntos)
+                # Dentro de instantanea() las tres deben describir los mismos datos
+                with centro.instantanea():
+                    resumen = centro.obtener_resumen()
+                    agregados = _comprobar_resumen(resumen, conjuntos)
+                    promedios = centro.obtener_promedios()
+                    assert len(promedios) == resumen['servidores']
+                    _comprobar_promedios(promedios, conjuntos, agregados)
+                    datos = centro.obtener_datos_dia(dia)
+                    _comprobar_dia(datos, dia, conjuntos, resumen['dias'])
+                    assert datos is None or len(datos) == resumen['servidores']
+                cuenta += 1
+        except Exception as error:
+            errores.append(error)
+        lecturas.append(cuenta)
+
+    def escritor():
+        cuenta = 0
+        try:
+            while time.perf_counter() < fin:
+                centro.cargar_datos(rutas[cuenta % 2], usar_cache=False)
+                for _ in range(DIAS_AGREGADOS):
+                    centro.agregar_dia(np.full(centro.num_servidores, VALOR_AGREGADO))
+                cuenta += 1
+        except Exception as error:
+            errores.append(error)
+        recargas.append(cuenta)
+
+    hilos = [threading.Thread(target=lector, args=(semilla,)) for semilla in range(4)]
+    hilos.append(threading.Thread(target=escritor))
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    capsys.readouterr()  # mensajes de carga del escritor
+
+    assert errores == []
+    assert len(lecturas) == 4 and min(lecturas) > 0
+    assert recargas[0] > 1
+
+
+def test_transaccion_descartada_no_deja_nombres_en_el_indice(archivo_datos, tmp_path, capsys):
+    centro = CentroDeDatos()
+    centro.cargar_datos(archivo_datos[0], usar_cache=False)
+    servidores = centro.num_servidores
+
+    with pytest.raises(OSError):
+        centro.agregar_mediciones({"fantasma": 50.0}, archivo=str(tmp_path / "no-existe.txt"))
+    centro.agregar_mediciones({"real": 7.0})
+
+    assert centro.num_servidores == servidores + 1
+    assert centro.indice_servidor("fantasma") is None
+    assert centro.obtener_datos_servidor("fantasma") is None
+    assert len(centro.buscar_servidores("fantasma")) == 0
+    assert len(centro.buscar_servidores("fantas*")) == 0
+    assert centro.indice_servidor("real") == servidores
+    assert centro.obtener_datos_servidor("real")[-1] == 7.0
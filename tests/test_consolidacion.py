@@ -0,0 +1,70 @@
+"""
+Pruebas del plan de consolidación de servidores en hosts
+"""
+
+import numpy as np
+import pytest
+
+from analisis_cpu.interface.interfaz_usuario import InterfazUsuario
+from analisis_cpu.models.centro_datos import CentroDeDatos
+from analisis_cpu.utils.consolidacion import Consolidacion
+from tests.conftest import escribir_datos, matriz_uso
+
+
+@pytest.mark.parametrize("backend", Consolidacion.BACKENDS)
+def test_consolidacion_sin_servidores(tmp_path, capsys, backend):
+    ruta = tmp_path / "vacio.txt"
+    ruta.write_text("", encoding='utf-8')
+    centro = CentroDeDatos(backend=backend)
+    centro.cargar_datos(str(ruta), usar_cache=False)
+
+    resultado = centro.analizar_consolidacion()
+    assert len(resultado) == 0 and resultado.hosts_ahorrados == 0
+    assert resultado.servidores_por_host() == []
+    assert resultado.a_dict()['asignacion'] == []
+    lineas = InterfazUsuario(centro).lineas_consolidacion(resultado)
+    assert "Hosts necesarios: 0" in lineas
+
+
+@pytest.mark.parametrize("servidores, dias, capacidad", [(60, 30, 100.0), (200, 12, 250.0), (80, 3, 400.0)])
+def test_motores_asignan_igual(servidores, dias, capacidad):
+    matriz = matriz_uso(servidores, dias, semilla=servidores, ausentes=0.05) * 0.6
+
+    asignacion = Consolidacion("numpy").planificar(matriz, capacidad)
+    np.testing.assert_array_equal(asignacion, Consolidacion("python").planificar(matriz, capacidad))
+
+    # Ningún host supera la capacidad en ningún día y los hosts se abren en orden
+    demanda = Consolidacion.demanda(matriz)
+    cargas = Consolidacion.cargas_por_host(demanda, asignacion)
+    assert (cargas <= capacidad + Consolidacion.TOLERANCIA).all()
+    assert set(asignacion.tolist()) == set(range(len(cargas)))
+
+
+@pytest.mark.parametrize("backend", Consolidacion.BACKENDS)
+def test_plan_de_la_flota(tmp_path, capsys, backend):
+    valores = np.array([[60, 10, np.nan],   # el día ausente cuenta como su pico (60)
+                        [30, 70, 20],
+                        [30, 5, 40],
+                        [90, 10, 10],      # supera la capacidad: queda solo
+                        [10, 10, 10]], dtype=float)
+    centro = CentroDeDatos(backend=backend)
+    centro.cargar_datos(escribir_datos(tmp_path / "uso.txt", list("ABCDE"), valores), usar_cache=False)
+
+    resultado = centro.analizar_consolidacion(80.0)
+    assert [str(nombre) for nombre in resultado.nombres[resultado.excedidos]] == ["D"]
+    grupos = [sorted(str(nombre) for nombre in resultado.nombres[filas]) for filas in resultado.servidores_por_host()]
+    assert ["D"] in grupos
+    cargas = resultado.cargas[[host for host, grupo in enumerate(grupos) if "D" not in grupo]]
+    assert (cargas <= 80.0 + Consolidacion.TOLERANCIA).all()
+    assert resultado.hosts_ahorrados == len(valores) - len(resultado)
+    np.testing.assert_allclose(resultado.holgura_por_dia,
+                               len(resultado) * 80.0 - Consolidacion.demanda(valores).sum(axis=0))
+
+
+def test_capacidad_invalida(archivo_datos, capsys):
+    centro = CentroDeDatos()
+    centro.cargar_datos(archivo_datos[0], usar_cache=False)
+
+    with pytest.raises(ValueError):
+        centro.analizar_consolidacion(0)
+
@@ -0,0 +1,75 @@
+"""
+Pruebas de los pares más correlacionados y de los grupos de carga conjunta
+"""
+
+import numpy as np
+import pytest
+
+from analisis_cpu.models.centro_datos import CentroDeDatos
+from analisis_cpu.utils.correlaciones import Correlaciones
+from tests.conftest import escribir_datos, matriz_uso
+
+
+def test_pares_coinciden_con_corrcoef():
+    matriz = matriz_uso(60, 40, semilla=6)
+    filas, correlaciones = Correlaciones("numpy").pares_mas_correlacionados(matriz, 4)
+
+    referencia = np.corrcoef(matriz)
+    np.fill_diagonal(referencia, -np.inf)
+    esperadas = np.argsort(-referencia, axis=1, kind='stable')[:, :4]
+    np.testing.assert_array_equal(filas, esperadas)
+    np.testing.assert_allclose(correlaciones, np.take_along_axis(referencia, esperadas, axis=1), atol=1e-5)
+
+
+@pytest.mark.parametrize("tamano_bloque", [None, 1, 7])
+def test_motores_y_bloques_coinciden(tamano_bloque):
+    matriz = matriz_uso(30, 20, semilla=7, ausentes=0.1)
+    matriz[4] = 50.0       # constante: sin correlación definida
+    matriz[9] = np.nan     # sin mediciones
+
+    filas, correlaciones = Correlaciones("numpy").pares_mas_correlacionados(matriz, 5, tamano_bloque)
+    filas_ref, correlaciones_ref = Correlaciones("python").pares_mas_correlacionados(matriz, 5)
+
+    np.testing.assert_array_equal(filas, filas_ref)
+    np.testing.assert_allclose(correlaciones, correlaciones_ref, atol=1e-5)
+    for fila in (4, 9):
+        assert (filas[fila] == -1).all() and np.isnan(correlaciones[fila]).all()
+        assert not np.isin(filas, fila).any()
+
+
+@pytest.mark.parametrize("backend", Correlaciones.BACKENDS)
+def test_mas_pares_que_servidores_deja_huecos(backend):
+    filas, correlaciones = Correlaciones(backend).pares_mas_correlacionados(matriz_uso(3, 10, semilla=8), 4)
+
+    assert (filas[:, 2:] == -1).all() and np.isnan(correlaciones[:, 2:]).all()
+    assert (filas[:, :2] >= 0).all()
+
+
+def test_agrupar_coincide_con_union_busqueda():
+    generador = np.random.default_rng(9)
+    servidores = 200
+    filas = generador.integers(0, servidores, (servidores, 3))
+    correlaciones = generador.uniform(-1, 1, (servidores, 3))
+    filas[generador.random((servidores, 3)) < 0.1] = -1
+
+    etiquetas = Correlaciones("numpy").agrupar(filas, correlaciones, 0.6)
+    np.testing.assert_array_equal(etiquetas, Correlaciones("python").agrupar(filas, correlaciones, 0.6))
+
+
+@pytest.mark.parametrize("backend", Correlaciones.BACKENDS)
+def test_grupos_de_servidores_que_cargan_a_la_vez(tmp_path, capsys, backend):
+    generador = np.random.default_rng(10)
+    base_a, base_b = generador.uniform(10, 90, (2, 30))
+    valores = np.vstack([base_a, generador.uniform(10, 90, 30), base_b + 1, base_a * 0.5 + 5,
+                         base_b * 0.8, base_a + 2])
+    valores += generador.normal(0, 0.5, valores.shape)
+    nombres = ["a1", "suelto", "b1", "a2", "b2", "a3"]
+    centro = CentroDeDatos(backend=backend)
+    centro.cargar_datos(escribir_datos(tmp_path / "uso.txt", nombres, np.round(valores, 2)), usar_cache=False)
+
+    resultado = centro.analizar_correlaciones(n_pares=2, umbral=0.95)
+    grupos = [[str(nombre) for nombre in resultado.nombres[grupo]] for grupo in resultado.grupos]
+    assert grupos == [["a1", "a2", "a3"], ["b1", "b2"]]
+    assert resultado.a_dict()['grupos'] == grupos
+    with pytest.raises(ValueError):
+        centro.analizar_correlaciones(umbral=1.5)
@@ -0,0 +1,99 @@
+"""
+Pruebas de la instrumentación con mediciones anidadas y concurrentes
+"""
+
+import threading
+
+import pytest
+
+from analisis_cpu.controllers.controlador_principal import ControladorPrincipal
+from analisis_cpu.models.centro_datos import CentroDeDatos
+from analisis_cpu.utils import instrumentacion as modulo_instrumentacion
+from analisis_cpu.utils.instrumentacion import Instrumentacion
+
+
+@pytest.fixture
+def instrumentacion():
+    instrumentacion = Instrumentacion()
+    instrumentacion.activar()
+    yield instrumentacion
+    instrumentacion.desactivar()
+
+
+def test_pico_de_una_medicion_secuencial(instrumentacion):
+    with instrumentacion.medir("externa"):
+        with instrumentacion.medir("interna"):
+            bloque = bytearray(5_000_000)
+            del bloque
+
+    metricas = instrumentacion.exportar()['metricas']
+    assert metricas['externa']['bytes_pico_max'] >= 5_000_000
+    assert metricas['externa']['picos_omitidos'] == 0
+    assert metricas['interna']['llamadas'] == 1
+
+
+def test_profundidad_por_hilo_y_picos_concurrentes_omitidos(instrumentacion):
+    hilos, repeticiones = 4, 100
+    barrera = threading.Barrier(hilos)
+    errores = []
+
+    def medir():
+        try:
+            barrera.wait()
+            for _ in range(repeticiones):
+                assert instrumentacion._profundidad == 0
+                with instrumentacion.medir("externa"):
+                    with instrumentacion.medir("interna"):
+                        assert instrumentacion._profundidad == 2
+                        bytearray(1000)
+        except Exception as error:
+            errores.append(error)
+
+    trabajadores = [threading.Thread(target=medir) for _ in range(hilos)]
+    for trabajador in trabajadores:
+        trabajador.start()
+    for trabajador in trabajadores:
+        trabajador.join()
+
+    assert errores == []
+    metricas = instrumentacion.exportar()['metricas']
+    assert metricas['externa']['llamadas'] == hilos * repeticiones
+    assert metricas['interna']['llamadas'] == hilos * repeticiones
+    assert metricas['interna']['picos_omitidos'] == 0
+    assert instrumentacion._exteriores_activas == 0
+    assert instrumentacion._profundidad == 0
+
+
+class Medida:
+    def contar(self):
+        return 1
+
+
+def test_instrumentar_dos_veces_no_duplica_mediciones(instrumentacion):
+    original = Medida.contar
+    instrumentacion.instrumentar_clase(Medida)
+    instrumentacion.instrumentar_clase(Medida)
+
+    Medida().contar()
+    assert instrumentacion.exportar()['metricas']['Medida.contar']['llamadas'] == 1
+    instrumentacion.desactivar()
+    assert Medida.contar is original
+
+
+def test_cada_controlador_no_vuelve_a_activar_desde_el_entorno(monkeypatch):
+    monkeypatch.setenv(modulo_instrumentacion.VARIABLE_ENTORNO, "1")
+    monkeypatch.delenv(modulo_instrumentacion.VARIABLE_PERFIL, raising=False)
+    compartida = modulo_instrumentacion.instrumentacion
+    original = CentroDeDatos.promedios_por_servidor
+    try:
+        ControladorPrincipal()
+        envuelto = CentroDeDatos.promedios_por_servidor
+        ControladorPrincipal()
+
+        assert envuelto is not original and CentroDeDatos.promedios_por_servidor is envuelto
+        nombres = [nombre for clase, nombre, _ in compartida._clases_instrumentadas if clase is CentroDeDatos]
+        assert len(nombres) == len(set(nombres))
+    finally:
+        compartida.desactivar()
+        compartida.reiniciar()
+    assert CentroDeDatos.promedios_por_servidor is original
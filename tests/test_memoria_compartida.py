@@ -0,0 +1,92 @@
+"""
+Pruebas de la publicación de los datos en memoria compartida
+"""
+
+import json
+import os
+import subprocess
+import sys
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from analisis_cpu.models.centro_datos import CentroDeDatos
+from analisis_cpu.models.memoria_compartida import MemoriaCompartida
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def publicado(archivo_datos, capsys, request):
+    """Publica el archivo de prueba y libera el segmento al terminar"""
+    centro = CentroDeDatos(almacenamiento=getattr(request, 'param', "float64"))
+    centro.cargar_datos(archivo_datos[0], usar_cache=False)
+    segmento = centro.publicar_memoria_compartida()
+    yield centro, segmento
+    segmento.liberar()
+
+
+@pytest.mark.parametrize("publicado", ["float64", "float32", "centesimas"], indirect=True)
+def test_adjuntar_sin_copia(publicado, capsys):
+    origen, segmento = publicado
+    centro = CentroDeDatos()
+    centro.cargar_datos(f"shm://{segmento.nombre}")
+
+    assert centro.datos_cargados
+    assert centro.almacenamiento == origen.almacenamiento
+    np.testing.assert_array_equal(centro.datos_cpu, origen.datos_cpu)
+    np.testing.assert_array_equal(centro.nombres_servidores, origen.nombres_servidores)
+    assert centro.periodos == origen.periodos
+    assert not centro._datos_crudos.flags.writeable
+    np.testing.assert_allclose(centro.promedios_por_servidor(), origen.promedios_por_servidor())
+    assert centro.indice_servidor("Servidor_7") == 6
+
+
+def test_otro_proceso_lee_el_segmento(publicado, capsys):
+    origen, segmento = publicado
+    codigo = ("import json; from analisis_cpu.models.centro_datos import CentroDeDatos\n"
+              "import contextlib, io\n"
+              "centro = CentroDeDatos()\n"
+              "with contextlib.redirect_stdout(io.StringIO()):\n"
+              f"    centro.cargar_datos('shm://{segmento.nombre}')\n"
+              "print(json.dumps(centro.obtener_promedios()))")
+
+    for _ in range(2):  # el segmento sigue disponible cuando el otro proceso termina
+        proceso = subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ, capture_output=True, text=True,
+                                 encoding='utf-8', timeout=60)
+        assert proceso.returncode == 0, proceso.stderr
+        assert json.loads(proceso.stdout) == json.loads(json.dumps(origen.obtener_promedios()))
+
+
+def test_agregar_dia_no_modifica_el_segmento(publicado, capsys):
+    origen, segmento = publicado
+    centro = CentroDeDatos()
+    centro.cargar_datos(f"shm://{segmento.nombre}")
+
+    centro.agregar_dia(np.full(centro.num_servidores, 50.0))
+    assert centro.num_dias == origen.num_dias + 1
+    assert segmento.datos.shape == origen.datos_cpu.shape
+    with MemoriaCompartida.adjuntar(segmento.nombre) as otra:
+        np.testing.assert_array_equal(otra.datos, origen.datos_cpu)
+
+
+def test_segmentos_inexistentes_o_ajenos(capsys):
+    centro = CentroDeDatos()
+    centro.cargar_datos("shm://analisis_cpu_no_existe")
+    assert not centro.datos_cargados
+    assert "No existe el segmento" in capsys.readouterr().out
+
+    ajeno = shared_memory.SharedMemory(create=True, size=64)
+    try:
+        centro.cargar_datos(f"shm://{ajeno.name}")
+        assert not centro.datos_cargados
+        assert "no contiene datos de CPU" in capsys.readouterr().out
+    finally:
+        ajeno.close()
+        ajeno.unlink()
+
+
+def test_publicar_sin_datos():
+    with pytest.raises(ValueError):
+        CentroDeDatos().publicar_memoria_compartida()
@@ -0,0 +1,125 @@
+"""
+Pruebas de la selección de servidores y días y de la consulta por rango
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from analisis_cpu.interface.interfaz_usuario import InterfazUsuario
+from analisis_cpu.models.centro_datos import CentroDeDatos
+from tests.conftest import escribir_datos, matriz_uso
+
+
+@pytest.fixture
+def centro(archivo_datos, capsys):
+    ruta, _, _ = archivo_datos
+    centro = CentroDeDatos()
+    centro.cargar_datos(ruta, usar_cache=False)
+    return centro
+
+
+@pytest.mark.parametrize("servidores, esperadas", [
+    (None, slice(0, 25)),
+    (range(3, 8), slice(3, 8)),
+    ("Servidor_2", slice(1, 2)),
+    ("Servidor_2?", slice(19, 25)),
+    (["Servidor_5", "Servidor_6", "Servidor_7"], slice(4, 7)),
+    (["Servidor_9", "Servidor_1"], [8, 0]),
+    ([7, 2, 2], [7, 2, 2]),
+])
+def test_seleccionar_servidores(centro, servidores, esperadas):
+    filas = centro.seleccionar_servidores(servidores)
+
+    # Las filas contiguas se devuelven como slice para que la vista no copie
+    assert isinstance(filas, slice) == isinstance(esperadas, slice)
+    np.testing.assert_array_equal(np.arange(25)[filas], np.arange(25)[esperadas])
+
+
+def test_seleccionar_servidores_con_mascara(centro):
+    mascara = np.zeros(25, dtype=bool)
+    mascara[[1, 4, 5]] = True
+
+    np.testing.assert_array_equal(centro.seleccionar_servidores(mascara), [1, 4, 5])
+    with pytest.raises(ValueError, match="máscara"):
+        centro.seleccionar_servidores(mascara[:10])
+
+
+@pytest.mark.parametrize("servidores", [["Servidor_1", "Otro"], [0, 25], [-1]])
+def test_selectores_invalidos(centro, servidores):
+    with pytest.raises(ValueError):
+        centro.seleccionar_servidores(servidores)
+
+
+def test_dias_solo_contiguos(centro):
+    assert centro.seleccionar_dias(range(5, 50)) == slice(5, 30)
+    with pytest.raises(ValueError):
+        centro.seleccionar_dias(slice(0, 10, 2))
+    with pytest.raises(ValueError):
+        centro.seleccionar_dias([1, 2, 3])
+
+
+def test_vista_rango_sin_copia(centro, archivo_datos):
+    _, _, valores = archivo_datos
+    vista = centro.vista_rango(range(3, 10), range(5, 12))
+
+    np.testing.assert_array_equal(vista, valores[3:10, 5:12])
+    assert np.shares_memory(vista, centro.datos_cpu)
+    np.testing.assert_array_equal(centro.vista_rango([9, 3], range(5, 12)), valores[[9, 3], 5:12])
+
+
+@pytest.mark.parametrize("almacenamiento", ["float64", "float32", "centesimas"])
+@pytest.mark.parametrize("servidores, dias, filas, columnas", [
+    (None, None, slice(None), slice(0, None)),
+    (range(5, 40), range(3, 20), slice(5, 40), slice(3, 20)),
+    ([30, 2, 17, 7], range(10, 11), [30, 2, 17, 7], slice(10, 11)),
+])
+def test_analizar_rango_coincide_con_numpy(tmp_path, capsys, almacenamiento, servidores, dias, filas, columnas):
+    valores = matriz_uso(50, 24, semilla=11, ausentes=0.1)
+    valores[7] = np.nan
+    centro = CentroDeDatos(almacenamiento=almacenamiento)
+    centro.cargar_datos(escribir_datos(tmp_path / "uso.txt", [f"S{i}" for i in range(50)], valores),
+                        usar_cache=False)
+    seleccion = valores[filas, columnas]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # filas sin mediciones
+        maximos, minimos = np.nanmax(seleccion, axis=1), np.nanmin(seleccion, axis=1)
+    # Los modos compactos se decodifican a float32
+    tolerancia = 1e-9 if almacenamiento == "float64" else 1e-5
+
+    resultado = centro.analizar_rango(servidores, dias)
+    np.testing.assert_array_equal(resultado.filas, np.arange(50)[filas])
+    np.testing.assert_array_equal(resultado.mediciones, (~np.isnan(seleccion)).sum(axis=1))
+    np.testing.assert_allclose(resultado.sumas, np.nansum(seleccion, axis=1), rtol=tolerancia)
+    np.testing.assert_allclose(resultado.maximos, maximos, rtol=tolerancia)
+    np.testing.assert_allclose(resultado.minimos, minimos, rtol=tolerancia)
+
+    con_datos = resultado.mediciones > 0
+    dias_maximo = np.where(np.isnan(seleccion), -np.inf, seleccion).argmax(axis=1) + columnas.start
+    np.testing.assert_array_equal(resultado.dias_maximo, np.where(con_datos, dias_maximo, -1))
+    assert resultado.extremo()[2] == pytest.approx(np.nanmax(seleccion), rel=tolerancia)
+
+
+@pytest.mark.parametrize("servidores, dias, seleccionados", [
+    ([], None, 0),
+    (slice(40, 50), None, 0),
+    (None, slice(30, 40), 25),
+    (slice(2, 5), range(10, 10), 3),
+])
+def test_seleccion_vacia_da_un_rango_sin_mediciones(centro, servidores, dias, seleccionados):
+    resultado = centro.analizar_rango(servidores, dias)
+
+    assert len(resultado) == seleccionados
+    assert resultado.total_mediciones == 0 and resultado.suma == 0
+    assert np.isnan(resultado.promedio)
+    assert resultado.extremo() is None and resultado.extremo(mayor=False) is None
+    assert (resultado.dias_maximo == -1).all() and (resultado.dias_minimo == -1).all()
+    datos = resultado.a_dict()
+    assert datos['maximo'] is None and datos['mediciones'] == 0
+    assert InterfazUsuario(centro).lineas_rango(resultado)
+
+
+def test_selector_sin_coincidencias_es_un_error(centro):
+    with pytest.raises(ValueError, match="No hay servidores"):
+        centro.analizar_rango("Inexistente*")
@@ -0,0 +1,68 @@
+"""
+Pruebas de las ventanas móviles de SeriesTiempo contra NumPy directo
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+from numpy.lib.stride_tricks import sliding_window_view
+
+from analisis_cpu.utils.series_tiempo import SeriesTiempo
+
+
+def _matriz_con_ausentes():
+    generador = np.random.default_rng(15)
+    matriz = generador.uniform(0, 100, (12, 60))
+    matriz[2, 20:35] = 87.25                        # tramo constante
+    matriz[4] = 1e6 + generador.uniform(0, 1, 60)   # desplazamiento grande
+    matriz[6, ::4] = np.nan
+    matriz[8, 10:25] = np.nan                       # ventanas sin valores
+    return matriz
+
+
+@pytest.mark.parametrize("backend", SeriesTiempo.BACKENDS)
+@pytest.mark.parametrize("ventana", [1, 7, 30])
+def test_desviacion_movil_coincide_con_np_std(backend, ventana):
+    matriz = _matriz_con_ausentes()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # ventanas sin valores
+        esperada = np.nanstd(sliding_window_view(matriz, ventana, axis=1), axis=2)
+
+    obtenida = SeriesTiempo(backend).desviacion_movil(matriz, ventana)
+
+    assert obtenida.shape == esperada.shape
+    np.testing.assert_array_equal(np.isnan(obtenida), np.isnan(esperada))
+    np.testing.assert_allclose(obtenida, esperada, rtol=0, atol=1e-9)
+
+
+@pytest.mark.parametrize("backend", SeriesTiempo.BACKENDS)
+@pytest.mark.parametrize("valor", [0.0, 37.25, 99.99, 1e6])
+def test_desviacion_movil_de_ventana_constante_es_cero(backend, valor):
+    matriz = np.full((3, 40), valor)
+    matriz[1, :10] = np.linspace(0, 100, 10)
+    matriz[2, ::3] = np.nan  # los ausentes no cortan la ventana constante
+
+    desviacion = SeriesTiempo(backend).desviacion_movil(matriz, 7)
+
+    assert np.all(desviacion >= 0)
+    assert (desviacion[[0, 2]] == 0).all()
+    assert (desviacion[1, 10:] == 0).all()
+
+
+@pytest.mark.parametrize("operacion, referencia", [
+    ("suma_movil", np.nansum),
+    ("promedio_movil", np.nanmean),
+    ("maximo_movil", np.nanmax),
+    ("minimo_movil", np.nanmin),
+])
+@pytest.mark.parametrize("backend", SeriesTiempo.BACKENDS)
+def test_ventanas_coinciden_con_numpy(operacion, referencia, backend):
+    matriz = _matriz_con_ausentes()[:, :40]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # ventanas sin valores
+        esperada = referencia(sliding_window_view(matriz, 5, axis=1), axis=2)
+
+    obtenida = getattr(SeriesTiempo(backend), operacion)(matriz, 5)
+
+    np.testing.assert_allclose(obtenida, esperada, rtol=1e-12, atol=1e-6)
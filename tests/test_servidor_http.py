@@ -0,0 +1,175 @@
+"""
+Pruebas de las rutas del servidor HTTP local
+"""
+
+import asyncio
+import http.client
+import json
+import threading
+
+import pytest
+
+from analisis_cpu.interface.servidor_http import ServidorHTTP
+
+DATOS = "A;10;;5\nB;20;;\nweb 1;;;7\n"
+
+
+class ServidorEnHilo:
+    """Ejecuta un ServidorHTTP en su propio bucle de eventos para consultarlo"""
+
+    def __init__(self, ruta, **opciones):
+        self.servidor = ServidorHTTP(ruta, puerto=0, **opciones)
+        self.bucle = asyncio.new_event_loop()
+        self.bucle.run_until_complete(self.servidor.iniciar())
+        self.hilo = threading.Thread(target=self.bucle.run_forever, daemon=True)
+        self.hilo.start()
+
+    def consultar(self, ruta, metodo="GET"):
+        """Retorna (código de estado, documento JSON o None si no hay cuerpo)"""
+        conexion = http.client.HTTPConnection("127.0.0.1", self.servidor.puerto, timeout=10)
+        try:
+            conexion.request(metodo, ruta)
+            respuesta = conexion.getresponse()
+            cuerpo = respuesta.read()
+            return respuesta.status, json.loads(cuerpo) if cuerpo else None
+        finally:
+            conexion.close()
+
+    def detener(self):
+        """Cierra el servidor y su bucle de eventos"""
+        asyncio.run_coroutine_threadsafe(self._cerrar(), self.bucle).result(10)
+        self.bucle.call_soon_threadsafe(self.bucle.stop)
+        self.hilo.join(10)
+        self.bucle.close()
+
+    async def _cerrar(self):
+        """Cancela las conexiones que sigan abiertas y cierra el puerto"""
+        conexiones = [tarea for tarea in asyncio.all_tasks() if tarea is not asyncio.current_task()]
+        for tarea in conexiones:
+            tarea.cancel()
+        await asyncio.gather(*conexiones, return_exceptions=True)
+        await self.servidor.detener()
+
+
+@pytest.fixture
+def archivo(tmp_path):
+    ruta = tmp_path / "uso.txt"
+    ruta.write_text(DATOS, encoding='utf-8')
+    return ruta
+
+
+@pytest.fixture
+def servidor(archivo):
+    servidor = ServidorEnHilo(str(archivo))
+    yield servidor
+    servidor.detener()
+
+
+def test_solo_escucha_en_loopback(archivo):
+    with pytest.raises(ValueError):
+        ServidorHTTP(str(archivo), host="0.0.0.0")
+
+
+def test_estado(servidor):
+    estado, documento = servidor.consultar("/estado")
+
+    assert estado == 200
+    assert documento['version'] == 1
+    assert (documento['servidores'], documento['dias']) == (3, 3)
+
+
+def test_servidor(servidor):
+    estado, documento = servidor.consultar("/servidor/A")
+
+    assert estado == 200
+    assert documento['fila'] == 1
+    assert documento['promedio'] == 7.5
+    assert documento['valores'] == [10.0, None, 5.0]
+    assert documento['maximo'] == {'dia': 1, 'uso': 10.0}
+    assert documento['minimo'] == {'dia': 3, 'uso': 5.0}
+
+    estado, documento = servidor.consultar("/servidor/web%201")
+    assert estado == 200 and documento['servidor'] == "web 1"
+    assert servidor.consultar("/servidor/Z")[0] == 404
+
+
+def test_dia_promedia_solo_mediciones_validas(servidor):
+    estado, documento = servidor.consultar("/dia/1")
+
+    assert estado == 200
+    assert documento['carga_total'] == 30.0
+    assert documento['promedio'] == 15.0
+    assert documento['maximo'] == {'servidor': "B", 'uso': 20.0}
+    assert documento['minimo'] == {'servidor': "A", 'uso': 10.0}
+    assert documento['servidores'][2] == {'servidor': "web 1", 'uso': None}
+
+
+def test_dia_sin_mediciones_da_extremos_nulos(servidor):
+    estado, documento = servidor.consultar("/dia/2")
+
+    assert estado == 200
+    assert documento['carga_total'] == 0.0
+    assert documento['promedio'] is None
+    assert documento['maximo'] == {'servidor': None, 'uso': None}
+    assert documento['minimo'] == {'servidor': None, 'uso': None}
+
+
+def test_dia_invalido_o_fuera_de_rango(servidor):
+    assert servidor.consultar("/dia/x")[0] == 400
+    assert servidor.consultar("/dia/0")[0] == 404
+    assert servidor.consultar("/dia/4")[0] == 404
+
+
+def test_rutas_de_analisis_coinciden_con_el_modelo(servidor):
+    centro = servidor.servidor.instantanea.centro
+
+    assert servidor.consultar("/promedios") == (200, centro.obtener_promedios())
+    assert servidor.consultar("/dia-mayor-carga") == (200, centro.obtener_dia_mayor_carga())
+    assert servidor.consultar("/servidor-menor-uso") == (200, centro.obtener_servidor_menor_uso())
+    assert servidor.consultar("/servidor-menor-uso")[1]['servidor'] == "web 1"
+
+
+def test_metodos_y_rutas_desconocidas(servidor):
+    assert servidor.consultar("/otra")[0] == 404
+    assert servidor.consultar("/promedios", "POST")[0] == 405
+    assert servidor.consultar("/recargar")[0] == 405
+    assert servidor.consultar("/estado", "HEAD") == (200, None)
+
+
+def test_recargar_publica_una_instantanea_nueva(servidor, archivo):
+    archivo.write_text(DATOS + "D;1;2;3;4\n", encoding='utf-8')
+
+    estado, documento = servidor.consultar("/recargar", "POST")
+
+    assert estado == 200
+    assert documento['version'] == 2
+    assert (documento['servidores'], documento['dias']) == (4, 4)
+    assert servidor.consultar("/servidor/D")[1]['valores'] == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_recarga_con_demasiados_errores_conserva_los_datos(archivo):
+    servidor = ServidorEnHilo(str(archivo), max_errores=10)
+    try:
+        archivo.write_text("A;x;x;x;x;x;x;x;x;x;x;x;x\n", encoding='utf-8')
+
+        estado, _ = servidor.consultar("/recargar", "POST")
+
+        assert estado == 500
+        assert servidor.consultar("/estado")[1]['version'] == 1
+        assert servidor.consultar("/servidor/A")[1]['valores'] == [10.0, None, 5.0]
+    finally:
+        servidor.detener()
+
+
+def test_se_puede_reiniciar_en_otro_bucle(archivo):
+    # El servidor se construye sin bucle; cada asyncio.run usa uno nuevo
+    servidor = ServidorHTTP(str(archivo), puerto=0)
+
+    async def ciclo():
+        await servidor.iniciar()
+        await asyncio.gather(servidor.recargar(), servidor.recargar())
+        await servidor.detener()
+
+    asyncio.run(ciclo())
+    asyncio.run(ciclo())
+    assert servidor.instantanea.version == 5